@@ -20,6 +20,7 @@
  * Author: Tobin Ehlis <tobin@lunarg.com>
  */
 
+#include <atomic>
 #include <mutex>
 #include <cinttypes>
 #include <stdio.h>
@@ -88,7 +89,7 @@ struct layer_data {
     VkPhysicalDevice physical_device;
 
     uint64_t num_objects[kVulkanObjectTypeMax + 1];
-    uint64_t num_total_objects;
+    std::atomic<uint64_t> num_total_objects;
 
     debug_report_data *report_data;
     std::vector<VkDebugReportCallbackEXT> logging_callback;
@@ -134,10 +135,68 @@ struct layer_data {
 extern std::unordered_map<void *, layer_data *> layer_data_map;
 extern device_table_map ot_device_table_map;
 extern instance_table_map ot_instance_table_map;
-extern std::mutex global_lock;
-extern uint64_t object_track_index;
+
+// Tracked objects are guarded per object type, so that threads creating, destroying and validating objects of
+// different types do not serialize on a single mutex. object_type_locks[type] guards object_map[type] and
+// num_objects[type] of every layer_data; swapchainImageMap is guarded along with the images, queue_info_map along with
+// the queues, queue_family_properties along with the physical devices, and the debug utils labels of report_data along
+// with the queues and command buffers they label, since log_msg reads them when reporting on one. Entry points lock
+// just the types they touch with an ObjectTypeLock. global_lock guards all other state (layer_data_map and the object
+// names of report_data), and also takes every object type lock, so the entry points creating or destroying instances
+// and devices or naming objects have exclusive access to everything while holding it.
+extern std::mutex object_type_locks[kVulkanObjectTypeMax + 1];
+
+static_assert(kVulkanObjectTypeMax < 64, "object type masks must fit in 64 bits");
+static const uint64_t kAllObjectTypes = (1ULL << (kVulkanObjectTypeMax + 1)) - 1;
+
+static inline uint64_t ObjectTypeBit(VulkanObjectType object_type) { return 1ULL << object_type; }
+
+// Object type locks are always taken in ascending type order, and after global_lock, so that no set of threads
+// holding them can deadlock
+static inline void LockObjectTypes(uint64_t type_mask) {
+    for (uint32_t object_type = 0; object_type <= kVulkanObjectTypeMax; object_type++) {
+        if (type_mask & (1ULL << object_type)) object_type_locks[object_type].lock();
+    }
+}
+
+static inline void UnlockObjectTypes(uint64_t type_mask) {
+    for (uint32_t object_type = kVulkanObjectTypeMax + 1; object_type-- > 0;) {
+        if (type_mask & (1ULL << object_type)) object_type_locks[object_type].unlock();
+    }
+}
+
+// Scoped lock of the object types in a mask
+class ObjectTypeLock {
+   public:
+    explicit ObjectTypeLock(uint64_t type_mask) : type_mask_(type_mask) { LockObjectTypes(type_mask_); }
+    ~ObjectTypeLock() { UnlockObjectTypes(type_mask_); }
+    ObjectTypeLock(const ObjectTypeLock &) = delete;
+    ObjectTypeLock &operator=(const ObjectTypeLock &) = delete;
+
+   private:
+    uint64_t type_mask_;
+};
+
+// Type of global_lock, usable with std::lock_guard and std::unique_lock
+class GlobalLock {
+   public:
+    void lock() {
+        mutex_.lock();
+        LockObjectTypes(kAllObjectTypes);
+    }
+    void unlock() {
+        UnlockObjectTypes(kAllObjectTypes);
+        mutex_.unlock();
+    }
+
+   private:
+    std::mutex mutex_;
+};
+
+extern GlobalLock global_lock;
+extern std::atomic<uint64_t> object_track_index;
 extern uint32_t loader_layer_if_version;
-extern const std::unordered_map<std::string, void *> name_to_funcptr_map;
+extern const FunctionPointerTable name_to_funcptr_map;
 
 void DeviceReportUndestroyedObjects(VkDevice device, VulkanObjectType object_type, const std::string &error_code);
 void DeviceDestroyUndestroyedObjects(VkDevice device, VulkanObjectType object_type);
@@ -152,21 +211,11 @@ void ReportUndestroyedObjects(VkDevice device, const std::string &error_code);
 void DestroyUndestroyedObjects(VkDevice device);
 bool ValidateDeviceObject(uint64_t device_handle, const std::string &invalid_handle_code, const std::string &wrong_device_code);
 
-template <typename T1, typename T2>
-bool ValidateObject(T1 dispatchable_object, T2 object, VulkanObjectType object_type, bool null_allowed,
-                    const std::string &invalid_handle_code, const std::string &wrong_device_code) {
-    if (null_allowed && (object == VK_NULL_HANDLE)) {
-        return false;
-    }
-    auto object_handle = HandleToUint64(object);
-
-    if (object_type == kVulkanObjectTypeDevice) {
-        return ValidateDeviceObject(object_handle, invalid_handle_code, wrong_device_code);
-    }
-
+// Validate a non-device object handle against the objects tracked for device_data
+inline bool ValidateObjectHandle(layer_data *device_data, uint64_t object_handle, VulkanObjectType object_type,
+                                 const std::string &invalid_handle_code, const std::string &wrong_device_code) {
     VkDebugReportObjectTypeEXT debug_object_type = get_debug_report_enum[object_type];
 
-    layer_data *device_data = GetLayerDataPtr(get_dispatch_key(dispatchable_object), layer_data_map);
     // Look for object in device object map
     if (device_data->object_map[object_type].find(object_handle) == device_data->object_map[object_type].end()) {
         // If object is an image, also look for it in the swapchain image map
@@ -201,12 +250,46 @@ bool ValidateObject(T1 dispatchable_object, T2 object, VulkanObjectType object_t
 }
 
 template <typename T1, typename T2>
-void CreateObject(T1 dispatchable_object, T2 object, VulkanObjectType object_type, const VkAllocationCallbacks *pAllocator) {
-    layer_data *instance_data = GetLayerDataPtr(get_dispatch_key(dispatchable_object), layer_data_map);
-
+bool ValidateObject(T1 dispatchable_object, T2 object, VulkanObjectType object_type, bool null_allowed,
+                    const std::string &invalid_handle_code, const std::string &wrong_device_code) {
+    if (null_allowed && (object == VK_NULL_HANDLE)) {
+        return false;
+    }
     auto object_handle = HandleToUint64(object);
-    bool custom_allocator = pAllocator != nullptr;
 
+    if (object_type == kVulkanObjectTypeDevice) {
+        return ValidateDeviceObject(object_handle, invalid_handle_code, wrong_device_code);
+    }
+
+    layer_data *device_data = GetLayerDataPtr(get_dispatch_key(dispatchable_object), layer_data_map);
+    return ValidateObjectHandle(device_data, object_handle, object_type, invalid_handle_code, wrong_device_code);
+}
+
+// Validate an array of objects of one type, looking up the layer data once for the whole array
+template <typename T1, typename T2>
+bool ValidateObjects(T1 dispatchable_object, uint32_t object_count, const T2 *objects, VulkanObjectType object_type,
+                     bool null_allowed, const std::string &invalid_handle_code, const std::string &wrong_device_code) {
+    bool skip = false;
+    if (objects == nullptr) {
+        return skip;
+    }
+    layer_data *device_data = GetLayerDataPtr(get_dispatch_key(dispatchable_object), layer_data_map);
+    for (uint32_t index = 0; index < object_count; ++index) {
+        if (null_allowed && (objects[index] == VK_NULL_HANDLE)) {
+            continue;
+        }
+        auto object_handle = HandleToUint64(objects[index]);
+        if (object_type == kVulkanObjectTypeDevice) {
+            skip |= ValidateDeviceObject(object_handle, invalid_handle_code, wrong_device_code);
+        } else {
+            skip |= ValidateObjectHandle(device_data, object_handle, object_type, invalid_handle_code, wrong_device_code);
+        }
+    }
+    return skip;
+}
+
+// Start tracking an object for instance_data, unless it is already tracked
+inline void InsertObject(layer_data *instance_data, uint64_t object_handle, VulkanObjectType object_type, bool custom_allocator) {
     if (!instance_data->object_map[object_type].count(object_handle)) {
         VkDebugReportObjectTypeEXT debug_object_type = get_debug_report_enum[object_type];
         log_msg(instance_data->report_data, VK_DEBUG_REPORT_INFORMATION_BIT_EXT, debug_object_type, object_handle, OBJTRACK_NONE,
@@ -224,6 +307,24 @@ void CreateObject(T1 dispatchable_object, T2 object, VulkanObjectType object_typ
     }
 }
 
+template <typename T1, typename T2>
+void CreateObject(T1 dispatchable_object, T2 object, VulkanObjectType object_type, const VkAllocationCallbacks *pAllocator) {
+    layer_data *instance_data = GetLayerDataPtr(get_dispatch_key(dispatchable_object), layer_data_map);
+    InsertObject(instance_data, HandleToUint64(object), object_type, pAllocator != nullptr);
+}
+
+// Track an array of newly created objects of one type, growing the object map once for the whole array
+template <typename T1, typename T2>
+void CreateObjects(T1 dispatchable_object, uint32_t object_count, const T2 *objects, VulkanObjectType object_type,
+                   const VkAllocationCallbacks *pAllocator) {
+    layer_data *instance_data = GetLayerDataPtr(get_dispatch_key(dispatchable_object), layer_data_map);
+    auto &object_map = instance_data->object_map[object_type];
+    object_map.reserve(object_map.size() + object_count);
+    for (uint32_t index = 0; index < object_count; ++index) {
+        InsertObject(instance_data, HandleToUint64(objects[index]), object_type, pAllocator != nullptr);
+    }
+}
+
 template <typename T1, typename T2>
 void DestroyObjectSilently(T1 dispatchable_object, T2 object, VulkanObjectType object_type) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(dispatchable_object), layer_data_map);
@@ -290,4 +391,17 @@ void DestroyObject(T1 dispatchable_object, T2 object, VulkanObjectType object_ty
     }
 }
 
+template <typename T1, typename T2>
+void DestroyObjects(T1 dispatchable_object, uint32_t object_count, const T2 *objects, VulkanObjectType object_type,
+                    const VkAllocationCallbacks *pAllocator, const std::string &expected_custom_allocator_code,
+                    const std::string &expected_default_allocator_code) {
+    if (objects == nullptr) {
+        return;
+    }
+    for (uint32_t index = 0; index < object_count; ++index) {
+        DestroyObject(dispatchable_object, objects[index], object_type, pAllocator, expected_custom_allocator_code,
+                      expected_default_allocator_code);
+    }
+}
+
 }  // namespace object_tracker
@@ -29,8 +29,9 @@ namespace object_tracker {
 std::unordered_map<void *, layer_data *> layer_data_map;
 device_table_map ot_device_table_map;
 instance_table_map ot_instance_table_map;
-std::mutex global_lock;
-uint64_t object_track_index = 0;
+GlobalLock global_lock;
+std::mutex object_type_locks[kVulkanObjectTypeMax + 1];
+std::atomic<uint64_t> object_track_index(0);
 uint32_t loader_layer_if_version = CURRENT_LOADER_LAYER_INTERFACE_VERSION;
 
 void InitObjectTracker(layer_data *my_data, const VkAllocationCallbacks *pAllocator) {
@@ -77,7 +78,7 @@ void DestroyQueueDataStructures(VkDevice device) {
         log_msg(device_data->report_data, VK_DEBUG_REPORT_INFORMATION_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT,
                 queue->second->handle, OBJTRACK_NONE,
                 "OBJ_STAT Destroy Queue obj 0x%" PRIxLEAST64 " (%" PRIu64 " total objs remain & %" PRIu64 " Queue objs).",
-                queue->second->handle, device_data->num_total_objects, device_data->num_objects[obj_index]);
+                queue->second->handle, device_data->num_total_objects.load(), device_data->num_objects[obj_index]);
         delete queue->second;
         queue = device_data->object_map[kVulkanObjectTypeQueue].erase(queue);
     }
@@ -204,6 +205,11 @@ bool ValidateDescriptorSet(VkDevice device, VkDescriptorPool descriptor_pool, Vk
     return skip;
 }
 
+// Object types validated by ValidateDescriptorWrite()
+static const uint64_t kDescriptorWriteObjectTypes =
+    ObjectTypeBit(kVulkanObjectTypeBuffer) | ObjectTypeBit(kVulkanObjectTypeBufferView) |
+    ObjectTypeBit(kVulkanObjectTypeImageView) | ObjectTypeBit(kVulkanObjectTypeDescriptorSet);
+
 template <typename DispObj>
 static bool ValidateDescriptorWrite(DispObj disp, VkWriteDescriptorSet const *desc, bool isPush) {
     bool skip = false;
@@ -250,7 +256,8 @@ VKAPI_ATTR void VKAPI_CALL CmdPushDescriptorSetKHR(VkCommandBuffer commandBuffer
                                                    const VkWriteDescriptorSet *pDescriptorWrites) {
     bool skip = false;
     {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeCommandBuffer) | ObjectTypeBit(kVulkanObjectTypePipelineLayout) |
+                            kDescriptorWriteObjectTypes);
         skip |=
             ValidateObject(commandBuffer, commandBuffer, kVulkanObjectTypeCommandBuffer, false,
                            "VUID-vkCmdPushDescriptorSetKHR-commandBuffer-parameter", "VUID-vkCmdPushDescriptorSetKHR-commonparent");
@@ -324,7 +331,8 @@ void DeviceDestroyUndestroyedObjects(VkDevice device, VulkanObjectType object_ty
 }
 
 VKAPI_ATTR void VKAPI_CALL DestroyInstance(VkInstance instance, const VkAllocationCallbacks *pAllocator) {
-    std::unique_lock<std::mutex> lock(global_lock);
+    // Destroying the instance empties object maps of every type and removes its layer_data, so it takes every lock
+    std::unique_lock<GlobalLock> lock(global_lock);
 
     dispatch_key key = get_dispatch_key(instance);
     layer_data *instance_data = GetLayerDataPtr(key, layer_data_map);
@@ -417,7 +425,8 @@ VKAPI_ATTR void VKAPI_CALL DestroyInstance(VkInstance instance, const VkAllocati
 }
 
 VKAPI_ATTR void VKAPI_CALL DestroyDevice(VkDevice device, const VkAllocationCallbacks *pAllocator) {
-    std::unique_lock<std::mutex> lock(global_lock);
+    // Destroying the device empties object maps of every type and its queue info, so it takes every lock
+    std::unique_lock<GlobalLock> lock(global_lock);
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
     ValidateObject(device, device, kVulkanObjectTypeDevice, true, "VUID-vkDestroyDevice-device-parameter", kVUIDUndefined);
     DestroyObject(device_data->instance, device, kVulkanObjectTypeDevice, pAllocator, "VUID-vkDestroyDevice-device-00379",
@@ -442,25 +451,27 @@ VKAPI_ATTR void VKAPI_CALL DestroyDevice(VkDevice device, const VkAllocationCall
 }
 
 VKAPI_ATTR void VKAPI_CALL GetDeviceQueue(VkDevice device, uint32_t queueFamilyIndex, uint32_t queueIndex, VkQueue *pQueue) {
-    std::unique_lock<std::mutex> lock(global_lock);
-    ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkGetDeviceQueue-device-parameter", kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice));
+        ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkGetDeviceQueue-device-parameter", kVUIDUndefined);
+    }
 
     get_dispatch_table(ot_device_table_map, device)->GetDeviceQueue(device, queueFamilyIndex, queueIndex, pQueue);
 
-    lock.lock();
+    ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeQueue));
     CreateQueue(device, *pQueue);
     AddQueueInfo(device, queueFamilyIndex, *pQueue);
 }
 
 VKAPI_ATTR void VKAPI_CALL GetDeviceQueue2(VkDevice device, const VkDeviceQueueInfo2 *pQueueInfo, VkQueue *pQueue) {
-    std::unique_lock<std::mutex> lock(global_lock);
-    ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkGetDeviceQueue2-device-parameter", kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice));
+        ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkGetDeviceQueue2-device-parameter", kVUIDUndefined);
+    }
 
     get_dispatch_table(ot_device_table_map, device)->GetDeviceQueue2(device, pQueueInfo, pQueue);
 
-    lock.lock();
+    ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeQueue));
     if (*pQueue != VK_NULL_HANDLE) {
         CreateQueue(device, *pQueue);
         AddQueueInfo(device, pQueueInfo->queueFamilyIndex, *pQueue);
@@ -472,7 +483,8 @@ VKAPI_ATTR void VKAPI_CALL UpdateDescriptorSets(VkDevice device, uint32_t descri
                                                 const VkCopyDescriptorSet *pDescriptorCopies) {
     bool skip = false;
     {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeDescriptorSet) |
+                            kDescriptorWriteObjectTypes);
         skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkUpdateDescriptorSets-device-parameter",
                                kVUIDUndefined);
         if (pDescriptorCopies) {
@@ -504,33 +516,36 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateComputePipelines(VkDevice device, VkPipelin
                                                       const VkComputePipelineCreateInfo *pCreateInfos,
                                                       const VkAllocationCallbacks *pAllocator, VkPipeline *pPipelines) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkCreateComputePipelines-device-parameter",
-                           kVUIDUndefined);
-    if (pCreateInfos) {
-        for (uint32_t idx0 = 0; idx0 < createInfoCount; ++idx0) {
-            if (pCreateInfos[idx0].basePipelineHandle) {
-                skip |=
-                    ValidateObject(device, pCreateInfos[idx0].basePipelineHandle, kVulkanObjectTypePipeline, true,
-                                   "VUID-VkComputePipelineCreateInfo-flags-00697", "VUID-VkComputePipelineCreateInfo-commonparent");
-            }
-            if (pCreateInfos[idx0].layout) {
-                skip |= ValidateObject(device, pCreateInfos[idx0].layout, kVulkanObjectTypePipelineLayout, false,
-                                       "VUID-VkComputePipelineCreateInfo-layout-parameter",
-                                       "VUID-VkComputePipelineCreateInfo-commonparent");
-            }
-            if (pCreateInfos[idx0].stage.module) {
-                skip |= ValidateObject(device, pCreateInfos[idx0].stage.module, kVulkanObjectTypeShaderModule, false,
-                                       "VUID-VkPipelineShaderStageCreateInfo-module-parameter", kVUIDUndefined);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypePipelineCache) |
+                            ObjectTypeBit(kVulkanObjectTypePipeline) | ObjectTypeBit(kVulkanObjectTypePipelineLayout) |
+                            ObjectTypeBit(kVulkanObjectTypeShaderModule));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkCreateComputePipelines-device-parameter",
+                               kVUIDUndefined);
+        if (pCreateInfos) {
+            for (uint32_t idx0 = 0; idx0 < createInfoCount; ++idx0) {
+                if (pCreateInfos[idx0].basePipelineHandle) {
+                    skip |= ValidateObject(device, pCreateInfos[idx0].basePipelineHandle, kVulkanObjectTypePipeline, true,
+                                           "VUID-VkComputePipelineCreateInfo-flags-00697",
+                                           "VUID-VkComputePipelineCreateInfo-commonparent");
+                }
+                if (pCreateInfos[idx0].layout) {
+                    skip |= ValidateObject(device, pCreateInfos[idx0].layout, kVulkanObjectTypePipelineLayout, false,
+                                           "VUID-VkComputePipelineCreateInfo-layout-parameter",
+                                           "VUID-VkComputePipelineCreateInfo-commonparent");
+                }
+                if (pCreateInfos[idx0].stage.module) {
+                    skip |= ValidateObject(device, pCreateInfos[idx0].stage.module, kVulkanObjectTypeShaderModule, false,
+                                           "VUID-VkPipelineShaderStageCreateInfo-module-parameter", kVUIDUndefined);
+                }
             }
         }
+        if (pipelineCache) {
+            skip |= ValidateObject(device, pipelineCache, kVulkanObjectTypePipelineCache, true,
+                                   "VUID-vkCreateComputePipelines-pipelineCache-parameter",
+                                   "VUID-vkCreateComputePipelines-pipelineCache-parent");
+        }
     }
-    if (pipelineCache) {
-        skip |= ValidateObject(device, pipelineCache, kVulkanObjectTypePipelineCache, true,
-                               "VUID-vkCreateComputePipelines-pipelineCache-parameter",
-                               "VUID-vkCreateComputePipelines-pipelineCache-parent");
-    }
-    lock.unlock();
     if (skip) {
         for (uint32_t i = 0; i < createInfoCount; i++) {
             pPipelines[i] = VK_NULL_HANDLE;
@@ -539,41 +554,44 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateComputePipelines(VkDevice device, VkPipelin
     }
     VkResult result = get_dispatch_table(ot_device_table_map, device)
                           ->CreateComputePipelines(device, pipelineCache, createInfoCount, pCreateInfos, pAllocator, pPipelines);
-    lock.lock();
-    for (uint32_t idx1 = 0; idx1 < createInfoCount; ++idx1) {
-        if (pPipelines[idx1] != VK_NULL_HANDLE) {
-            CreateObject(device, pPipelines[idx1], kVulkanObjectTypePipeline, pAllocator);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePipeline));
+        for (uint32_t idx1 = 0; idx1 < createInfoCount; ++idx1) {
+            if (pPipelines[idx1] != VK_NULL_HANDLE) {
+                CreateObject(device, pPipelines[idx1], kVulkanObjectTypePipeline, pAllocator);
+            }
         }
     }
-    lock.unlock();
     return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL ResetDescriptorPool(VkDevice device, VkDescriptorPool descriptorPool,
                                                    VkDescriptorPoolResetFlags flags) {
     bool skip = false;
-    std::unique_lock<std::mutex> lock(global_lock);
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkResetDescriptorPool-device-parameter",
-                           kVUIDUndefined);
-    skip |=
-        ValidateObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, false,
-                       "VUID-vkResetDescriptorPool-descriptorPool-parameter", "VUID-vkResetDescriptorPool-descriptorPool-parent");
-    if (skip) {
-        return VK_ERROR_VALIDATION_FAILED_EXT;
-    }
-    // A DescriptorPool's descriptor sets are implicitly deleted when the pool is reset.
-    // Remove this pool's descriptor sets from our descriptorSet map.
-    auto itr = device_data->object_map[kVulkanObjectTypeDescriptorSet].begin();
-    while (itr != device_data->object_map[kVulkanObjectTypeDescriptorSet].end()) {
-        ObjTrackState *pNode = (*itr).second;
-        auto del_itr = itr++;
-        if (pNode->parent_object == HandleToUint64(descriptorPool)) {
-            DestroyObject(device, (VkDescriptorSet)((*del_itr).first), kVulkanObjectTypeDescriptorSet, nullptr, kVUIDUndefined,
-                          kVUIDUndefined);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeDescriptorPool) |
+                            ObjectTypeBit(kVulkanObjectTypeDescriptorSet));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkResetDescriptorPool-device-parameter",
+                               kVUIDUndefined);
+        skip |= ValidateObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, false,
+                               "VUID-vkResetDescriptorPool-descriptorPool-parameter",
+                               "VUID-vkResetDescriptorPool-descriptorPool-parent");
+        if (skip) {
+            return VK_ERROR_VALIDATION_FAILED_EXT;
+        }
+        // A DescriptorPool's descriptor sets are implicitly deleted when the pool is reset.
+        // Remove this pool's descriptor sets from our descriptorSet map.
+        auto itr = device_data->object_map[kVulkanObjectTypeDescriptorSet].begin();
+        while (itr != device_data->object_map[kVulkanObjectTypeDescriptorSet].end()) {
+            ObjTrackState *pNode = (*itr).second;
+            auto del_itr = itr++;
+            if (pNode->parent_object == HandleToUint64(descriptorPool)) {
+                DestroyObject(device, (VkDescriptorSet)((*del_itr).first), kVulkanObjectTypeDescriptorSet, nullptr,
+                              kVUIDUndefined, kVUIDUndefined);
+            }
         }
     }
-    lock.unlock();
     VkResult result = get_dispatch_table(ot_device_table_map, device)->ResetDescriptorPool(device, descriptorPool, flags);
     return result;
 }
@@ -582,7 +600,8 @@ VKAPI_ATTR VkResult VKAPI_CALL BeginCommandBuffer(VkCommandBuffer command_buffer
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(command_buffer), layer_data_map);
     bool skip = false;
     {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeCommandBuffer) | ObjectTypeBit(kVulkanObjectTypeRenderPass) |
+                            ObjectTypeBit(kVulkanObjectTypeFramebuffer));
         skip |= ValidateObject(command_buffer, command_buffer, kVulkanObjectTypeCommandBuffer, false,
                                "VUID-vkBeginCommandBuffer-commandBuffer-parameter", kVUIDUndefined);
         if (begin_info) {
@@ -639,22 +658,23 @@ VKAPI_ATTR void VKAPI_CALL DebugReportMessageEXT(VkInstance instance, VkDebugRep
 // VK_EXT_debug_utils commands
 VKAPI_ATTR VkResult VKAPI_CALL SetDebugUtilsObjectNameEXT(VkDevice device, const VkDebugUtilsObjectNameInfoEXT *pNameInfo) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, kVUIDUndefined, kVUIDUndefined);
+    }
     if (skip) {
         return VK_ERROR_VALIDATION_FAILED_EXT;
     }
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    if (pNameInfo->pObjectName) {
-        lock.lock();
-        dev_data->report_data->debugUtilsObjectNameMap->insert(
-            std::make_pair<uint64_t, std::string>((uint64_t &&) pNameInfo->objectHandle, pNameInfo->pObjectName));
-        lock.unlock();
-    } else {
-        lock.lock();
-        dev_data->report_data->debugUtilsObjectNameMap->erase(pNameInfo->objectHandle);
-        lock.unlock();
+    {
+        // log_msg looks up object names while reporting on objects of any type, so changing them takes every lock
+        std::lock_guard<GlobalLock> lock(global_lock);
+        if (pNameInfo->pObjectName) {
+            dev_data->report_data->debugUtilsObjectNameMap->insert(
+                std::make_pair<uint64_t, std::string>((uint64_t &&) pNameInfo->objectHandle, pNameInfo->pObjectName));
+        } else {
+            dev_data->report_data->debugUtilsObjectNameMap->erase(pNameInfo->objectHandle);
+        }
     }
     VkResult result = dev_data->dispatch_table.SetDebugUtilsObjectNameEXT(device, pNameInfo);
     return result;
@@ -662,9 +682,10 @@ VKAPI_ATTR VkResult VKAPI_CALL SetDebugUtilsObjectNameEXT(VkDevice device, const
 
 VKAPI_ATTR VkResult VKAPI_CALL SetDebugUtilsObjectTagEXT(VkDevice device, const VkDebugUtilsObjectTagInfoEXT *pTagInfo) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, kVUIDUndefined, kVUIDUndefined);
+    }
     if (skip) {
         return VK_ERROR_VALIDATION_FAILED_EXT;
     }
@@ -675,14 +696,15 @@ VKAPI_ATTR VkResult VKAPI_CALL SetDebugUtilsObjectTagEXT(VkDevice device, const
 
 VKAPI_ATTR void VKAPI_CALL QueueBeginDebugUtilsLabelEXT(VkQueue queue, const VkDebugUtilsLabelEXT *pLabelInfo) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(queue, queue, kVulkanObjectTypeQueue, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(queue), layer_data_map);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeQueue));
+        skip |= ValidateObject(queue, queue, kVulkanObjectTypeQueue, false, kVUIDUndefined, kVUIDUndefined);
+        if (!skip) {
+            BeginQueueDebugUtilsLabel(dev_data->report_data, queue, pLabelInfo);
+        }
+    }
     if (!skip) {
-        lock.lock();
-        BeginQueueDebugUtilsLabel(dev_data->report_data, queue, pLabelInfo);
-        lock.unlock();
         if (dev_data->dispatch_table.QueueBeginDebugUtilsLabelEXT) {
             dev_data->dispatch_table.QueueBeginDebugUtilsLabelEXT(queue, pLabelInfo);
         }
@@ -691,30 +713,32 @@ VKAPI_ATTR void VKAPI_CALL QueueBeginDebugUtilsLabelEXT(VkQueue queue, const VkD
 
 VKAPI_ATTR void VKAPI_CALL QueueEndDebugUtilsLabelEXT(VkQueue queue) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(queue, queue, kVulkanObjectTypeQueue, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(queue), layer_data_map);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeQueue));
+        skip |= ValidateObject(queue, queue, kVulkanObjectTypeQueue, false, kVUIDUndefined, kVUIDUndefined);
+        if (!skip) {
+            EndQueueDebugUtilsLabel(dev_data->report_data, queue);
+        }
+    }
     if (!skip) {
         if (dev_data->dispatch_table.QueueEndDebugUtilsLabelEXT) {
             dev_data->dispatch_table.QueueEndDebugUtilsLabelEXT(queue);
         }
-        lock.lock();
-        EndQueueDebugUtilsLabel(dev_data->report_data, queue);
-        lock.unlock();
     }
 }
 
 VKAPI_ATTR void VKAPI_CALL QueueInsertDebugUtilsLabelEXT(VkQueue queue, const VkDebugUtilsLabelEXT *pLabelInfo) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(queue, queue, kVulkanObjectTypeQueue, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(queue), layer_data_map);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeQueue));
+        skip |= ValidateObject(queue, queue, kVulkanObjectTypeQueue, false, kVUIDUndefined, kVUIDUndefined);
+        if (!skip) {
+            InsertQueueDebugUtilsLabel(dev_data->report_data, queue, pLabelInfo);
+        }
+    }
     if (!skip) {
-        lock.lock();
-        InsertQueueDebugUtilsLabel(dev_data->report_data, queue, pLabelInfo);
-        lock.unlock();
         if (dev_data->dispatch_table.QueueInsertDebugUtilsLabelEXT) {
             dev_data->dispatch_table.QueueInsertDebugUtilsLabelEXT(queue, pLabelInfo);
         }
@@ -723,14 +747,15 @@ VKAPI_ATTR void VKAPI_CALL QueueInsertDebugUtilsLabelEXT(VkQueue queue, const Vk
 
 VKAPI_ATTR void VKAPI_CALL CmdBeginDebugUtilsLabelEXT(VkCommandBuffer commandBuffer, const VkDebugUtilsLabelEXT *pLabelInfo) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(commandBuffer, commandBuffer, kVulkanObjectTypeCommandBuffer, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(commandBuffer), layer_data_map);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeCommandBuffer));
+        skip |= ValidateObject(commandBuffer, commandBuffer, kVulkanObjectTypeCommandBuffer, false, kVUIDUndefined, kVUIDUndefined);
+        if (!skip) {
+            BeginCmdDebugUtilsLabel(dev_data->report_data, commandBuffer, pLabelInfo);
+        }
+    }
     if (!skip) {
-        lock.lock();
-        BeginCmdDebugUtilsLabel(dev_data->report_data, commandBuffer, pLabelInfo);
-        lock.unlock();
         if (dev_data->dispatch_table.CmdBeginDebugUtilsLabelEXT) {
             dev_data->dispatch_table.CmdBeginDebugUtilsLabelEXT(commandBuffer, pLabelInfo);
         }
@@ -739,30 +764,32 @@ VKAPI_ATTR void VKAPI_CALL CmdBeginDebugUtilsLabelEXT(VkCommandBuffer commandBuf
 
 VKAPI_ATTR void VKAPI_CALL CmdEndDebugUtilsLabelEXT(VkCommandBuffer commandBuffer) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(commandBuffer, commandBuffer, kVulkanObjectTypeCommandBuffer, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(commandBuffer), layer_data_map);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeCommandBuffer));
+        skip |= ValidateObject(commandBuffer, commandBuffer, kVulkanObjectTypeCommandBuffer, false, kVUIDUndefined, kVUIDUndefined);
+        if (!skip) {
+            EndCmdDebugUtilsLabel(dev_data->report_data, commandBuffer);
+        }
+    }
     if (!skip) {
         if (dev_data->dispatch_table.CmdEndDebugUtilsLabelEXT) {
             dev_data->dispatch_table.CmdEndDebugUtilsLabelEXT(commandBuffer);
         }
-        lock.lock();
-        EndCmdDebugUtilsLabel(dev_data->report_data, commandBuffer);
-        lock.unlock();
     }
 }
 
 VKAPI_ATTR void VKAPI_CALL CmdInsertDebugUtilsLabelEXT(VkCommandBuffer commandBuffer, const VkDebugUtilsLabelEXT *pLabelInfo) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(commandBuffer, commandBuffer, kVulkanObjectTypeCommandBuffer, false, kVUIDUndefined, kVUIDUndefined);
-    lock.unlock();
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(commandBuffer), layer_data_map);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeCommandBuffer));
+        skip |= ValidateObject(commandBuffer, commandBuffer, kVulkanObjectTypeCommandBuffer, false, kVUIDUndefined, kVUIDUndefined);
+        if (!skip) {
+            InsertCmdDebugUtilsLabel(dev_data->report_data, commandBuffer, pLabelInfo);
+        }
+    }
     if (!skip) {
-        lock.lock();
-        InsertCmdDebugUtilsLabel(dev_data->report_data, commandBuffer, pLabelInfo);
-        lock.unlock();
         if (dev_data->dispatch_table.CmdInsertDebugUtilsLabelEXT) {
             dev_data->dispatch_table.CmdInsertDebugUtilsLabelEXT(commandBuffer, pLabelInfo);
         }
@@ -836,7 +863,8 @@ VKAPI_ATTR VkResult VKAPI_CALL EnumerateDeviceExtensionProperties(VkPhysicalDevi
 
 VKAPI_ATTR VkResult VKAPI_CALL CreateDevice(VkPhysicalDevice physicalDevice, const VkDeviceCreateInfo *pCreateInfo,
                                             const VkAllocationCallbacks *pAllocator, VkDevice *pDevice) {
-    std::lock_guard<std::mutex> lock(global_lock);
+    // Creating the device adds its layer_data to layer_data_map, which lookups of every object type search
+    std::lock_guard<GlobalLock> lock(global_lock);
     bool skip = ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false,
                                "VUID-vkCreateDevice-physicalDevice-parameter", kVUIDUndefined);
     if (skip) return VK_ERROR_VALIDATION_FAILED_EXT;
@@ -878,22 +906,22 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateDevice(VkPhysicalDevice physicalDevice, con
 VKAPI_ATTR VkResult VKAPI_CALL GetSwapchainImagesKHR(VkDevice device, VkSwapchainKHR swapchain, uint32_t *pSwapchainImageCount,
                                                      VkImage *pSwapchainImages) {
     bool skip = false;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkGetSwapchainImagesKHR-device-parameter",
-                           kVUIDUndefined);
-    skip |= ValidateObject(device, swapchain, kVulkanObjectTypeSwapchainKHR, false,
-                           "VUID-vkGetSwapchainImagesKHR-swapchain-parameter", kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeSwapchainKHR));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkGetSwapchainImagesKHR-device-parameter",
+                               kVUIDUndefined);
+        skip |= ValidateObject(device, swapchain, kVulkanObjectTypeSwapchainKHR, false,
+                               "VUID-vkGetSwapchainImagesKHR-swapchain-parameter", kVUIDUndefined);
+    }
     if (skip) return VK_ERROR_VALIDATION_FAILED_EXT;
 
     VkResult result = get_dispatch_table(ot_device_table_map, device)
                           ->GetSwapchainImagesKHR(device, swapchain, pSwapchainImageCount, pSwapchainImages);
     if (pSwapchainImages != NULL) {
-        lock.lock();
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeImage));
         for (uint32_t i = 0; i < *pSwapchainImageCount; i++) {
             CreateSwapchainImageObject(device, pSwapchainImages[i], swapchain);
         }
-        lock.unlock();
     }
     return result;
 }
@@ -903,7 +931,7 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateDescriptorSetLayout(VkDevice device, const
                                                          VkDescriptorSetLayout *pSetLayout) {
     bool skip = false;
     {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeSampler));
         skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkCreateDescriptorSetLayout-device-parameter",
                                kVUIDUndefined);
         if (pCreateInfo) {
@@ -927,7 +955,7 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateDescriptorSetLayout(VkDevice device, const
     VkResult result =
         get_dispatch_table(ot_device_table_map, device)->CreateDescriptorSetLayout(device, pCreateInfo, pAllocator, pSetLayout);
     if (VK_SUCCESS == result) {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDescriptorSetLayout));
         CreateObject(device, *pSetLayout, kVulkanObjectTypeDescriptorSetLayout, pAllocator);
     }
     return result;
@@ -938,7 +966,7 @@ VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties(VkPhysicalDevi
                                                                   VkQueueFamilyProperties *pQueueFamilyProperties) {
     bool skip = false;
     {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
         skip |= ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false,
                                "VUID-vkGetPhysicalDeviceQueueFamilyProperties-physicalDevice-parameter", kVUIDUndefined);
     }
@@ -947,7 +975,7 @@ VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties(VkPhysicalDevi
     }
     get_dispatch_table(ot_instance_table_map, physicalDevice)
         ->GetPhysicalDeviceQueueFamilyProperties(physicalDevice, pQueueFamilyPropertyCount, pQueueFamilyProperties);
-    std::lock_guard<std::mutex> lock(global_lock);
+    ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
     if (pQueueFamilyProperties != NULL) {
         layer_data *instance_data = GetLayerDataPtr(get_dispatch_key(physicalDevice), layer_data_map);
         if (instance_data->queue_family_properties.size() < *pQueueFamilyPropertyCount) {
@@ -1003,36 +1031,37 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateInstance(const VkInstanceCreateInfo *pCreat
 VKAPI_ATTR VkResult VKAPI_CALL EnumeratePhysicalDevices(VkInstance instance, uint32_t *pPhysicalDeviceCount,
                                                         VkPhysicalDevice *pPhysicalDevices) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(instance, instance, kVulkanObjectTypeInstance, false,
-                           "VUID-vkEnumeratePhysicalDevices-instance-parameter", kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeInstance));
+        skip |= ValidateObject(instance, instance, kVulkanObjectTypeInstance, false,
+                               "VUID-vkEnumeratePhysicalDevices-instance-parameter", kVUIDUndefined);
+    }
     if (skip) {
         return VK_ERROR_VALIDATION_FAILED_EXT;
     }
     VkResult result = get_dispatch_table(ot_instance_table_map, instance)
                           ->EnumeratePhysicalDevices(instance, pPhysicalDeviceCount, pPhysicalDevices);
-    lock.lock();
     if (result == VK_SUCCESS) {
         if (pPhysicalDevices) {
+            ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
             for (uint32_t i = 0; i < *pPhysicalDeviceCount; i++) {
                 CreateObject(instance, pPhysicalDevices[i], kVulkanObjectTypePhysicalDevice, nullptr);
             }
         }
     }
-    lock.unlock();
     return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL AllocateCommandBuffers(VkDevice device, const VkCommandBufferAllocateInfo *pAllocateInfo,
                                                       VkCommandBuffer *pCommandBuffers) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkAllocateCommandBuffers-device-parameter",
-                           kVUIDUndefined);
-    skip |= ValidateObject(device, pAllocateInfo->commandPool, kVulkanObjectTypeCommandPool, false,
-                           "VUID-VkCommandBufferAllocateInfo-commandPool-parameter", kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeCommandPool));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkAllocateCommandBuffers-device-parameter",
+                               kVUIDUndefined);
+        skip |= ValidateObject(device, pAllocateInfo->commandPool, kVulkanObjectTypeCommandPool, false,
+                               "VUID-VkCommandBufferAllocateInfo-commandPool-parameter", kVUIDUndefined);
+    }
 
     if (skip) {
         return VK_ERROR_VALIDATION_FAILED_EXT;
@@ -1041,11 +1070,12 @@ VKAPI_ATTR VkResult VKAPI_CALL AllocateCommandBuffers(VkDevice device, const VkC
     VkResult result =
         get_dispatch_table(ot_device_table_map, device)->AllocateCommandBuffers(device, pAllocateInfo, pCommandBuffers);
 
-    lock.lock();
-    for (uint32_t i = 0; i < pAllocateInfo->commandBufferCount; i++) {
-        AllocateCommandBuffer(device, pAllocateInfo->commandPool, pCommandBuffers[i], pAllocateInfo->level);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeCommandBuffer));
+        for (uint32_t i = 0; i < pAllocateInfo->commandBufferCount; i++) {
+            AllocateCommandBuffer(device, pAllocateInfo->commandPool, pCommandBuffers[i], pAllocateInfo->level);
+        }
     }
-    lock.unlock();
 
     return result;
 }
@@ -1053,18 +1083,20 @@ VKAPI_ATTR VkResult VKAPI_CALL AllocateCommandBuffers(VkDevice device, const VkC
 VKAPI_ATTR VkResult VKAPI_CALL AllocateDescriptorSets(VkDevice device, const VkDescriptorSetAllocateInfo *pAllocateInfo,
                                                       VkDescriptorSet *pDescriptorSets) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkAllocateDescriptorSets-device-parameter",
-                           kVUIDUndefined);
-    skip |= ValidateObject(device, pAllocateInfo->descriptorPool, kVulkanObjectTypeDescriptorPool, false,
-                           "VUID-VkDescriptorSetAllocateInfo-descriptorPool-parameter",
-                           "VUID-VkDescriptorSetAllocateInfo-commonparent");
-    for (uint32_t i = 0; i < pAllocateInfo->descriptorSetCount; i++) {
-        skip |= ValidateObject(device, pAllocateInfo->pSetLayouts[i], kVulkanObjectTypeDescriptorSetLayout, false,
-                               "VUID-VkDescriptorSetAllocateInfo-pSetLayouts-parameter",
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeDescriptorPool) |
+                            ObjectTypeBit(kVulkanObjectTypeDescriptorSetLayout));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkAllocateDescriptorSets-device-parameter",
+                               kVUIDUndefined);
+        skip |= ValidateObject(device, pAllocateInfo->descriptorPool, kVulkanObjectTypeDescriptorPool, false,
+                               "VUID-VkDescriptorSetAllocateInfo-descriptorPool-parameter",
                                "VUID-VkDescriptorSetAllocateInfo-commonparent");
+        for (uint32_t i = 0; i < pAllocateInfo->descriptorSetCount; i++) {
+            skip |= ValidateObject(device, pAllocateInfo->pSetLayouts[i], kVulkanObjectTypeDescriptorSetLayout, false,
+                                   "VUID-VkDescriptorSetAllocateInfo-pSetLayouts-parameter",
+                                   "VUID-VkDescriptorSetAllocateInfo-commonparent");
+        }
     }
-    lock.unlock();
     if (skip) {
         return VK_ERROR_VALIDATION_FAILED_EXT;
     }
@@ -1073,11 +1105,10 @@ VKAPI_ATTR VkResult VKAPI_CALL AllocateDescriptorSets(VkDevice device, const VkD
         get_dispatch_table(ot_device_table_map, device)->AllocateDescriptorSets(device, pAllocateInfo, pDescriptorSets);
 
     if (VK_SUCCESS == result) {
-        lock.lock();
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDescriptorSet));
         for (uint32_t i = 0; i < pAllocateInfo->descriptorSetCount; i++) {
             AllocateDescriptorSet(device, pAllocateInfo->descriptorPool, pDescriptorSets[i]);
         }
-        lock.unlock();
     }
 
     return result;
@@ -1086,21 +1117,23 @@ VKAPI_ATTR VkResult VKAPI_CALL AllocateDescriptorSets(VkDevice device, const VkD
 VKAPI_ATTR void VKAPI_CALL FreeCommandBuffers(VkDevice device, VkCommandPool commandPool, uint32_t commandBufferCount,
                                               const VkCommandBuffer *pCommandBuffers) {
     bool skip = false;
-    std::unique_lock<std::mutex> lock(global_lock);
-    ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkFreeCommandBuffers-device-parameter", kVUIDUndefined);
-    ValidateObject(device, commandPool, kVulkanObjectTypeCommandPool, false, "VUID-vkFreeCommandBuffers-commandPool-parameter",
-                   "VUID-vkFreeCommandBuffers-commandPool-parent");
-    for (uint32_t i = 0; i < commandBufferCount; i++) {
-        if (pCommandBuffers[i] != VK_NULL_HANDLE) {
-            skip |= ValidateCommandBuffer(device, commandPool, pCommandBuffers[i]);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeCommandPool) |
+                            ObjectTypeBit(kVulkanObjectTypeCommandBuffer));
+        ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkFreeCommandBuffers-device-parameter",
+                       kVUIDUndefined);
+        ValidateObject(device, commandPool, kVulkanObjectTypeCommandPool, false, "VUID-vkFreeCommandBuffers-commandPool-parameter",
+                       "VUID-vkFreeCommandBuffers-commandPool-parent");
+        for (uint32_t i = 0; i < commandBufferCount; i++) {
+            if (pCommandBuffers[i] != VK_NULL_HANDLE) {
+                skip |= ValidateCommandBuffer(device, commandPool, pCommandBuffers[i]);
+            }
         }
-    }
 
-    for (uint32_t i = 0; i < commandBufferCount; i++) {
-        DestroyObject(device, pCommandBuffers[i], kVulkanObjectTypeCommandBuffer, nullptr, kVUIDUndefined, kVUIDUndefined);
+        for (uint32_t i = 0; i < commandBufferCount; i++) {
+            DestroyObject(device, pCommandBuffers[i], kVulkanObjectTypeCommandBuffer, nullptr, kVUIDUndefined, kVUIDUndefined);
+        }
     }
-
-    lock.unlock();
     if (!skip) {
         get_dispatch_table(ot_device_table_map, device)
             ->FreeCommandBuffers(device, commandPool, commandBufferCount, pCommandBuffers);
@@ -1109,23 +1142,24 @@ VKAPI_ATTR void VKAPI_CALL FreeCommandBuffers(VkDevice device, VkCommandPool com
 
 VKAPI_ATTR void VKAPI_CALL DestroySwapchainKHR(VkDevice device, VkSwapchainKHR swapchain, const VkAllocationCallbacks *pAllocator) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    std::unique_lock<std::mutex> lock(global_lock);
-    // A swapchain's images are implicitly deleted when the swapchain is deleted.
-    // Remove this swapchain's images from our map of such images.
-    std::unordered_map<uint64_t, ObjTrackState *>::iterator itr = device_data->swapchainImageMap.begin();
-    while (itr != device_data->swapchainImageMap.end()) {
-        ObjTrackState *pNode = (*itr).second;
-        if (pNode->parent_object == HandleToUint64(swapchain)) {
-            delete pNode;
-            auto delete_item = itr++;
-            device_data->swapchainImageMap.erase(delete_item);
-        } else {
-            ++itr;
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeImage) | ObjectTypeBit(kVulkanObjectTypeSwapchainKHR));
+        // A swapchain's images are implicitly deleted when the swapchain is deleted.
+        // Remove this swapchain's images from our map of such images.
+        std::unordered_map<uint64_t, ObjTrackState *>::iterator itr = device_data->swapchainImageMap.begin();
+        while (itr != device_data->swapchainImageMap.end()) {
+            ObjTrackState *pNode = (*itr).second;
+            if (pNode->parent_object == HandleToUint64(swapchain)) {
+                delete pNode;
+                auto delete_item = itr++;
+                device_data->swapchainImageMap.erase(delete_item);
+            } else {
+                ++itr;
+            }
         }
+        DestroyObject(device, swapchain, kVulkanObjectTypeSwapchainKHR, pAllocator, "VUID-vkDestroySwapchainKHR-swapchain-01283",
+                      "VUID-vkDestroySwapchainKHR-swapchain-01284");
     }
-    DestroyObject(device, swapchain, kVulkanObjectTypeSwapchainKHR, pAllocator, "VUID-vkDestroySwapchainKHR-swapchain-01283",
-                  "VUID-vkDestroySwapchainKHR-swapchain-01284");
-    lock.unlock();
 
     get_dispatch_table(ot_device_table_map, device)->DestroySwapchainKHR(device, swapchain, pAllocator);
 }
@@ -1134,22 +1168,24 @@ VKAPI_ATTR VkResult VKAPI_CALL FreeDescriptorSets(VkDevice device, VkDescriptorP
                                                   const VkDescriptorSet *pDescriptorSets) {
     bool skip = false;
     VkResult result = VK_ERROR_VALIDATION_FAILED_EXT;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkFreeDescriptorSets-device-parameter",
-                           kVUIDUndefined);
-    skip |= ValidateObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, false,
-                           "VUID-vkFreeDescriptorSets-descriptorPool-parameter", "VUID-vkFreeDescriptorSets-descriptorPool-parent");
-    for (uint32_t i = 0; i < descriptorSetCount; i++) {
-        if (pDescriptorSets[i] != VK_NULL_HANDLE) {
-            skip |= ValidateDescriptorSet(device, descriptorPool, pDescriptorSets[i]);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeDescriptorPool) |
+                            ObjectTypeBit(kVulkanObjectTypeDescriptorSet));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkFreeDescriptorSets-device-parameter",
+                               kVUIDUndefined);
+        skip |= ValidateObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, false,
+                               "VUID-vkFreeDescriptorSets-descriptorPool-parameter",
+                               "VUID-vkFreeDescriptorSets-descriptorPool-parent");
+        for (uint32_t i = 0; i < descriptorSetCount; i++) {
+            if (pDescriptorSets[i] != VK_NULL_HANDLE) {
+                skip |= ValidateDescriptorSet(device, descriptorPool, pDescriptorSets[i]);
+            }
         }
-    }
 
-    for (uint32_t i = 0; i < descriptorSetCount; i++) {
-        DestroyObject(device, pDescriptorSets[i], kVulkanObjectTypeDescriptorSet, nullptr, kVUIDUndefined, kVUIDUndefined);
+        for (uint32_t i = 0; i < descriptorSetCount; i++) {
+            DestroyObject(device, pDescriptorSets[i], kVulkanObjectTypeDescriptorSet, nullptr, kVUIDUndefined, kVUIDUndefined);
+        }
     }
-
-    lock.unlock();
     if (!skip) {
         result = get_dispatch_table(ot_device_table_map, device)
                      ->FreeDescriptorSets(device, descriptorPool, descriptorSetCount, pDescriptorSets);
@@ -1161,63 +1197,68 @@ VKAPI_ATTR void VKAPI_CALL DestroyDescriptorPool(VkDevice device, VkDescriptorPo
                                                  const VkAllocationCallbacks *pAllocator) {
     bool skip = VK_FALSE;
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkDestroyDescriptorPool-device-parameter",
-                           kVUIDUndefined);
-    skip |= ValidateObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, true,
-                           "VUID-vkDestroyDescriptorPool-descriptorPool-parameter",
-                           "VUID-vkDestroyDescriptorPool-descriptorPool-parent");
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeDescriptorPool));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkDestroyDescriptorPool-device-parameter",
+                               kVUIDUndefined);
+        skip |= ValidateObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, true,
+                               "VUID-vkDestroyDescriptorPool-descriptorPool-parameter",
+                               "VUID-vkDestroyDescriptorPool-descriptorPool-parent");
+    }
     if (skip) {
         return;
     }
-    // A DescriptorPool's descriptor sets are implicitly deleted when the pool is deleted.
-    // Remove this pool's descriptor sets from our descriptorSet map.
-    lock.lock();
-    std::unordered_map<uint64_t, ObjTrackState *>::iterator itr = device_data->object_map[kVulkanObjectTypeDescriptorSet].begin();
-    while (itr != device_data->object_map[kVulkanObjectTypeDescriptorSet].end()) {
-        ObjTrackState *pNode = (*itr).second;
-        auto del_itr = itr++;
-        if (pNode->parent_object == HandleToUint64(descriptorPool)) {
-            DestroyObject(device, (VkDescriptorSet)((*del_itr).first), kVulkanObjectTypeDescriptorSet, nullptr, kVUIDUndefined,
-                          kVUIDUndefined);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDescriptorPool) | ObjectTypeBit(kVulkanObjectTypeDescriptorSet));
+        // A DescriptorPool's descriptor sets are implicitly deleted when the pool is deleted.
+        // Remove this pool's descriptor sets from our descriptorSet map.
+        std::unordered_map<uint64_t, ObjTrackState *>::iterator itr =
+            device_data->object_map[kVulkanObjectTypeDescriptorSet].begin();
+        while (itr != device_data->object_map[kVulkanObjectTypeDescriptorSet].end()) {
+            ObjTrackState *pNode = (*itr).second;
+            auto del_itr = itr++;
+            if (pNode->parent_object == HandleToUint64(descriptorPool)) {
+                DestroyObject(device, (VkDescriptorSet)((*del_itr).first), kVulkanObjectTypeDescriptorSet, nullptr,
+                              kVUIDUndefined, kVUIDUndefined);
+            }
         }
+        DestroyObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, pAllocator,
+                      "VUID-vkDestroyDescriptorPool-descriptorPool-00304", "VUID-vkDestroyDescriptorPool-descriptorPool-00305");
     }
-    DestroyObject(device, descriptorPool, kVulkanObjectTypeDescriptorPool, pAllocator,
-                  "VUID-vkDestroyDescriptorPool-descriptorPool-00304", "VUID-vkDestroyDescriptorPool-descriptorPool-00305");
-    lock.unlock();
     get_dispatch_table(ot_device_table_map, device)->DestroyDescriptorPool(device, descriptorPool, pAllocator);
 }
 
 VKAPI_ATTR void VKAPI_CALL DestroyCommandPool(VkDevice device, VkCommandPool commandPool, const VkAllocationCallbacks *pAllocator) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
     bool skip = false;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkDestroyCommandPool-device-parameter",
-                           kVUIDUndefined);
-    skip |= ValidateObject(device, commandPool, kVulkanObjectTypeCommandPool, true,
-                           "VUID-vkDestroyCommandPool-commandPool-parameter", "VUID-vkDestroyCommandPool-commandPool-parent");
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDevice) | ObjectTypeBit(kVulkanObjectTypeCommandPool));
+        skip |= ValidateObject(device, device, kVulkanObjectTypeDevice, false, "VUID-vkDestroyCommandPool-device-parameter",
+                               kVUIDUndefined);
+        skip |= ValidateObject(device, commandPool, kVulkanObjectTypeCommandPool, true,
+                               "VUID-vkDestroyCommandPool-commandPool-parameter", "VUID-vkDestroyCommandPool-commandPool-parent");
+    }
     if (skip) {
         return;
     }
-    lock.lock();
-    // A CommandPool's command buffers are implicitly deleted when the pool is deleted.
-    // Remove this pool's cmdBuffers from our cmd buffer map.
-    auto itr = device_data->object_map[kVulkanObjectTypeCommandBuffer].begin();
-    auto del_itr = itr;
-    while (itr != device_data->object_map[kVulkanObjectTypeCommandBuffer].end()) {
-        ObjTrackState *pNode = (*itr).second;
-        del_itr = itr++;
-        if (pNode->parent_object == HandleToUint64(commandPool)) {
-            skip |= ValidateCommandBuffer(device, commandPool, reinterpret_cast<VkCommandBuffer>((*del_itr).first));
-            DestroyObject(device, reinterpret_cast<VkCommandBuffer>((*del_itr).first), kVulkanObjectTypeCommandBuffer, nullptr,
-                          kVUIDUndefined, kVUIDUndefined);
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeCommandPool) | ObjectTypeBit(kVulkanObjectTypeCommandBuffer));
+        // A CommandPool's command buffers are implicitly deleted when the pool is deleted.
+        // Remove this pool's cmdBuffers from our cmd buffer map.
+        auto itr = device_data->object_map[kVulkanObjectTypeCommandBuffer].begin();
+        auto del_itr = itr;
+        while (itr != device_data->object_map[kVulkanObjectTypeCommandBuffer].end()) {
+            ObjTrackState *pNode = (*itr).second;
+            del_itr = itr++;
+            if (pNode->parent_object == HandleToUint64(commandPool)) {
+                skip |= ValidateCommandBuffer(device, commandPool, reinterpret_cast<VkCommandBuffer>((*del_itr).first));
+                DestroyObject(device, reinterpret_cast<VkCommandBuffer>((*del_itr).first), kVulkanObjectTypeCommandBuffer,
+                              nullptr, kVUIDUndefined, kVUIDUndefined);
+            }
         }
+        DestroyObject(device, commandPool, kVulkanObjectTypeCommandPool, pAllocator,
+                      "VUID-vkDestroyCommandPool-commandPool-00042", "VUID-vkDestroyCommandPool-commandPool-00043");
     }
-    DestroyObject(device, commandPool, kVulkanObjectTypeCommandPool, pAllocator, "VUID-vkDestroyCommandPool-commandPool-00042",
-                  "VUID-vkDestroyCommandPool-commandPool-00043");
-    lock.unlock();
     get_dispatch_table(ot_device_table_map, device)->DestroyCommandPool(device, commandPool, pAllocator);
 }
 
@@ -1227,7 +1268,7 @@ VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties2(VkPhysicalDev
                                                                    VkQueueFamilyProperties2KHR *pQueueFamilyProperties) {
     bool skip = false;
     {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
         skip |=
             ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false, kVUIDUndefined, kVUIDUndefined);
     }
@@ -1236,7 +1277,7 @@ VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties2(VkPhysicalDev
     }
     get_dispatch_table(ot_instance_table_map, physicalDevice)
         ->GetPhysicalDeviceQueueFamilyProperties2(physicalDevice, pQueueFamilyPropertyCount, pQueueFamilyProperties);
-    std::lock_guard<std::mutex> lock(global_lock);
+    ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
     if (pQueueFamilyProperties != NULL) {
         layer_data *instance_data = GetLayerDataPtr(get_dispatch_key(physicalDevice), layer_data_map);
         if (instance_data->queue_family_properties.size() < *pQueueFamilyPropertyCount) {
@@ -1254,7 +1295,7 @@ VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties2KHR(VkPhysical
                                                                       VkQueueFamilyProperties2KHR *pQueueFamilyProperties) {
     bool skip = false;
     {
-        std::lock_guard<std::mutex> lock(global_lock);
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
         skip |=
             ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false, kVUIDUndefined, kVUIDUndefined);
     }
@@ -1263,7 +1304,7 @@ VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties2KHR(VkPhysical
     }
     get_dispatch_table(ot_instance_table_map, physicalDevice)
         ->GetPhysicalDeviceQueueFamilyProperties2KHR(physicalDevice, pQueueFamilyPropertyCount, pQueueFamilyProperties);
-    std::lock_guard<std::mutex> lock(global_lock);
+    ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
     if (pQueueFamilyProperties != NULL) {
         layer_data *instance_data = GetLayerDataPtr(get_dispatch_key(physicalDevice), layer_data_map);
         if (instance_data->queue_family_properties.size() < *pQueueFamilyPropertyCount) {
@@ -1278,10 +1319,11 @@ VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties2KHR(VkPhysical
 VKAPI_ATTR VkResult VKAPI_CALL GetPhysicalDeviceDisplayPropertiesKHR(VkPhysicalDevice physicalDevice, uint32_t *pPropertyCount,
                                                                      VkDisplayPropertiesKHR *pProperties) {
     bool skip = false;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false,
-                           "VUID-vkGetPhysicalDeviceDisplayPropertiesKHR-physicalDevice-parameter", kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice));
+        skip |= ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false,
+                               "VUID-vkGetPhysicalDeviceDisplayPropertiesKHR-physicalDevice-parameter", kVUIDUndefined);
+    }
 
     if (skip) {
         return VK_ERROR_VALIDATION_FAILED_EXT;
@@ -1289,15 +1331,14 @@ VKAPI_ATTR VkResult VKAPI_CALL GetPhysicalDeviceDisplayPropertiesKHR(VkPhysicalD
     VkResult result = get_dispatch_table(ot_instance_table_map, physicalDevice)
                           ->GetPhysicalDeviceDisplayPropertiesKHR(physicalDevice, pPropertyCount, pProperties);
 
-    lock.lock();
     if (result == VK_SUCCESS) {
         if (pProperties) {
+            ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDisplayKHR));
             for (uint32_t i = 0; i < *pPropertyCount; ++i) {
                 CreateObject(physicalDevice, pProperties[i].display, kVulkanObjectTypeDisplayKHR, nullptr);
             }
         }
     }
-    lock.unlock();
 
     return result;
 }
@@ -1305,12 +1346,13 @@ VKAPI_ATTR VkResult VKAPI_CALL GetPhysicalDeviceDisplayPropertiesKHR(VkPhysicalD
 VKAPI_ATTR VkResult VKAPI_CALL GetDisplayModePropertiesKHR(VkPhysicalDevice physicalDevice, VkDisplayKHR display,
                                                            uint32_t *pPropertyCount, VkDisplayModePropertiesKHR *pProperties) {
     bool skip = false;
-    std::unique_lock<std::mutex> lock(global_lock);
-    skip |= ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false,
-                           "VUID-vkGetDisplayModePropertiesKHR-physicalDevice-parameter", kVUIDUndefined);
-    skip |= ValidateObject(physicalDevice, display, kVulkanObjectTypeDisplayKHR, false,
-                           "VUID-vkGetDisplayModePropertiesKHR-display-parameter", kVUIDUndefined);
-    lock.unlock();
+    {
+        ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypePhysicalDevice) | ObjectTypeBit(kVulkanObjectTypeDisplayKHR));
+        skip |= ValidateObject(physicalDevice, physicalDevice, kVulkanObjectTypePhysicalDevice, false,
+                               "VUID-vkGetDisplayModePropertiesKHR-physicalDevice-parameter", kVUIDUndefined);
+        skip |= ValidateObject(physicalDevice, display, kVulkanObjectTypeDisplayKHR, false,
+                               "VUID-vkGetDisplayModePropertiesKHR-display-parameter", kVUIDUndefined);
+    }
 
     if (skip) {
         return VK_ERROR_VALIDATION_FAILED_EXT;
@@ -1318,22 +1360,22 @@ VKAPI_ATTR VkResult VKAPI_CALL GetDisplayModePropertiesKHR(VkPhysicalDevice phys
     VkResult result = get_dispatch_table(ot_instance_table_map, physicalDevice)
                           ->GetDisplayModePropertiesKHR(physicalDevice, display, pPropertyCount, pProperties);
 
-    lock.lock();
     if (result == VK_SUCCESS) {
         if (pProperties) {
+            ObjectTypeLock lock(ObjectTypeBit(kVulkanObjectTypeDisplayModeKHR));
             for (uint32_t i = 0; i < *pPropertyCount; ++i) {
                 CreateObject(physicalDevice, pProperties[i].displayMode, kVulkanObjectTypeDisplayModeKHR, nullptr);
             }
         }
     }
-    lock.unlock();
 
     return result;
 }
 
 VKAPI_ATTR VkResult VKAPI_CALL DebugMarkerSetObjectNameEXT(VkDevice device, const VkDebugMarkerObjectNameInfoEXT *pNameInfo) {
     bool skip = VK_FALSE;
-    std::unique_lock<std::mutex> lock(global_lock);
+    // log_msg looks up object names while reporting on objects of any type, so changing them takes every lock
+    std::unique_lock<GlobalLock> lock(global_lock);
     layer_data *dev_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
     if (pNameInfo->pObjectName) {
         dev_data->report_data->debugObjectNameMap->insert(
@@ -1361,9 +1403,9 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetPhysicalDeviceProcAddr(VkInstance in
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, const char *funcName) {
-    const auto item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second);
+    void *funcptr = name_to_funcptr_map.find(funcName);
+    if (funcptr != nullptr) {
+        return reinterpret_cast<PFN_vkVoidFunction>(funcptr);
     }
 
     auto table = get_dispatch_table(ot_device_table_map, device);
@@ -1372,9 +1414,9 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance, const char *funcName) {
-    const auto item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second);
+    void *funcptr = name_to_funcptr_map.find(funcName);
+    if (funcptr != nullptr) {
+        return reinterpret_cast<PFN_vkVoidFunction>(funcptr);
     }
 
     auto table = get_dispatch_table(ot_instance_table_map, instance);
@@ -33,6 +33,7 @@
 #include "vulkan/vulkan.h"
 #include "vk_enum_string_helper.h"
 #include "vk_layer_logging.h"
+#include "vk_layer_utils.h"
 #include "vk_validation_error_messages.h"
 #include "vk_extension_helper.h"
 
@@ -41,7 +42,7 @@
 namespace parameter_validation {
 
 extern const uint32_t GeneratedHeaderVersion;
-extern const std::unordered_map<std::string, void *> name_to_funcptr_map;
+extern const FunctionPointerTable name_to_funcptr_map;
 
 extern const VkQueryPipelineStatisticFlags AllVkQueryPipelineStatisticFlagBits;
 extern const VkColorComponentFlags AllVkColorComponentFlagBits;
@@ -49,13 +50,28 @@ extern const VkShaderStageFlags AllVkShaderStageFlagBits;
 extern const VkQueryControlFlags AllVkQueryControlFlagBits;
 extern const VkImageUsageFlags AllVkImageUsageFlagBits;
 
-extern const std::vector<VkCompareOp> AllVkCompareOpEnums;
-extern const std::vector<VkStencilOp> AllVkStencilOpEnums;
-extern const std::vector<VkBlendFactor> AllVkBlendFactorEnums;
-extern const std::vector<VkBlendOp> AllVkBlendOpEnums;
-extern const std::vector<VkLogicOp> AllVkLogicOpEnums;
-extern const std::vector<VkBorderColor> AllVkBorderColorEnums;
-extern const std::vector<VkImageLayout> AllVkImageLayoutEnums;
+// Generated table of the valid values of an enumerated type. Values in [dense_begin, dense_end) are checked as a range and
+// the remaining values, sorted, with a binary search, so the tables need no construction at load time.
+template <typename T>
+struct RangedEnumValues {
+    int32_t dense_begin;
+    int32_t dense_end;
+    const T *sparse_values;
+    size_t sparse_count;
+
+    bool contains(T value) const {
+        if (static_cast<int32_t>(value) >= dense_begin && static_cast<int32_t>(value) < dense_end) return true;
+        return std::binary_search(sparse_values, sparse_values + sparse_count, value);
+    }
+};
+
+extern const RangedEnumValues<VkCompareOp> AllVkCompareOpEnums;
+extern const RangedEnumValues<VkStencilOp> AllVkStencilOpEnums;
+extern const RangedEnumValues<VkBlendFactor> AllVkBlendFactorEnums;
+extern const RangedEnumValues<VkBlendOp> AllVkBlendOpEnums;
+extern const RangedEnumValues<VkLogicOp> AllVkLogicOpEnums;
+extern const RangedEnumValues<VkBorderColor> AllVkBorderColorEnums;
+extern const RangedEnumValues<VkImageLayout> AllVkImageLayoutEnums;
 
 struct instance_layer_data {
     VkInstance instance = VK_NULL_HANDLE;
@@ -674,16 +690,16 @@ static bool validate_bool32(debug_report_data *report_data, const char *apiName,
  * @param apiName Name of API call being validated.
  * @param parameterName Name of parameter being validated.
  * @param enumName Name of the enumeration being validated.
- * @param valid_values The list of valid values for the enumeration.
+ * @param valid_values The table of valid values for the enumeration.
  * @param value Enumeration value to validate.
  * @return Boolean value indicating that the call should be skipped.
  */
 template <typename T>
 bool validate_ranged_enum(debug_report_data *report_data, const char *apiName, const ParameterName &parameterName,
-                          const char *enumName, const std::vector<T> &valid_values, T value, const std::string &vuid) {
+                          const char *enumName, const RangedEnumValues<T> &valid_values, T value, const std::string &vuid) {
     bool skip = false;
 
-    if (std::find(valid_values.begin(), valid_values.end(), value) == valid_values.end()) {
+    if (!valid_values.contains(value)) {
         skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT, 0, vuid,
                         "%s: value of %s (%d) does not fall within the begin..end range of the core %s enumeration tokens and is "
                         "not an extension added token.",
@@ -708,7 +724,7 @@ bool validate_ranged_enum(debug_report_data *report_data, const char *apiName, c
  * @param countName Name of count parameter.
  * @param arrayName Name of array parameter.
  * @param enumName Name of the enumeration being validated.
- * @param valid_values The list of valid values for the enumeration.
+ * @param valid_values The table of valid values for the enumeration.
  * @param count Number of enumeration values in the array.
  * @param array Array of enumeration values to validate.
  * @param countRequired The 'count' parameter may not be 0 when true.
@@ -717,7 +733,7 @@ bool validate_ranged_enum(debug_report_data *report_data, const char *apiName, c
  */
 template <typename T>
 static bool validate_ranged_enum_array(debug_report_data *report_data, const char *apiName, const ParameterName &countName,
-                                       const ParameterName &arrayName, const char *enumName, const std::vector<T> &valid_values,
+                                       const ParameterName &arrayName, const char *enumName, const RangedEnumValues<T> &valid_values,
                                        uint32_t count, const T *array, bool countRequired, bool arrayRequired) {
     bool skip_call = false;
 
@@ -726,7 +742,7 @@ static bool validate_ranged_enum_array(debug_report_data *report_data, const cha
                                     kVUIDUndefined, kVUIDUndefined);
     } else {
         for (uint32_t i = 0; i < count; ++i) {
-            if (std::find(valid_values.begin(), valid_values.end(), array[i]) == valid_values.end()) {
+            if (!valid_values.contains(array[i])) {
                 skip_call |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT, 0,
                                      kVUID_PVError_UnrecognizedValue,
                                      "%s: value of %s[%d] (%d) does not fall within the begin..end range of the core %s "
@@ -63,7 +63,7 @@
 
 namespace parameter_validation {
 
-extern std::unordered_map<std::string, void *> custom_functions;
+extern void SetCustomFunction(const std::string &name, void *function);
 
 extern bool parameter_validation_vkCreateInstance(VkInstance instance, const VkInstanceCreateInfo *pCreateInfo,
                                                   const VkAllocationCallbacks *pAllocator, VkInstance *pInstance);
@@ -100,6 +100,8 @@ std::unordered_map<void *, layer_data *> layer_data_map;
 std::unordered_map<void *, instance_layer_data *> instance_layer_data_map;
 
 void InitializeManualParameterValidationFunctionPointers(void);
+bool pv_vkCreateRenderPass(VkDevice device, const VkRenderPassCreateInfo *pCreateInfo, const VkAllocationCallbacks *pAllocator,
+                           VkRenderPass *pRenderPass);
 
 static void init_parameter_validation(instance_layer_data *instance_data, const VkAllocationCallbacks *pAllocator) {
     layer_debug_report_actions(instance_data->report_data, instance_data->logging_callback, pAllocator,
@@ -755,13 +757,7 @@ VKAPI_ATTR VkResult VKAPI_CALL vkCreateRenderPass(VkDevice device, const VkRende
     {
         std::unique_lock<std::mutex> lock(global_lock);
         skip |= parameter_validation_vkCreateRenderPass(device, pCreateInfo, pAllocator, pRenderPass);
-
-        typedef bool (*PFN_manual_vkCreateRenderPass)(VkDevice device, const VkRenderPassCreateInfo *pCreateInfo,
-                                                      const VkAllocationCallbacks *pAllocator, VkRenderPass *pRenderPass);
-        PFN_manual_vkCreateRenderPass custom_func = (PFN_manual_vkCreateRenderPass)custom_functions["vkCreateRenderPass"];
-        if (custom_func != nullptr) {
-            skip |= custom_func(device, pCreateInfo, pAllocator, pRenderPass);
-        }
+        skip |= pv_vkCreateRenderPass(device, pCreateInfo, pAllocator, pRenderPass);
     }
 
     if (!skip) {
@@ -798,13 +794,6 @@ VKAPI_ATTR void VKAPI_CALL vkDestroyRenderPass(VkDevice device, VkRenderPass ren
     {
         std::unique_lock<std::mutex> lock(global_lock);
         skip |= parameter_validation_vkDestroyRenderPass(device, renderPass, pAllocator);
-
-        typedef bool (*PFN_manual_vkDestroyRenderPass)(VkDevice device, VkRenderPass renderPass,
-                                                       const VkAllocationCallbacks *pAllocator);
-        PFN_manual_vkDestroyRenderPass custom_func = (PFN_manual_vkDestroyRenderPass)custom_functions["vkDestroyRenderPass"];
-        if (custom_func != nullptr) {
-            skip |= custom_func(device, renderPass, pAllocator);
-        }
     }
 
     if (!skip) {
@@ -3037,9 +3026,9 @@ bool pv_vkCmdDispatchBaseKHR(VkCommandBuffer commandBuffer, uint32_t baseGroupX,
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetDeviceProcAddr(VkDevice device, const char *funcName) {
-    const auto item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second);
+    void *funcptr = name_to_funcptr_map.find(funcName);
+    if (funcptr != nullptr) {
+        return reinterpret_cast<PFN_vkVoidFunction>(funcptr);
     }
 
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
@@ -3049,9 +3038,9 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetDeviceProcAddr(VkDevice device, co
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetInstanceProcAddr(VkInstance instance, const char *funcName) {
-    const auto item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second);
+    void *funcptr = name_to_funcptr_map.find(funcName);
+    if (funcptr != nullptr) {
+        return reinterpret_cast<PFN_vkVoidFunction>(funcptr);
     }
 
     auto instance_data = GetLayerDataPtr(get_dispatch_key(instance), instance_layer_data_map);
@@ -3071,35 +3060,34 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetPhysicalDeviceProcAddr(VkInstance
 // If additional validation is needed outside of the generated checks, a manual routine can be added to this file
 // and the address filled in here. The autogenerated source will call these routines if the pointers are not NULL.
 void InitializeManualParameterValidationFunctionPointers() {
-    custom_functions["vkGetDeviceQueue"] = (void *)pv_vkGetDeviceQueue;
-    custom_functions["vkCreateBuffer"] = (void *)pv_vkCreateBuffer;
-    custom_functions["vkCreateImage"] = (void *)pv_vkCreateImage;
-    custom_functions["vkCreateImageView"] = (void *)pv_vkCreateImageView;
-    custom_functions["vkCreateGraphicsPipelines"] = (void *)pv_vkCreateGraphicsPipelines;
-    custom_functions["vkCreateComputePipelines"] = (void *)pv_vkCreateComputePipelines;
-    custom_functions["vkCreateSampler"] = (void *)pv_vkCreateSampler;
-    custom_functions["vkCreateDescriptorSetLayout"] = (void *)pv_vkCreateDescriptorSetLayout;
-    custom_functions["vkFreeDescriptorSets"] = (void *)pv_vkFreeDescriptorSets;
-    custom_functions["vkUpdateDescriptorSets"] = (void *)pv_vkUpdateDescriptorSets;
-    custom_functions["vkCreateRenderPass"] = (void *)pv_vkCreateRenderPass;
-    custom_functions["vkBeginCommandBuffer"] = (void *)pv_vkBeginCommandBuffer;
-    custom_functions["vkCmdSetViewport"] = (void *)pv_vkCmdSetViewport;
-    custom_functions["vkCmdSetScissor"] = (void *)pv_vkCmdSetScissor;
-    custom_functions["vkCmdSetLineWidth"] = (void *)pv_vkCmdSetLineWidth;
-    custom_functions["vkCmdDraw"] = (void *)pv_vkCmdDraw;
-    custom_functions["vkCmdDrawIndirect"] = (void *)pv_vkCmdDrawIndirect;
-    custom_functions["vkCmdDrawIndexedIndirect"] = (void *)pv_vkCmdDrawIndexedIndirect;
-    custom_functions["vkCmdCopyImage"] = (void *)pv_vkCmdCopyImage;
-    custom_functions["vkCmdBlitImage"] = (void *)pv_vkCmdBlitImage;
-    custom_functions["vkCmdCopyBufferToImage"] = (void *)pv_vkCmdCopyBufferToImage;
-    custom_functions["vkCmdCopyImageToBuffer"] = (void *)pv_vkCmdCopyImageToBuffer;
-    custom_functions["vkCmdUpdateBuffer"] = (void *)pv_vkCmdUpdateBuffer;
-    custom_functions["vkCmdFillBuffer"] = (void *)pv_vkCmdFillBuffer;
-    custom_functions["vkCreateSwapchainKHR"] = (void *)pv_vkCreateSwapchainKHR;
-    custom_functions["vkQueuePresentKHR"] = (void *)pv_vkQueuePresentKHR;
-    custom_functions["vkCreateDescriptorPool"] = (void *)pv_vkCreateDescriptorPool;
-    custom_functions["vkCmdDispatch"] = (void *)pv_vkCmdDispatch;
-    custom_functions["vkCmdDispatchBaseKHR"] = (void *)pv_vkCmdDispatchBaseKHR;
+    SetCustomFunction("vkGetDeviceQueue", (void *)pv_vkGetDeviceQueue);
+    SetCustomFunction("vkCreateBuffer", (void *)pv_vkCreateBuffer);
+    SetCustomFunction("vkCreateImage", (void *)pv_vkCreateImage);
+    SetCustomFunction("vkCreateImageView", (void *)pv_vkCreateImageView);
+    SetCustomFunction("vkCreateGraphicsPipelines", (void *)pv_vkCreateGraphicsPipelines);
+    SetCustomFunction("vkCreateComputePipelines", (void *)pv_vkCreateComputePipelines);
+    SetCustomFunction("vkCreateSampler", (void *)pv_vkCreateSampler);
+    SetCustomFunction("vkCreateDescriptorSetLayout", (void *)pv_vkCreateDescriptorSetLayout);
+    SetCustomFunction("vkFreeDescriptorSets", (void *)pv_vkFreeDescriptorSets);
+    SetCustomFunction("vkUpdateDescriptorSets", (void *)pv_vkUpdateDescriptorSets);
+    SetCustomFunction("vkBeginCommandBuffer", (void *)pv_vkBeginCommandBuffer);
+    SetCustomFunction("vkCmdSetViewport", (void *)pv_vkCmdSetViewport);
+    SetCustomFunction("vkCmdSetScissor", (void *)pv_vkCmdSetScissor);
+    SetCustomFunction("vkCmdSetLineWidth", (void *)pv_vkCmdSetLineWidth);
+    SetCustomFunction("vkCmdDraw", (void *)pv_vkCmdDraw);
+    SetCustomFunction("vkCmdDrawIndirect", (void *)pv_vkCmdDrawIndirect);
+    SetCustomFunction("vkCmdDrawIndexedIndirect", (void *)pv_vkCmdDrawIndexedIndirect);
+    SetCustomFunction("vkCmdCopyImage", (void *)pv_vkCmdCopyImage);
+    SetCustomFunction("vkCmdBlitImage", (void *)pv_vkCmdBlitImage);
+    SetCustomFunction("vkCmdCopyBufferToImage", (void *)pv_vkCmdCopyBufferToImage);
+    SetCustomFunction("vkCmdCopyImageToBuffer", (void *)pv_vkCmdCopyImageToBuffer);
+    SetCustomFunction("vkCmdUpdateBuffer", (void *)pv_vkCmdUpdateBuffer);
+    SetCustomFunction("vkCmdFillBuffer", (void *)pv_vkCmdFillBuffer);
+    SetCustomFunction("vkCreateSwapchainKHR", (void *)pv_vkCreateSwapchainKHR);
+    SetCustomFunction("vkQueuePresentKHR", (void *)pv_vkQueuePresentKHR);
+    SetCustomFunction("vkCreateDescriptorPool", (void *)pv_vkCreateDescriptorPool);
+    SetCustomFunction("vkCmdDispatch", (void *)pv_vkCmdDispatch);
+    SetCustomFunction("vkCmdDispatchBaseKHR", (void *)pv_vkCmdDispatchBaseKHR);
 }
 
 }  // namespace parameter_validation
@@ -259,9 +259,9 @@ VKAPI_ATTR VkResult VKAPI_CALL EnumerateDeviceExtensionProperties(VkPhysicalDevi
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetPhysicalDeviceProcAddr(VkInstance instance, const char *funcName);
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, const char *funcName) {
-    const auto item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second);
+    void *funcptr = name_to_funcptr_map.find(funcName);
+    if (funcptr != nullptr) {
+        return reinterpret_cast<PFN_vkVoidFunction>(funcptr);
     }
 
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
@@ -271,9 +271,9 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
 }
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance, const char *funcName) {
-    const auto item = name_to_funcptr_map.find(funcName);
-    if (item != name_to_funcptr_map.end()) {
-        return reinterpret_cast<PFN_vkVoidFunction>(item->second);
+    void *funcptr = name_to_funcptr_map.find(funcName);
+    if (funcptr != nullptr) {
+        return reinterpret_cast<PFN_vkVoidFunction>(funcptr);
     }
 
     auto instance_data = GetLayerDataPtr(get_dispatch_key(instance), layer_data_map);
@@ -447,14 +447,12 @@ VKAPI_ATTR void VKAPI_CALL FreeCommandBuffers(VkDevice device, VkCommandPool com
     if (threadChecks) {
         startReadObject(my_data, device);
         startWriteObject(my_data, commandPool);
-        for (uint32_t index = 0; index < commandBufferCount; index++) {
-            startWriteObject(my_data, pCommandBuffers[index], lockCommandPool);
-        }
+        startWriteObjects(my_data, commandBufferCount, pCommandBuffers, lockCommandPool);
         // The driver may immediately reuse command buffers in another thread.
         // These updates need to be done before calling down to the driver.
+        finishWriteObjects(my_data, commandBufferCount, pCommandBuffers, lockCommandPool);
+        std::lock_guard<std::mutex> lock(command_pool_lock);
         for (uint32_t index = 0; index < commandBufferCount; index++) {
-            finishWriteObject(my_data, pCommandBuffers[index], lockCommandPool);
-            std::lock_guard<std::mutex> lock(command_pool_lock);
             command_pool_map.erase(pCommandBuffers[index]);
         }
     }
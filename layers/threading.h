@@ -89,9 +89,108 @@ class counter {
         if (object == VK_NULL_HANDLE) {
             return;
         }
-        bool skipCall = false;
         loader_platform_thread_id tid = loader_platform_get_thread_id();
         std::unique_lock<std::mutex> lock(counter_lock);
+        startWriteLocked(report_data, object, tid, lock);
+    }
+
+    // Start writing count objects, taking the lock once for the whole array
+    void startWrite(debug_report_data *report_data, uint32_t count, const T *objects) {
+        if (objects == nullptr || count == 0) {
+            return;
+        }
+        loader_platform_thread_id tid = loader_platform_get_thread_id();
+        std::unique_lock<std::mutex> lock(counter_lock);
+        for (uint32_t index = 0; index < count; index++) {
+            if (objects[index] != VK_NULL_HANDLE) {
+                startWriteLocked(report_data, objects[index], tid, lock);
+            }
+        }
+    }
+
+    void finishWrite(T object) {
+        if (object == VK_NULL_HANDLE) {
+            return;
+        }
+        // Object is no longer in use
+        std::unique_lock<std::mutex> lock(counter_lock);
+        finishUseLocked(object, false);
+        // Notify any waiting threads that this object may be safe to use
+        lock.unlock();
+        counter_condition.notify_all();
+    }
+
+    void finishWrite(uint32_t count, const T *objects) {
+        if (objects == nullptr || count == 0) {
+            return;
+        }
+        std::unique_lock<std::mutex> lock(counter_lock);
+        for (uint32_t index = 0; index < count; index++) {
+            if (objects[index] != VK_NULL_HANDLE) {
+                finishUseLocked(objects[index], false);
+            }
+        }
+        lock.unlock();
+        counter_condition.notify_all();
+    }
+
+    void startRead(debug_report_data *report_data, T object) {
+        if (object == VK_NULL_HANDLE) {
+            return;
+        }
+        loader_platform_thread_id tid = loader_platform_get_thread_id();
+        std::unique_lock<std::mutex> lock(counter_lock);
+        startReadLocked(report_data, object, tid, lock);
+    }
+
+    // Start reading count objects, taking the lock once for the whole array
+    void startRead(debug_report_data *report_data, uint32_t count, const T *objects) {
+        if (objects == nullptr || count == 0) {
+            return;
+        }
+        loader_platform_thread_id tid = loader_platform_get_thread_id();
+        std::unique_lock<std::mutex> lock(counter_lock);
+        for (uint32_t index = 0; index < count; index++) {
+            if (objects[index] != VK_NULL_HANDLE) {
+                startReadLocked(report_data, objects[index], tid, lock);
+            }
+        }
+    }
+
+    void finishRead(T object) {
+        if (object == VK_NULL_HANDLE) {
+            return;
+        }
+        std::unique_lock<std::mutex> lock(counter_lock);
+        finishUseLocked(object, true);
+        // Notify any waiting threads that this object may be safe to use
+        lock.unlock();
+        counter_condition.notify_all();
+    }
+
+    void finishRead(uint32_t count, const T *objects) {
+        if (objects == nullptr || count == 0) {
+            return;
+        }
+        std::unique_lock<std::mutex> lock(counter_lock);
+        for (uint32_t index = 0; index < count; index++) {
+            if (objects[index] != VK_NULL_HANDLE) {
+                finishUseLocked(objects[index], true);
+            }
+        }
+        lock.unlock();
+        counter_condition.notify_all();
+    }
+    counter(const char *name = "", VkDebugReportObjectTypeEXT type = VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT) {
+        typeName = name;
+        objectType = type;
+    }
+
+   private:
+    // Record a write of object by thread tid -- must hold counter_lock through lock
+    void startWriteLocked(debug_report_data *report_data, T object, loader_platform_thread_id tid,
+                          std::unique_lock<std::mutex> &lock) {
+        bool skipCall = false;
         if (uses.find(object) == uses.end()) {
             // There is no current use of the object.  Record writer thread.
             struct object_use_data *use_data = &uses[object];
@@ -160,28 +259,10 @@ class counter {
         }
     }
 
-    void finishWrite(T object) {
-        if (object == VK_NULL_HANDLE) {
-            return;
-        }
-        // Object is no longer in use
-        std::unique_lock<std::mutex> lock(counter_lock);
-        uses[object].writer_count -= 1;
-        if ((uses[object].reader_count == 0) && (uses[object].writer_count == 0)) {
-            uses.erase(object);
-        }
-        // Notify any waiting threads that this object may be safe to use
-        lock.unlock();
-        counter_condition.notify_all();
-    }
-
-    void startRead(debug_report_data *report_data, T object) {
-        if (object == VK_NULL_HANDLE) {
-            return;
-        }
+    // Record a read of object by thread tid -- must hold counter_lock through lock
+    void startReadLocked(debug_report_data *report_data, T object, loader_platform_thread_id tid,
+                         std::unique_lock<std::mutex> &lock) {
         bool skipCall = false;
-        loader_platform_thread_id tid = loader_platform_get_thread_id();
-        std::unique_lock<std::mutex> lock(counter_lock);
         if (uses.find(object) == uses.end()) {
             // There is no current use of the object.  Record reader count
             struct object_use_data *use_data = &uses[object];
@@ -213,22 +294,18 @@ class counter {
             uses[object].reader_count += 1;
         }
     }
-    void finishRead(T object) {
-        if (object == VK_NULL_HANDLE) {
-            return;
+
+    // Drop a read or write use of object -- must hold counter_lock
+    void finishUseLocked(T object, bool read) {
+        struct object_use_data *use_data = &uses[object];
+        if (read) {
+            use_data->reader_count -= 1;
+        } else {
+            use_data->writer_count -= 1;
         }
-        std::unique_lock<std::mutex> lock(counter_lock);
-        uses[object].reader_count -= 1;
-        if ((uses[object].reader_count == 0) && (uses[object].writer_count == 0)) {
+        if ((use_data->reader_count == 0) && (use_data->writer_count == 0)) {
             uses.erase(object);
         }
-        // Notify any waiting threads that this object may be safe to use
-        lock.unlock();
-        counter_condition.notify_all();
-    }
-    counter(const char *name = "", VkDebugReportObjectTypeEXT type = VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT) {
-        typeName = name;
-        objectType = type;
     }
 };
 
@@ -350,7 +427,19 @@ struct layer_data {
     static void startReadObject(struct layer_data *my_data, type object) {                                            \
         my_data->c_##type.startRead(my_data->report_data, object);                                                    \
     }                                                                                                                 \
-    static void finishReadObject(struct layer_data *my_data, type object) { my_data->c_##type.finishRead(object); }
+    static void finishReadObject(struct layer_data *my_data, type object) { my_data->c_##type.finishRead(object); }   \
+    static void startWriteObjects(struct layer_data *my_data, uint32_t count, const type *objects) {                  \
+        my_data->c_##type.startWrite(my_data->report_data, count, objects);                                           \
+    }                                                                                                                 \
+    static void finishWriteObjects(struct layer_data *my_data, uint32_t count, const type *objects) {                 \
+        my_data->c_##type.finishWrite(count, objects);                                                                \
+    }                                                                                                                 \
+    static void startReadObjects(struct layer_data *my_data, uint32_t count, const type *objects) {                   \
+        my_data->c_##type.startRead(my_data->report_data, count, objects);                                            \
+    }                                                                                                                 \
+    static void finishReadObjects(struct layer_data *my_data, uint32_t count, const type *objects) {                  \
+        my_data->c_##type.finishRead(count, objects);                                                                 \
+    }
 
 WRAPPER(VkDevice)
 WRAPPER(VkInstance)
@@ -428,4 +517,52 @@ static void finishReadObject(struct layer_data *my_data, VkCommandBuffer object)
     lock.unlock();
     finishReadObject(my_data, pool);
 }
+
+// Look up the command pools of count command buffers, taking command_pool_lock once
+static std::vector<VkCommandPool> GetCommandPools(uint32_t count, const VkCommandBuffer *objects) {
+    std::vector<VkCommandPool> pools(count);
+    std::lock_guard<std::mutex> lock(command_pool_lock);
+    for (uint32_t index = 0; index < count; index++) {
+        pools[index] = command_pool_map[objects[index]];
+    }
+    return pools;
+}
+static void startWriteObjects(struct layer_data *my_data, uint32_t count, const VkCommandBuffer *objects,
+                              bool lockPool = true) {
+    if (objects == nullptr || count == 0) {
+        return;
+    }
+    if (lockPool) {
+        std::vector<VkCommandPool> pools = GetCommandPools(count, objects);
+        startWriteObjects(my_data, count, pools.data());
+    }
+    my_data->c_VkCommandBuffer.startWrite(my_data->report_data, count, objects);
+}
+static void finishWriteObjects(struct layer_data *my_data, uint32_t count, const VkCommandBuffer *objects,
+                               bool lockPool = true) {
+    if (objects == nullptr || count == 0) {
+        return;
+    }
+    my_data->c_VkCommandBuffer.finishWrite(count, objects);
+    if (lockPool) {
+        std::vector<VkCommandPool> pools = GetCommandPools(count, objects);
+        finishWriteObjects(my_data, count, pools.data());
+    }
+}
+static void startReadObjects(struct layer_data *my_data, uint32_t count, const VkCommandBuffer *objects) {
+    if (objects == nullptr || count == 0) {
+        return;
+    }
+    std::vector<VkCommandPool> pools = GetCommandPools(count, objects);
+    startReadObjects(my_data, count, pools.data());
+    my_data->c_VkCommandBuffer.startRead(my_data->report_data, count, objects);
+}
+static void finishReadObjects(struct layer_data *my_data, uint32_t count, const VkCommandBuffer *objects) {
+    if (objects == nullptr || count == 0) {
+        return;
+    }
+    my_data->c_VkCommandBuffer.finishRead(count, objects);
+    std::vector<VkCommandPool> pools = GetCommandPools(count, objects);
+    finishReadObjects(my_data, count, pools.data());
+}
 #endif  // THREADING_H
@@ -21,8 +21,13 @@
 
 #include "vulkan/vulkan.h"
 
+#include <atomic>
+#include <new>
+#include <thread>
+#include <type_traits>
 #include <unordered_map>
 #include <unordered_set>
+#include <utility>
 
 #include "vk_layer_data.h"
 #include "vk_safe_struct.h"
@@ -33,9 +38,231 @@
 
 namespace unique_objects {
 
-// All increments must be guarded by global_lock
-static uint64_t global_unique_id = 1;
-static std::unordered_map<uint64_t, uint64_t> unique_id_mapping;  // Map uniqueID to actual object handle
+// Reader-writer spin lock with the interface of std::shared_mutex, which C++11 lacks. Any number of readers may hold it
+// at once; a writer waits for them to leave and keeps new readers out meanwhile, so writers are not starved. Only meant
+// for the short critical sections of UniqueIdMap.
+class SharedSpinLock {
+   public:
+    SharedSpinLock() : state_(0) {}
+    SharedSpinLock(const SharedSpinLock &) = delete;
+    SharedSpinLock &operator=(const SharedSpinLock &) = delete;
+
+    void lock_shared() {
+        uint32_t state = state_.load(std::memory_order_relaxed);
+        while ((state & kWriter) || !state_.compare_exchange_weak(state, state + 1, std::memory_order_acquire)) {
+            if (state & kWriter) {
+                std::this_thread::yield();
+                state = state_.load(std::memory_order_relaxed);
+            }
+        }
+    }
+
+    void unlock_shared() { state_.fetch_sub(1, std::memory_order_release); }
+
+    void lock() {
+        uint32_t state = state_.load(std::memory_order_relaxed);
+        while ((state & kWriter) || !state_.compare_exchange_weak(state, state | kWriter, std::memory_order_acquire)) {
+            if (state & kWriter) {
+                std::this_thread::yield();
+                state = state_.load(std::memory_order_relaxed);
+            }
+        }
+        // New readers are kept out now, wait for the ones already in to leave
+        while (state_.load(std::memory_order_acquire) != kWriter) {
+            std::this_thread::yield();
+        }
+    }
+
+    void unlock() { state_.store(0, std::memory_order_release); }
+
+   private:
+    static const uint32_t kWriter = 0x80000000u;
+
+    std::atomic<uint32_t> state_;
+};
+
+// Scoped shared (read) lock, the counterpart of std::lock_guard for the exclusive side
+class SharedLockGuard {
+   public:
+    explicit SharedLockGuard(SharedSpinLock &lock) : lock_(lock) { lock_.lock_shared(); }
+    ~SharedLockGuard() { lock_.unlock_shared(); }
+    SharedLockGuard(const SharedLockGuard &) = delete;
+    SharedLockGuard &operator=(const SharedLockGuard &) = delete;
+
+   private:
+    SharedSpinLock &lock_;
+};
+
+// Map of unique IDs to actual object handles. It is read to unwrap handles on nearly every call and written only when
+// objects are created or destroyed, so it does its own locking: IDs are spread over shards, each behind its own
+// reader-writer lock. Lookups only take the shared side and never wait on each other, and insertions and removals only
+// block threads that hit the same shard at the same time. Unique IDs are handed out sequentially, which spreads
+// consecutively created objects over all of the shards.
+class UniqueIdMap {
+   public:
+    // Return the handle wrapped by unique_id, or 0 if there is none
+    uint64_t find(uint64_t unique_id) const {
+        const Shard &shard = GetShard(unique_id);
+        SharedLockGuard lock(shard.lock);
+        auto it = shard.map.find(unique_id);
+        return (it != shard.map.end()) ? it->second : 0;
+    }
+
+    void insert(uint64_t unique_id, uint64_t handle) {
+        Shard &shard = GetShard(unique_id);
+        std::lock_guard<SharedSpinLock> lock(shard.lock);
+        shard.map[unique_id] = handle;
+    }
+
+    // Remove unique_id, returning the handle it wrapped or 0 if there was none
+    uint64_t pop(uint64_t unique_id) {
+        Shard &shard = GetShard(unique_id);
+        std::lock_guard<SharedSpinLock> lock(shard.lock);
+        auto it = shard.map.find(unique_id);
+        if (it == shard.map.end()) {
+            return 0;
+        }
+        uint64_t handle = it->second;
+        shard.map.erase(it);
+        return handle;
+    }
+
+    void erase(uint64_t unique_id) { pop(unique_id); }
+
+   private:
+    static const size_t kShardCount = 64;
+
+    // Aligned so that neighbouring shards do not share a cache line
+    struct alignas(64) Shard {
+        mutable SharedSpinLock lock;
+        std::unordered_map<uint64_t, uint64_t> map;
+    };
+
+    Shard &GetShard(uint64_t unique_id) { return shards_[unique_id % kShardCount]; }
+    const Shard &GetShard(uint64_t unique_id) const { return shards_[unique_id % kShardCount]; }
+
+    Shard shards_[kShardCount];
+};
+
+static std::atomic<uint64_t> global_unique_id(1);
+static UniqueIdMap unique_id_mapping;
+
+// Array of local copies made by the generated wrappers, e.g. of unwrapped handles or safe structs. Up to N elements are
+// constructed in storage inside the object, so that the usual small arrays do not cost a heap allocation per call.
+template <typename T, size_t N = 32>
+class LocalArray {
+   public:
+    LocalArray() : data_(nullptr), size_(0) {}
+    ~LocalArray() { clear(); }
+    LocalArray(const LocalArray &) = delete;
+    LocalArray &operator=(const LocalArray &) = delete;
+
+    // Replace the contents with count value-initialized elements and return a pointer to the first
+    T *allocate(size_t count) {
+        clear();
+        if (count > N) {
+            data_ = static_cast<T *>(::operator new(count * sizeof(T)));
+        } else {
+            data_ = reinterpret_cast<T *>(&storage_);
+        }
+        for (size_ = 0; size_ < count; ++size_) {
+            new (&data_[size_]) T();
+        }
+        return data_;
+    }
+
+    void clear() {
+        for (size_t i = size_; i > 0; --i) {
+            data_[i - 1].~T();
+        }
+        if (data_ != reinterpret_cast<T *>(&storage_)) {
+            ::operator delete(data_);
+        }
+        data_ = nullptr;
+        size_ = 0;
+    }
+
+   private:
+    typename std::aligned_storage<sizeof(T), alignof(T)>::type storage_[N];
+    T *data_;
+    size_t size_;
+};
+
+// Per-call arena for the safe structs the generated wrappers copy and unwrap, e.g. pNext chains. Objects are carved out
+// of a block inside the arena, spilling into heap blocks only when it fills up, and are destroyed in reverse order of
+// creation when the arena goes out of scope. Each wrapper owns its own arena, so calls re-entering the layer from
+// another wrapper never share one.
+class SafeStructArena {
+   public:
+    SafeStructArena()
+        : next_(reinterpret_cast<uintptr_t>(&storage_)),
+          end_(reinterpret_cast<uintptr_t>(&storage_) + sizeof(storage_)),
+          blocks_(nullptr),
+          destructors_(nullptr) {}
+    ~SafeStructArena() {
+        for (Destructor *destructor = destructors_; destructor != nullptr; destructor = destructor->next) {
+            destructor->destroy(destructor->object);
+        }
+        while (blocks_ != nullptr) {
+            Block *next = blocks_->next;
+            ::operator delete(blocks_);
+            blocks_ = next;
+        }
+    }
+    SafeStructArena(const SafeStructArena &) = delete;
+    SafeStructArena &operator=(const SafeStructArena &) = delete;
+
+    // Construct a T from args in the arena
+    template <typename T, typename... Args>
+    T *New(Args &&... args) {
+        Destructor *destructor = static_cast<Destructor *>(Allocate(sizeof(Destructor), alignof(Destructor)));
+        T *object = new (Allocate(sizeof(T), alignof(T))) T(std::forward<Args>(args)...);
+        destructor->object = object;
+        destructor->destroy = &Destroy<T>;
+        destructor->next = destructors_;
+        destructors_ = destructor;
+        return object;
+    }
+
+   private:
+    static const size_t kBlockSize = 2048;
+
+    struct Block {
+        Block *next;
+    };
+    struct Destructor {
+        void *object;
+        void (*destroy)(void *object);
+        Destructor *next;
+    };
+
+    template <typename T>
+    static void Destroy(void *object) {
+        static_cast<T *>(object)->~T();
+    }
+
+    void *Allocate(size_t size, size_t alignment) {
+        uintptr_t object = (next_ + alignment - 1) & ~(uintptr_t)(alignment - 1);
+        if (object + size > end_) {
+            // Start a new block, large enough for this object if it does not fit in a default-sized one
+            size_t block_size = sizeof(Block) + size + alignment;
+            if (block_size < kBlockSize) block_size = kBlockSize;
+            Block *block = static_cast<Block *>(::operator new(block_size));
+            block->next = blocks_;
+            blocks_ = block;
+            end_ = reinterpret_cast<uintptr_t>(block) + block_size;
+            object = (reinterpret_cast<uintptr_t>(block + 1) + alignment - 1) & ~(uintptr_t)(alignment - 1);
+        }
+        next_ = object + size;
+        return reinterpret_cast<void *>(object);
+    }
+
+    typename std::aligned_storage<kBlockSize>::type storage_;
+    uintptr_t next_;
+    uintptr_t end_;
+    Block *blocks_;
+    Destructor *destructors_;
+};
 
 struct TEMPLATE_STATE {
     VkDescriptorUpdateTemplateKHR desc_update_template;
@@ -92,7 +319,7 @@ struct layer_data {
 static std::unordered_map<void *, instance_layer_data *> instance_layer_data_map;
 static std::unordered_map<void *, layer_data *> layer_data_map;
 
-static std::mutex global_lock;  // Protect map accesses and unique_id increments
+static std::mutex global_lock;  // Protect layer_data state; unique_id_mapping and global_unique_id need no lock
 
 struct GenericHeader {
     VkStructureType sType;
@@ -117,18 +344,16 @@ bool ContainsExtStruct(const T *target, VkStructureType ext_type) {
 }
 
 /* Unwrap a handle. */
-// must hold lock!
 template <typename HandleType>
 HandleType Unwrap(HandleType wrappedHandle) {
-    // TODO: don't use operator[] here.
-    return (HandleType)unique_id_mapping[reinterpret_cast<uint64_t const &>(wrappedHandle)];
+    return (HandleType)unique_id_mapping.find(reinterpret_cast<uint64_t const &>(wrappedHandle));
 }
 
-// Wrap a newly created handle with a new unique ID, and return the new ID -- must hold lock!
+// Wrap a newly created handle with a new unique ID, and return the new ID
 template <typename HandleType>
 HandleType WrapNew(HandleType newlyCreatedHandle) {
     auto unique_id = global_unique_id++;
-    unique_id_mapping[unique_id] = reinterpret_cast<uint64_t const &>(newlyCreatedHandle);
+    unique_id_mapping.insert(unique_id, reinterpret_cast<uint64_t const &>(newlyCreatedHandle));
     return (HandleType)unique_id;
 }
 
@@ -861,9 +861,10 @@ static inline bool log_msg(const debug_report_data *debug_data, VkFlags msg_flag
     std::string str_plus_spec_text(str);
 
     // If the msg_code is in the error map, tack on spec text to error message.
-    if (validation_error_map.find(msg_code) != validation_error_map.end()) {
+    std::string spec_text = GetValidationErrorMessage(msg_code);
+    if (!spec_text.empty()) {
         str_plus_spec_text += " ";
-        str_plus_spec_text += validation_error_map[msg_code];
+        str_plus_spec_text += spec_text;
     }
 
     bool result = debug_log_msg(debug_data, msg_flags, object_type, src_object, 0, msg_code, "Validation",
@@ -895,11 +896,11 @@ static inline bool log_msg(const debug_report_data *debug_data, VkFlags msg_flag
     std::string str_plus_spec_text(str);
 
     // If the vuid string is in the error map: find the legacy enum, look up spec text, and tack it onto error message.
-    int32_t legacy_vuid_enum = VALIDATION_ERROR_UNDEFINED;
-    if (validation_error_text_map.find(vuid_text.c_str()) != validation_error_text_map.end()) {
-        legacy_vuid_enum = validation_error_text_map[vuid_text.c_str()];
+    int32_t legacy_vuid_enum = GetValidationErrorCode(vuid_text.c_str());
+    std::string spec_text = GetValidationErrorMessage(legacy_vuid_enum);
+    if (!spec_text.empty()) {
         str_plus_spec_text += " ";
-        str_plus_spec_text += validation_error_map[legacy_vuid_enum];
+        str_plus_spec_text += spec_text;
     }
 
     // Append layer prefix with VUID string, pass in recovered legacy numerical VUID
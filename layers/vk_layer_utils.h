@@ -21,6 +21,8 @@
 
 #pragma once
 #include <stdbool.h>
+#include <string.h>
+#include <algorithm>
 #include <string>
 #include <vector>
 #include "vk_format_utils.h"
@@ -107,6 +109,26 @@ Stream &stream_join(Stream &stream, const String &sep, const Collection &values)
     return stream_join(stream, sep, values.cbegin(), values.cend());
 }
 
+// Generated table of the functions a layer intercepts. The entries are sorted by name at generation time, so the table
+// needs no construction at load time and find() is a binary search.
+struct FunctionPointerEntry {
+    const char *name;
+    void *funcptr;
+};
+
+struct FunctionPointerTable {
+    const FunctionPointerEntry *entries;
+    size_t count;
+
+    // Returns the function intercepting name, or nullptr if the layer does not intercept it
+    void *find(const char *name) const {
+        const FunctionPointerEntry *end = entries + count;
+        const FunctionPointerEntry *entry = std::lower_bound(
+            entries, end, name, [](const FunctionPointerEntry &lhs, const char *rhs) { return strcmp(lhs.name, rhs) < 0; });
+        return (entry != end && strcmp(entry->name, name) == 0) ? entry->funcptr : nullptr;
+    }
+};
+
 extern "C" {
 #endif
 
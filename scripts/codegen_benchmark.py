@@ -0,0 +1,212 @@
+#!/usr/bin/python3
+#
+# Copyright (c) 2018 The Khronos Group Inc.
+# Copyright (c) 2018 Valve Corporation
+# Copyright (c) 2018 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This script measures how the code generators driven by lvl_genvk.py scale with the size of the registry. Every
+# target is generated, each in its own process, from the real vk.xml and from synthetically inflated copies of it in
+# which every struct, command, core feature and extension is duplicated under a new name. For each target and scale it
+# reports the generation time, peak memory and output size, and flags targets and phases whose time grows faster than
+# the registry.
+#
+# usage:
+#       python3 codegen_benchmark.py -registry <path>/vk.xml -scripts <path> [-scales 1 2 4 8] [-timefile file]
+#                                    [target ...]
+#
+#       -registry and -scripts are passed on to lvl_genvk.py; -timefile collects the JSON timing records of every
+#       run, tagged with the scale they were measured at.
+
+import argparse, copy, json, os, shutil, subprocess, sys, tempfile
+import xml.etree.ElementTree as etree
+
+scripts_directory_path = os.path.dirname(os.path.abspath(__file__))
+lvl_genvk_path = os.path.join(scripts_directory_path, 'lvl_genvk.py')
+
+# Attributes naming structs, commands, enums or extensions, possibly as a comma-separated list
+renamed_attributes = ['name', 'alias', 'structextends', 'validextensionstructs', 'requires']
+
+#
+# Return the name of a <type> or <command> element
+def ElementName(elem, name_path):
+    name_elem = elem.find(name_path)
+    return name_elem.text if name_elem is not None else elem.get('name')
+
+#
+# Rename every reference to a renamed struct, command, enum or extension in elem and its children
+def RenameReferences(elem, renames):
+    for child in elem.iter():
+        if child.tag in ['type', 'name'] and child.text in renames:
+            child.text = renames[child.text]
+        for attribute in renamed_attributes:
+            value = child.get(attribute)
+            if value is not None:
+                child.set(attribute, ','.join(renames.get(item, item) for item in value.split(',')))
+
+#
+# Return a copy of the registry in which every struct, command, core feature and extension occurs scale times
+def InflateRegistry(tree, scale):
+    tree = copy.deepcopy(tree)
+    root = tree.getroot()
+    types = root.find('types')
+    commands = root.find('commands')
+    extensions = root.find('extensions')
+
+    structs = [elem for elem in types.findall('type') if elem.get('category') in ['struct', 'union']]
+    cmds = commands.findall('command')
+    features = root.findall('feature')
+    exts = extensions.findall('extension')
+    # Enums defined (rather than just referenced) by features and extensions
+    enums = [elem for interface in features + exts for elem in interface.findall('require/enum')
+             if any(elem.get(attribute) is not None for attribute in ['value', 'offset', 'bitpos', 'alias'])]
+
+    for index in range(1, scale):
+        tag = 'Synth%d' % index
+        renames = {}
+        for elem in structs:
+            name = ElementName(elem, 'name')
+            renames[name] = 'Vk' + tag + name[2:]
+        for elem in cmds:
+            name = ElementName(elem, 'proto/name')
+            renames[name] = 'vk' + tag + name[2:]
+        for elem in enums:
+            name = elem.get('name')
+            renames[name] = 'VK_' + tag.upper() + name[2:]
+        for elem in exts:
+            name = elem.get('name')
+            renames[name] = 'VK_' + tag + name[2:]
+
+        for elem in structs + cmds:
+            clone = copy.deepcopy(elem)
+            RenameReferences(clone, renames)
+            (types if elem in structs else commands).append(clone)
+        for elem in features:
+            clone = copy.deepcopy(elem)
+            RenameReferences(clone, renames)
+            clone.set('name', elem.get('name') + '_' + tag.upper())
+            root.append(clone)
+        for elem in exts:
+            clone = copy.deepcopy(elem)
+            RenameReferences(clone, renames)
+            # Keep extension numbers, and so the enum values derived from them, unique
+            clone.set('number', str(int(elem.get('number')) + 1000 * index))
+            for enum in clone.findall('require/enum'):
+                if enum.get('value') == '"%s"' % elem.get('name'):
+                    enum.set('value', '"%s"' % clone.get('name'))
+            extensions.append(clone)
+    return tree
+
+#
+# Return the names of all targets lvl_genvk.py can generate
+def ListTargets(args):
+    output = subprocess.check_output([sys.executable, lvl_genvk_path, '-scripts', args.scripts, '-listTargets'])
+    return output.decode('utf-8').split()
+
+#
+# Generate one target from registry_file in its own process, returning its timing records or None if it failed
+def RunTarget(args, registry_file, target, work_dir):
+    timefile = os.path.join(work_dir, 'timing.jsonl')
+    if os.path.exists(timefile):
+        os.remove(timefile)
+    command = [sys.executable, lvl_genvk_path, '-registry', registry_file, '-scripts', args.scripts,
+               '-o', work_dir, '-nocache', '-timefile', timefile, target]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        print('  %s failed:\n%s' % (target, result.stderr.decode('utf-8', 'replace')), file=sys.stderr)
+        return None
+    with open(timefile, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+#
+# Print the result table for one target and flag phases growing faster than the registry
+def Report(target, results, threshold):
+    base = results.get(1)
+    for scale in sorted(results):
+        records = results[scale]
+        total = next(record for record in records if record['target'] == target and record['phase'] == 'total')
+        growth = ''
+        if base is not None and scale != 1:
+            base_total = next(record for record in base if record['target'] == target and record['phase'] == 'total')
+            ratio = total['seconds'] / max(base_total['seconds'], 1e-6)
+            growth = '%6.2fx' % ratio
+            if ratio > scale * threshold:
+                growth += '  SUPERLINEAR'
+        print('  %-28s %2dx %10.3fs %10s KB %12d bytes  %s' % (target, scale, total['seconds'],
+              total.get('peak_rss_kb'), total.get('bytes', 0), growth))
+    if base is None:
+        return
+    for scale in sorted(results):
+        if scale == 1:
+            continue
+        base_phases = dict((record['phase'], record['seconds']) for record in base if record['target'] == target)
+        for record in results[scale]:
+            if record['target'] != target or record['phase'] == 'total' or record['phase'] not in base_phases:
+                continue
+            ratio = record['seconds'] / max(base_phases[record['phase']], 1e-6)
+            if ratio > scale * threshold and record['seconds'] > 0.01:
+                print('      %-12s grows %.2fx at %dx' % (record['phase'], ratio, scale))
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure how the vk.xml code generators scale with the registry size')
+    parser.add_argument('-registry', action='store', default='vk.xml',
+                        help='Use specified registry file instead of vk.xml')
+    parser.add_argument('-scripts', action='store', required=True,
+                        help='Find additional scripts in this directory')
+    parser.add_argument('-scales', action='store', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Registry scale factors to measure')
+    parser.add_argument('-threshold', action='store', type=float, default=1.25,
+                        help='Flag times growing more than this factor faster than the registry')
+    parser.add_argument('-timefile', action='store', default=None,
+                        help='Write every timing record, tagged with its scale, to specified file as JSON lines')
+    parser.add_argument('target', metavar='target', nargs='*',
+                        help='Targets to measure (default: every target)')
+    args = parser.parse_args()
+    args.scripts = os.path.abspath(args.scripts)
+
+    targets = args.target if args.target else ListTargets(args)
+    tree = etree.parse(args.registry)
+    work_dir = tempfile.mkdtemp(prefix='codegen_benchmark.')
+    results = dict((target, {}) for target in targets)
+    try:
+        for scale in args.scales:
+            if scale == 1:
+                registry_file = os.path.abspath(args.registry)
+            else:
+                registry_file = os.path.join(work_dir, 'vk_x%d.xml' % scale)
+                InflateRegistry(tree, scale).write(registry_file, encoding='utf-8', xml_declaration=True)
+            print('* Measuring %dx registry' % scale, file=sys.stderr)
+            for target in targets:
+                records = RunTarget(args, registry_file, target, work_dir)
+                if records is not None:
+                    for record in records:
+                        record['scale'] = scale
+                    results[target][scale] = records
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for target in targets:
+        Report(target, results[target], args.threshold)
+
+    if args.timefile:
+        with open(args.timefile, 'w', encoding='utf-8') as f:
+            for target in targets:
+                for scale in sorted(results[target]):
+                    for record in results[target][scale]:
+                        f.write(json.dumps(record) + '\n')
+
+    return 0 if all(len(results[target]) == len(args.scales) for target in targets) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
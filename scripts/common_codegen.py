@@ -23,6 +23,7 @@ import xml.etree.ElementTree as etree
 from generator import *
 from collections import namedtuple
 from vuid_mapping import *
+from registry_index import *
 
 # Copyright text prefixing all headers (list of strings).
 prefixStrings = [
@@ -70,3 +71,21 @@ def GetFeatureProtect(interface):
     if platform is not None:
         protect = platform_dict[platform]
     return protect
+
+#
+# Return the lines of the generated name_to_funcptr_map, a FunctionPointerTable over intercepts, a list of
+# (command name, intercepting function, feature protect or None) tuples. The entries are sorted by name, as
+# FunctionPointerTable::find() requires; entries for the same name keep their order.
+def FunctionPointerTableLines(intercepts, storage=''):
+    lines = ['// Table of all APIs to be intercepted by this layer, sorted by name']
+    lines += ['static const FunctionPointerEntry name_to_funcptr_entries[] = {']
+    for (name, function, protect) in sorted(intercepts, key=lambda intercept: intercept[0]):
+        if protect is not None:
+            lines += ['#ifdef %s' % protect]
+        lines += ['    {"%s", (void *)%s},' % (name, function)]
+        if protect is not None:
+            lines += ['#endif']
+    lines += ['};']
+    lines += ['%sconst FunctionPointerTable name_to_funcptr_map = {name_to_funcptr_entries,' % storage]
+    lines += ['    sizeof(name_to_funcptr_entries) / sizeof(name_to_funcptr_entries[0])};']
+    return lines
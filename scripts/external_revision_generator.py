@@ -22,12 +22,14 @@
 
 import argparse
 import hashlib
+import io
+import os
 import subprocess
 import uuid
 
 def generate(symbol_name, commit_id, output_header_file):
     # Write commit ID to output header file
-    with open(output_header_file, "w") as header_file:
+    with io.StringIO() as header_file:
          # File Comment
         file_comment = '// *** THIS FILE IS GENERATED - DO NOT EDIT ***\n'
         file_comment += '// See external_revision_generator.py for modifications\n'
@@ -63,6 +65,16 @@ def generate(symbol_name, commit_id, output_header_file):
         contents = '#pragma once\n\n'
         contents += '#define %s "%s"\n' % (symbol_name, commit_id)
         header_file.write(contents)
+        header = header_file.getvalue()
+
+    # Leave an up-to-date header untouched so that its timestamp does not change and
+    # everything including it is not needlessly rebuilt.
+    if os.path.isfile(output_header_file):
+        with open(output_header_file, "r") as existing_file:
+            if existing_file.read() == header:
+                return
+    with open(output_header_file, "w") as header_file:
+        header_file.write(header)
 
 def get_commit_id_from_git(git_binary, source_dir):
     value = subprocess.check_output([git_binary, "rev-parse", "HEAD"], cwd=source_dir).decode('utf-8').strip()
@@ -84,6 +96,25 @@ def get_commit_id_from_file(rev_file):
         sha1.update(rev_contents.encode('utf-8'))
         return sha1.hexdigest()
 
+def get_commit_id_from_tree(paths):
+    # SHA1 the relative path and contents of every file found under the given files and
+    # directories, visiting them in a fixed order so that identical trees give identical IDs
+    sha1 = hashlib.sha1()
+    for path in paths:
+        if os.path.isdir(path):
+            files = []
+            for root, dirs, filenames in os.walk(path):
+                dirs[:] = [d for d in dirs if d != '.git']
+                files += [os.path.join(root, filename) for filename in filenames]
+            files = sorted((os.path.relpath(f, path).replace(os.sep, '/'), f) for f in files)
+        else:
+            files = [(os.path.basename(path), path)]
+        for name, filename in files:
+            sha1.update(name.encode('utf-8') + b'\0')
+            with open(filename, 'rb') as file_stream:
+                sha1.update(file_stream.read())
+    return sha1.hexdigest()
+
 def get_commit_id_from_uuid():
         unique_uuid = str(uuid.uuid4())
         sha1 = hashlib.sha1();
@@ -97,11 +128,12 @@ def main():
     rev_method_group = parser.add_mutually_exclusive_group(required=True)
     rev_method_group.add_argument("--git_dir", metavar="SOURCE_DIR", help="git working copy directory")
     rev_method_group.add_argument("--rev_file", metavar="REVISION_FILE", help="source revision file path (must contain a SHA1 hash")
+    rev_method_group.add_argument("--from_tree", metavar="SOURCE_PATH", nargs='+', help="base SHA1 on the contents of these files and directories")
     rev_method_group.add_argument("--from_uuid", action='store_true', help="base SHA1 on a dynamically generated UUID")
     args = parser.parse_args()
 
     # We can either parse the latest Git commit ID out of the specified repository (preferred where possible),
-    # or computing the SHA1 hash of the contents of a file passed on the command line and (where necessary --
+    # or computing the SHA1 hash of the contents of a file or source tree passed on the command line (where necessary --
     # e.g. when building the layers outside of a Git environment).
     if args.git_dir is not None:
         # Extract commit ID from the specified source directory
@@ -113,7 +145,10 @@ def main():
     elif args.rev_file is not None:
         # Read the commit ID from a file.
         commit_id = get_commit_id_from_file(args.rev_file)
-    elif args.from_uuid is not None:
+    elif args.from_tree is not None:
+        # Hash the contents of the given source tree.
+        commit_id = get_commit_id_from_tree(args.from_tree)
+    elif args.from_uuid:
         commit_id = get_commit_id_from_uuid()
 
     if not is_sha1(commit_id):
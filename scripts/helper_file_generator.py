@@ -81,6 +81,7 @@ class HelperFileOutputGenerator(OutputGenerator):
         self.structNames = []                             # List of Vulkan struct typenames
         self.structTypes = dict()                         # Map of Vulkan struct typename to required VkStructureType
         self.structMembers = []                           # List of StructMemberData records for all Vulkan structs
+        self.structMemberDict = dict()                    # Map of Vulkan struct typename to its StructMemberData record
         self.object_types = []                            # List of all handle types
         self.object_type_aliases = []                     # Aliases to handles types (for handles that were extensions)
         self.debug_report_object_types = []               # Handy copy of debug_report_object_type enum data
@@ -303,17 +304,15 @@ class HelperFileOutputGenerator(OutputGenerator):
             type_key = 'VK_DEFINE_HANDLE'
         else:
             type_key = 'VK_DEFINE_NON_DISPATCHABLE_HANDLE'
-        handle = self.registry.tree.find("types/type/[name='" + handle_type + "'][@category='handle']")
-        if handle is not None and handle.find('type').text == type_key:
+        registry_index = GetRegistryIndex(self.registry)
+        if registry_index.handleTypes.get(handle_type) == type_key:
             return True
         # if handle_type is a struct, search its members
-        if handle_type in self.structNames:
-            member_index = next((i for i, v in enumerate(self.structMembers) if v[0] == handle_type), None)
-            if member_index is not None:
-                for item in self.structMembers[member_index].members:
-                    handle = self.registry.tree.find("types/type/[name='" + item.type + "'][@category='handle']")
-                    if handle is not None and handle.find('type').text == type_key:
-                        return True
+        struct_info = self.structMemberDict.get(handle_type)
+        if struct_info is not None:
+            for item in struct_info.members:
+                if registry_index.handleTypes.get(item.type) == type_key:
+                    return True
         return False
     #
     # Generate local ready-access data describing Vulkan structures and unions from the XML metadata
@@ -356,6 +355,7 @@ class HelperFileOutputGenerator(OutputGenerator):
                                                  extstructs=self.registry.validextensionstructs[typeName] if name == 'pNext' else None,
                                                  cdecl=cdecl))
         self.structMembers.append(self.StructMemberData(name=typeName, members=membersInfo, ifdef_protect=self.featureExtraProtect))
+        self.structMemberDict.setdefault(typeName, self.structMembers[-1])
     #
     # Enum_string_header: Create a routine to convert an enumerated value into a string
     def GenerateEnumStringConversion(self, groupName, value_list):
@@ -430,9 +430,8 @@ class HelperFileOutputGenerator(OutputGenerator):
                     safe_struct_header += '#ifdef %s\n' % item.ifdef_protect
                 safe_struct_header += 'struct safe_%s {\n' % (item.name)
                 for member in item.members:
-                    if member.type in self.structNames:
-                        member_index = next((i for i, v in enumerate(self.structMembers) if v[0] == member.type), None)
-                        if member_index is not None and self.NeedSafeStruct(self.structMembers[member_index]) == True:
+                    if member.type in self.structMemberDict:
+                        if self.NeedSafeStruct(self.structMemberDict[member.type]) == True:
                             if member.ispointer:
                                 safe_struct_header += '    safe_%s* %s;\n' % (member.type, member.name)
                             else:
@@ -1005,9 +1004,8 @@ class HelperFileOutputGenerator(OutputGenerator):
 
             for member in item.members:
                 m_type = member.type
-                if member.type in self.structNames:
-                    member_index = next((i for i, v in enumerate(self.structMembers) if v[0] == member.type), None)
-                    if member_index is not None and self.NeedSafeStruct(self.structMembers[member_index]) == True:
+                if member.type in self.structMemberDict:
+                    if self.NeedSafeStruct(self.structMemberDict[member.type]) == True:
                         m_type = 'safe_%s' % member.type
                 if member.ispointer and 'safe_' not in m_type and self.TypeContainsObjectHandle(member.type, False) == False:
                     # Ptr types w/o a safe_struct, for non-null case need to allocate new ptr and copy data in
@@ -1046,9 +1044,8 @@ class HelperFileOutputGenerator(OutputGenerator):
                         init_list += '\n    %s(nullptr),' % member.name
                         init_func_txt += '    %s = nullptr;\n' % member.name
                         array_element = 'in_struct->%s[i]' % member.name
-                        if member.type in self.structNames:
-                            member_index = next((i for i, v in enumerate(self.structMembers) if v[0] == member.type), None)
-                            if member_index is not None and self.NeedSafeStruct(self.structMembers[member_index]) == True:
+                        if member.type in self.structMemberDict:
+                            if self.NeedSafeStruct(self.structMemberDict[member.type]) == True:
                                 array_element = '%s(&in_struct->safe_%s[i])' % (member.type, member.name)
                         construct_txt += '    if (%s && in_struct->%s) {\n' % (member.len, member.name)
                         construct_txt += '        %s = new %s[%s];\n' % (member.name, m_type, member.len)
@@ -180,6 +180,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
 
         elif self.genOpts.filename == 'vk_loader_extensions.c':
             preamble += '#define _GNU_SOURCE\n'
+            preamble += '#include <stddef.h>\n'
             preamble += '#include <stdio.h>\n'
             preamble += '#include <stdlib.h>\n'
             preamble += '#include <string.h>\n'
@@ -296,7 +297,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
     #
     # Determine if this API should be ignored or added to the instance or device dispatch table
     def AddCommandToDispatchList(self, extension_name, extension_type, name, cmdinfo, handle_type):
-        handle = self.registry.tree.find("types/type/[name='" + handle_type + "'][@category='handle']")
+        is_handle = GetRegistryIndex(self.registry).isHandle(handle_type)
 
         return_type =  cmdinfo.elem.find('proto/type')
         if (return_type != None and return_type.text == 'void'):
@@ -321,7 +322,7 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
             cmd_params.append(self.CommandParam(type=param_type, name=param_name,
                                                 cdecl=param_cdecl))
 
-        if handle != None and handle_type != 'VkInstance' and handle_type != 'VkPhysicalDevice':
+        if is_handle and handle_type != 'VkInstance' and handle_type != 'VkPhysicalDevice':
             # The Core Vulkan code will be wrapped in a feature called VK_VERSION_#_#
             # For example: VK_VERSION_1_0 wraps the core 1.0 Vulkan functionality
             if 'VK_VERSION_' in extension_name:
@@ -798,31 +799,44 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
         commands = []
         tables = ''
         cur_type = ''
-        cur_extension_name = ''
+
+        # The commands of each dispatch table are emitted as a table sorted by name and looked up with a binary
+        # search, rather than as a chain of string compares
+        tables += '// Command name, without the \'vk\' prefix, and the offset of its entry in a dispatch table\n'
+        tables += 'typedef struct {\n'
+        tables += '    const char *name;\n'
+        tables += '    size_t offset;\n'
+        tables += '} loader_dispatch_table_entry;\n'
+        tables += '\n'
+        tables += '// Find a command in a table of dispatch table entries sorted by name\n'
+        tables += 'static const loader_dispatch_table_entry *loader_find_dispatch_table_entry(const loader_dispatch_table_entry *entries,\n'
+        tables += '                                                                          size_t count, const char *name) {\n'
+        tables += '    size_t low = 0;\n'
+        tables += '    size_t high = count;\n'
+        tables += '    while (low < high) {\n'
+        tables += '        size_t mid = low + (high - low) / 2;\n'
+        tables += '        int result = strcmp(name, entries[mid].name);\n'
+        tables += '        if (result == 0) return &entries[mid];\n'
+        tables += '        if (result < 0) {\n'
+        tables += '            high = mid;\n'
+        tables += '        } else {\n'
+        tables += '            low = mid + 1;\n'
+        tables += '        }\n'
+        tables += '    }\n'
+        tables += '    return NULL;\n'
+        tables += '}\n\n'
 
         for x in range(0, 2):
             if x == 0:
                 cur_type = 'device'
-
-                tables += '// Device command lookup function\n'
-                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_device_dispatch_table(const VkLayerDispatchTable *table, const char *name) {\n'
-                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') return NULL;\n'
-                tables += '\n'
-                tables += '    name += 2;\n'
+                table_type = 'VkLayerDispatchTable'
             else:
                 cur_type = 'instance'
+                table_type = 'VkLayerInstanceDispatchTable'
+            entries_name = 'loader_%s_dispatch_table_entries' % cur_type
 
-                tables += '// Instance command lookup function\n'
-                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_instance_dispatch_table(const VkLayerInstanceDispatchTable *table, const char *name,\n'
-                tables += '                                                                 bool *found_name) {\n'
-                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') {\n'
-                tables += '        *found_name = false;\n'
-                tables += '        return NULL;\n'
-                tables += '    }\n'
-                tables += '\n'
-                tables += '    *found_name = true;\n'
-                tables += '    name += 2;\n'
-
+            # Collect the commands of this dispatch table, keyed by name without the 'vk' prefix
+            entries = {}
             for y in range(0, 2):
                 if y == 0:
                     commands = self.core_commands
@@ -833,13 +847,6 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                     is_inst_handle_type = cur_cmd.handle_type == 'VkInstance' or cur_cmd.handle_type == 'VkPhysicalDevice'
                     if ((cur_type == 'instance' and is_inst_handle_type) or (cur_type == 'device' and not is_inst_handle_type)):
 
-                        if cur_cmd.ext_name != cur_extension_name:
-                            if 'VK_VERSION_' in cur_cmd.ext_name:
-                                tables += '\n    // ---- Core %s commands\n' % cur_cmd.ext_name[11:]
-                            else:
-                                tables += '\n    // ---- %s extension commands\n' % cur_cmd.ext_name
-                            cur_extension_name = cur_cmd.ext_name
-
                         # Remove 'vk' from proto name
                         base_name = cur_cmd.name[2:]
 
@@ -849,18 +856,39 @@ class LoaderExtensionOutputGenerator(OutputGenerator):
                             base_name == 'EnumerateInstanceVersion'):
                             continue
 
-                        if cur_cmd.protect is not None:
-                            tables += '#ifdef %s\n' % cur_cmd.protect
-
-                        tables += '    if (!strcmp(name, "%s")) return (void *)table->%s;\n' % (base_name, base_name)
+                        entries.setdefault(base_name, cur_cmd)
 
-                        if cur_cmd.protect is not None:
-                            tables += '#endif // %s\n' % cur_cmd.protect
+            # Sorted in byte order, to match strcmp
+            tables += '// %s commands, sorted by name\n' % cur_type.capitalize()
+            tables += 'static const loader_dispatch_table_entry %s[] = {\n' % entries_name
+            for base_name in sorted(entries):
+                cur_cmd = entries[base_name]
+                if cur_cmd.protect is not None:
+                    tables += '#ifdef %s\n' % cur_cmd.protect
+                tables += '    {"%s", offsetof(%s, %s)},\n' % (base_name, table_type, base_name)
+                if cur_cmd.protect is not None:
+                    tables += '#endif // %s\n' % cur_cmd.protect
+            tables += '};\n\n'
 
+            if x == 0:
+                tables += '// Device command lookup function\n'
+                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_device_dispatch_table(const VkLayerDispatchTable *table, const char *name) {\n'
+                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') return NULL;\n'
+            else:
+                tables += '// Instance command lookup function\n'
+                tables += 'VKAPI_ATTR void* VKAPI_CALL loader_lookup_instance_dispatch_table(const VkLayerInstanceDispatchTable *table, const char *name,\n'
+                tables += '                                                                 bool *found_name) {\n'
+                tables += '    if (!name || name[0] != \'v\' || name[1] != \'k\') {\n'
+                tables += '        *found_name = false;\n'
+                tables += '        return NULL;\n'
+                tables += '    }\n'
             tables += '\n'
+            tables += '    const loader_dispatch_table_entry *entry =\n'
+            tables += '        loader_find_dispatch_table_entry(%s, sizeof(%s) / sizeof(%s[0]), name + 2);\n' % (entries_name, entries_name, entries_name)
             if x == 1:
-                tables += '    *found_name = false;\n'
-            tables += '    return NULL;\n'
+                tables += '    *found_name = (entry != NULL);\n'
+            tables += '    if (entry == NULL) return NULL;\n'
+            tables += '    return (void *)*(const PFN_vkVoidFunction *)((const char *)table + entry->offset);\n'
             tables += '}\n\n'
         return tables
 
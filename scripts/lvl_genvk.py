@@ -14,21 +14,126 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import argparse, cProfile, pdb, string, sys, time, os
+import argparse, collections, cProfile, contextlib, filecmp, hashlib, io, json, multiprocessing, pdb, pickle, re, shutil, string, sys, sysconfig, tempfile, time, os
 
 # Simple timer functions
 startTime = None
 
 def startTimer(timeit):
     global startTime
-    startTime = time.clock()
+    startTime = time.perf_counter()
 
-def endTimer(timeit, msg):
+# Stop the timer, reporting the elapsed time if timeit is set. If phase is
+# given, the time is also kept as a structured timing record (see
+# recordTiming()) for the named phase of target, with any extra fields.
+def endTimer(timeit, msg, phase = None, target = None, **fields):
     global startTime
-    endTime = time.clock()
+    endTime = time.perf_counter()
     if (timeit):
         write(msg, endTime - startTime, file=sys.stderr)
-        startTime = None
+    if phase is not None:
+        recordTiming(target, phase, endTime - startTime, **fields)
+    startTime = None
+
+# Structured timing records, written out as JSON lines by -timefile. None
+# when timing records are not being kept.
+timingRecords = None
+
+# Vulkan header version of the registry, identifying the registry in timing
+# records
+headerVersion = None
+
+# Keep a timing record for one phase of generating a target, or of loading
+# the registry if target is None.
+def recordTiming(target, phase, seconds, **fields):
+    if timingRecords is not None:
+        record = collections.OrderedDict()
+        record['header_version'] = headerVersion
+        record['target'] = target
+        record['phase'] = phase
+        record['seconds'] = round(seconds, 6)
+        record.update(fields)
+        timingRecords.append(record)
+
+# Append the timing records to filename, one JSON object per line
+def writeTimingRecords(filename):
+    with open(filename, 'a', encoding='utf-8') as f:
+        for record in timingRecords:
+            f.write(json.dumps(record) + '\n')
+
+# Return the peak resident set size of this process in kilobytes, or None
+# where the resource module is not available
+def peakMemoryKB():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes rather than kilobytes
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return peak
+
+# Return the VK_HEADER_VERSION defined by the registry, or None
+def registryHeaderVersion(reg):
+    typeinfo = reg.typedict.get('VK_HEADER_VERSION')
+    if typeinfo is not None:
+        match = re.search(r'VK_HEADER_VERSION\s+(\d+)', ''.join(typeinfo.elem.itertext()))
+        if match:
+            return int(match.group(1))
+    return None
+
+# Output file wrapper counting the time spent writing and the number of bytes
+# written, on behalf of a GeneratorTimer
+class TimedOutputFile:
+    def __init__(self, outFile, timer):
+        self.outFile = outFile
+        self.timer = timer
+
+    def write(self, text):
+        start = time.perf_counter()
+        result = self.outFile.write(text)
+        self.timer.add('write', time.perf_counter() - start)
+        self.timer.outputBytes += len(text.encode('utf-8'))
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.outFile, name)
+
+# Instrument a generator, accumulating the time spent in, and the number of
+# calls to, each of its phase methods, and wrapping its output file in a
+# TimedOutputFile once it has been opened. Times are inclusive: a genType()
+# that calls genStruct() counts towards both.
+class GeneratorTimer:
+    phases = ['beginFile', 'genType', 'genStruct', 'genGroup', 'genEnum', 'genCmd', 'endFile']
+
+    def __init__(self, gen):
+        self.seconds = collections.OrderedDict()
+        self.calls = collections.OrderedDict()
+        self.outputBytes = 0
+        for phase in self.phases:
+            method = getattr(gen, phase, None)
+            if method is not None:
+                setattr(gen, phase, self.wrap(gen, phase, method))
+
+    def wrap(self, gen, phase, method):
+        def timedMethod(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            self.add(phase, time.perf_counter() - start)
+            if phase == 'beginFile':
+                gen.outFile = TimedOutputFile(gen.outFile, self)
+            return result
+        return timedMethod
+
+    def add(self, phase, seconds):
+        self.seconds[phase] = self.seconds.get(phase, 0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    # Keep a timing record for each phase of target
+    def record(self, target):
+        for phase in self.seconds:
+            recordTiming(target, phase, self.seconds[phase], calls=self.calls[phase])
 
 # Turn a list of strings into a regexp string matching exactly those strings
 def makeREstring(list, default = None):
@@ -387,24 +492,71 @@ def makeGenOpts(args):
             helper_file_type  = 'typemap_helper_header')
         ]
 
-# Generate a target based on the options in the matching genOpts{} object.
+# Generate the requested targets based on the options in the matching
+# genOpts{} objects. The registry is loaded once by the caller and shared by
+# every target generated here.
 # This is encapsulated in a function so it can be profiled and/or timed.
 # The args parameter is an parsed argument object containing the following
 # fields that are used:
-#   target - target to generate
+#   target - list of targets to generate, or 'all' for every known target
 #   directory - directory to generate it in
 #   protect - True if re-inclusion wrappers should be created
 #   extensions - list of additional extensions to include in generated
 #   interfaces
+#   jobs - number of worker processes to generate targets with
 def genTarget(args):
     global genOpts
 
     # Create generator options with specified parameters
     makeGenOpts(args)
 
-    if (args.target in genOpts.keys()):
-        createGenerator = genOpts[args.target][0]
-        options = genOpts[args.target][1]
+    targets = expandTargets(args.target)
+    jobs = args.jobs if args.jobs > 0 else multiprocessing.cpu_count()
+    jobs = min(jobs, len(targets))
+
+    # Workers must inherit the loaded registry from this process, which is
+    # only possible where fork() is available. Elsewhere, fall back to
+    # generating the targets one after another.
+    if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        # Anything still buffered would otherwise be duplicated in each worker
+        sys.stderr.flush()
+        errWarn.flush()
+        if diag is not None:
+            diag.flush()
+
+        context = multiprocessing.get_context('fork')
+        with context.Pool(jobs) as pool:
+            results = pool.map(genTargetWorker, targets, chunksize=1)
+
+        # Replay the output of each target in the order the targets were
+        # requested, so the streams do not depend on worker scheduling.
+        for (stderrText, errText, diagText, workerInputFiles, workerTimingRecords) in results:
+            sys.stderr.write(stderrText)
+            if errWarn is not sys.stderr:
+                errWarn.write(errText)
+            if diag is not None:
+                diag.write(diagText)
+            inputFiles.update(workerInputFiles)
+            if timingRecords is not None:
+                timingRecords.extend(workerTimingRecords)
+    else:
+        for target in targets:
+            genOneTarget(args, target, errWarn, diag)
+
+    if args.timefile:
+        writeTimingRecords(args.timefile)
+
+    if args.depfile:
+        outputs = [os.path.normpath(os.path.join(genOpts[target][1].directory, genOpts[target][1].filename))
+                   for target in targets if target in genOpts.keys()]
+        writeDepfile(args, outputs)
+
+# Generate a single target, sending errors and warnings to errFile and
+# diagnostics to diagFile.
+def genOneTarget(args, target, errFile, diagFile):
+    if (target in genOpts.keys()):
+        createGenerator = genOpts[target][0]
+        options = genOpts[target][1]
 
         if not args.quiet:
             write('* Building', options.filename, file=sys.stderr)
@@ -416,18 +568,231 @@ def genTarget(args):
             write('* options.emitExtensions    =', options.emitExtensions, file=sys.stderr)
 
         startTimer(args.time)
-        gen = createGenerator(errFile=errWarn,
-                              warnFile=errWarn,
-                              diagFile=diag)
+        gen = createGenerator(errFile=errFile,
+                              warnFile=errFile,
+                              diagFile=diagFile)
+        timer = GeneratorTimer(gen) if timingRecords is not None else None
         reg.setGenerator(gen)
-        reg.apiGen(options)
+
+        if args.writeIfChanged:
+            # The generator truncates and writes its output file itself, so
+            # point it at a private staging directory next to the real output
+            # and only move the result into place if it differs.
+            outputDirectory = options.directory
+            options.directory = tempfile.mkdtemp(prefix='.' + options.filename + '.', dir=outputDirectory)
+            try:
+                reg.apiGen(options)
+                changed = replaceIfChanged(os.path.join(options.directory, options.filename),
+                                           os.path.join(outputDirectory, options.filename))
+            finally:
+                shutil.rmtree(options.directory, ignore_errors=True)
+                options.directory = outputDirectory
+        else:
+            reg.apiGen(options)
+            changed = True
 
         if not args.quiet:
-            write('* Generated', options.filename, file=sys.stderr)
-        endTimer(args.time, '* Time to generate ' + options.filename + ' =')
+            if changed:
+                write('* Generated', options.filename, file=sys.stderr)
+            else:
+                write('* Unchanged', options.filename, file=sys.stderr)
+        if timer is not None:
+            timer.record(options.filename)
+            endTimer(args.time, '* Time to generate ' + options.filename + ' =', 'total', options.filename,
+                     bytes=timer.outputBytes, changed=changed, peak_rss_kb=peakMemoryKB())
+        else:
+            endTimer(args.time, '* Time to generate ' + options.filename + ' =')
     else:
         write('No generator options for unknown target:',
-              args.target, file=sys.stderr)
+              target, file=sys.stderr)
+
+# Move newFile over oldFile unless oldFile already has exactly the same
+# content, in which case newFile is discarded and oldFile keeps its timestamp.
+# The replacement is atomic, so readers never see a partially written file.
+# Returns True if oldFile was replaced.
+def replaceIfChanged(newFile, oldFile):
+    if os.path.isfile(oldFile) and filecmp.cmp(newFile, oldFile, shallow=False):
+        os.remove(newFile)
+        return False
+    os.replace(newFile, oldFile)
+    return True
+
+# Generate a single target in a worker process forked by genTarget(). The
+# stderr, error/warning and diagnostic output of the target is captured and
+# returned to the parent rather than written to the shared streams, so that
+# concurrently running targets cannot interleave their output.
+def genTargetWorker(target):
+    global timingRecords
+    # Only this target's timing records are handed back to the parent
+    if timingRecords is not None:
+        timingRecords = []
+
+    stderrBuffer = io.StringIO()
+    if errWarn is sys.stderr:
+        errBuffer = stderrBuffer
+    else:
+        errBuffer = io.StringIO()
+    diagBuffer = io.StringIO() if diag is not None else None
+
+    with contextlib.redirect_stderr(stderrBuffer):
+        genOneTarget(args, target, errBuffer, diagBuffer)
+
+    return (stderrBuffer.getvalue(),
+            errBuffer.getvalue(),
+            diagBuffer.getvalue() if diagBuffer is not None else '',
+            inputFiles,
+            timingRecords)
+
+# Files opened for reading while loading the registry and generating targets,
+# recorded by recordInputFile() for use in a -depfile.
+inputFiles = set()
+
+# Audit hook recording every file opened for reading, including files read
+# by the generators themselves such as validusage.json.
+def recordInputFile(event, eventArgs):
+    if event == 'open':
+        (path, mode, flags) = eventArgs
+        if isinstance(path, (str, os.PathLike)):
+            if mode is None:
+                reading = (flags & (os.O_WRONLY | os.O_RDWR)) == 0
+            else:
+                reading = not any(c in mode for c in 'wax+')
+            if reading:
+                inputFiles.add(os.path.abspath(os.fspath(path)))
+
+# Write a Makefile-style depfile naming every input of the generated outputs:
+# the files recorded by recordInputFile() and the source of every imported
+# module. Python's own library, the registry cache and the outputs themselves
+# (which are read back by -writeIfChanged) are left out.
+def writeDepfile(args, outputs):
+    depfile = args.depfile
+    inputs = set(inputFiles)
+    inputs.add(os.path.abspath(args.registry))
+    for module in list(sys.modules.values()):
+        moduleFile = getattr(module, '__file__', None)
+        if moduleFile and moduleFile.endswith('.py'):
+            inputs.add(os.path.abspath(moduleFile))
+
+    excludedDirs = [os.path.join(os.path.abspath(path), '') for path in
+                    set([sysconfig.get_path('stdlib'), sysconfig.get_path('platstdlib')])]
+    excludedFiles = set([os.path.abspath(output) for output in outputs])
+    excludedFiles.add(os.path.abspath(depfile))
+    if cacheFile is not None:
+        excludedFiles.add(os.path.abspath(cacheFile))
+    # -writeIfChanged stages each output in a directory named after it
+    excludedDirs += [os.path.join(os.path.dirname(output), '.' + os.path.basename(output) + '.') for output in excludedFiles]
+
+    dependencies = []
+    for path in sorted(inputs):
+        if (path in excludedFiles or
+            any(path.startswith(excludedDir) for excludedDir in excludedDirs) or
+            path.endswith('.pyc') or
+            not os.path.isfile(path)):
+            continue
+        dependencies.append(path)
+
+    with open(depfile, 'w', encoding='utf-8') as f:
+        f.write(' '.join(escapeDepfilePath(output) for output in outputs) + ':')
+        for dependency in dependencies:
+            f.write(' \\\n  ' + escapeDepfilePath(dependency))
+        f.write('\n')
+
+# Quote a path for use in a Makefile-style depfile
+def escapeDepfilePath(path):
+    return path.replace('\\', '/').replace(' ', '\\ ').replace('#', '\\#').replace('$', '$$')
+
+# Expand the list of targets named on the command line. The special target
+# 'all' selects every target that has an entry in genOpts{}, in the order in
+# which makeGenOpts() defines them. Duplicates are only generated once.
+def expandTargets(targets):
+    expanded = []
+    for target in targets:
+        if target == 'all':
+            names = list(genOpts.keys())
+        else:
+            names = [target]
+        for name in names:
+            if name not in expanded:
+                expanded.append(name)
+    return expanded
+
+# Return the path of the registry cache file for the registry named by args.
+# The file name is derived from the content of the registry, of the scripts
+# defining the Registry object and its index and of this script, as well as
+# from the Python version and pickle protocol in use. A cached registry is
+# therefore never reused once any of them change; a new cache file is written
+# instead. The name starts with registryCachePrefix(), which writeRegistryCache()
+# uses to find and remove the older cache files of the same registry.
+def registryCacheFile(args):
+    cacheDir = args.cachedir if args.cachedir else args.directory
+    digest = hashlib.sha256()
+    digest.update(sys.version.encode('utf-8'))
+    digest.update(str(pickle.HIGHEST_PROTOCOL).encode('utf-8'))
+    for filename in [args.registry,
+                     sys.modules['reg'].__file__,
+                     sys.modules['generator'].__file__,
+                     sys.modules['registry_index'].__file__,
+                     os.path.abspath(__file__)]:
+        with open(filename, 'rb') as f:
+            digest.update(f.read())
+    return os.path.join(cacheDir, registryCachePrefix(args) + digest.hexdigest() + '.pickle')
+
+# Return the prefix shared by all cache file names of the registry named by
+# args, which is derived from the location of the registry
+def registryCachePrefix(args):
+    digest = hashlib.sha256(os.path.abspath(args.registry).encode('utf-8'))
+    return 'vk_registry_' + digest.hexdigest()[:16] + '_'
+
+# Load a registry previously stored by writeRegistryCache(). Returns None if
+# there is no usable cache file, in which case the registry must be parsed.
+def readRegistryCache(cacheFile):
+    if not os.path.isfile(cacheFile):
+        return None
+    try:
+        with open(cacheFile, 'rb') as f:
+            reg = pickle.load(f)
+    except Exception as e:
+        write('* Ignoring unreadable registry cache', cacheFile, '(' + str(e) + ')', file=sys.stderr)
+        return None
+    # The generator is not cached, so give the registry the default one a
+    # freshly constructed Registry has
+    reg.gen = OutputGenerator()
+    return reg
+
+# Store a freshly loaded registry for later invocations. The cache file is
+# written under a temporary name and then renamed, so concurrent builds never
+# see a partially written file. Failing to write the cache is not fatal.
+# The registry's generator and its options hold open files (stdout, stderr)
+# and cannot be pickled, so they are left out of the cache. Once the new cache
+# file is in place, the outdated ones starting with prefix are removed.
+def writeRegistryCache(cacheFile, prefix, reg):
+    (gen, genOpts) = (reg.gen, reg.genOpts)
+    reg.gen = None
+    reg.genOpts = None
+    try:
+        cacheDir = os.path.dirname(cacheFile)
+        if cacheDir and not os.path.isdir(cacheDir):
+            os.makedirs(cacheDir)
+        (fd, tempFile) = tempfile.mkstemp(dir=cacheDir if cacheDir else '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(reg, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tempFile, cacheFile)
+        except:
+            os.remove(tempFile)
+            raise
+    except Exception as e:
+        write('* Unable to write registry cache', cacheFile, '(' + str(e) + ')', file=sys.stderr)
+        return
+    finally:
+        reg.gen = gen
+        reg.genOpts = genOpts
+    for filename in os.listdir(cacheDir if cacheDir else '.'):
+        if filename.startswith(prefix) and filename.endswith('.pickle') and filename != os.path.basename(cacheFile):
+            try:
+                os.remove(os.path.join(cacheDir, filename))
+            except OSError:
+                pass
 
 # -feature name
 # -extension name
@@ -451,10 +816,18 @@ if __name__ == '__main__':
     parser.add_argument('-feature', action='append',
                         default=[],
                         help='Specify a core API feature name or names to add to targets')
+    parser.add_argument('-cachedir', action='store',
+                        default=None,
+                        help='Cache the loaded registry in specified directory instead of the output directory')
+    parser.add_argument('-nocache', action='store_true',
+                        help='Always parse the registry and validusage.json, neither reading nor writing their caches')
     parser.add_argument('-debug', action='store_true',
                         help='Enable debugging')
     parser.add_argument('-dump', action='store_true',
                         help='Enable dump to stderr')
+    parser.add_argument('-depfile', action='store',
+                        default=None,
+                        help='Write a Makefile-style depfile listing every file the targets depend on')
     parser.add_argument('-diagfile', action='store',
                         default=None,
                         help='Write diagnostics to specified file')
@@ -470,13 +843,23 @@ if __name__ == '__main__':
                         help='Use specified registry file instead of vk.xml')
     parser.add_argument('-time', action='store_true',
                         help='Enable timing')
+    parser.add_argument('-timefile', action='store',
+                        default=None,
+                        help='Append per-target and per-phase timing, memory and output size records to specified file as JSON lines')
     parser.add_argument('-validate', action='store_true',
                         help='Enable group validation')
+    parser.add_argument('-listTargets', action='store_true',
+                        help='List the targets that can be generated and exit')
+    parser.add_argument('-jobs', action='store', type=int,
+                        default=1,
+                        help='Generate targets using up to this many processes (0 uses one per CPU)')
+    parser.add_argument('-writeIfChanged', action='store_true',
+                        help='Only replace target files whose generated content differs from the existing file')
     parser.add_argument('-o', action='store', dest='directory',
                         default='.',
                         help='Create target and related files in specified directory')
-    parser.add_argument('target', metavar='target', nargs='?',
-                        help='Specify target')
+    parser.add_argument('target', metavar='target', nargs='*',
+                        help='Specify one or more targets, or "all" to generate every target')
     parser.add_argument('-quiet', action='store_true', default=True,
                         help='Suppress script output during normal execution.')
     parser.add_argument('-verbose', action='store_false', dest='quiet', default=True,
@@ -488,13 +871,25 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
+    # Keep structured timing records from here on
+    if args.timefile:
+        timingRecords = []
+
+    # Record every file read from here on, so the depfile is complete. Audit
+    # hooks need Python 3.8; earlier versions only list the imported scripts
+    # and the registry.
+    if args.depfile and hasattr(sys, 'addaudithook'):
+        sys.addaudithook(recordInputFile)
+
     scripts_directory_path = os.path.dirname(os.path.abspath(__file__))
     registry_headers_path = os.path.join(scripts_directory_path, args.scripts)
     sys.path.insert(0, registry_headers_path)
 
     from reg import *
-    from generator import write
+    from generator import OutputGenerator, write
     from cgenerator import CGeneratorOptions, COutputGenerator
+    from registry_index import GetRegistryIndex
+    import valid_usage
 
     # ValidationLayer Generator Modifications
     from threading_generator import  ThreadGeneratorOptions, ThreadOutputGenerator
@@ -509,19 +904,52 @@ if __name__ == '__main__':
     args.feature = [name for arg in args.feature for name in arg.split()]
     args.extension = [name for arg in args.extension for name in arg.split()]
 
-    # Load & parse registry
-    reg = Registry()
+    if (args.listTargets):
+        makeGenOpts(args)
+        for target in genOpts.keys():
+            write(target)
+        sys.exit(0)
+
+    # Reuse a previously loaded registry if one is cached for this vk.xml
+    reg = None
+    cacheFile = None
+    if not (args.nocache or args.debug):
+        cacheFile = registryCacheFile(args)
+        # Keep the validusage.json index next to the registry cache
+        valid_usage.indexDirectory = os.path.dirname(cacheFile)
+        startTimer(args.time)
+        reg = readRegistryCache(cacheFile)
+        if reg is not None:
+            endTimer(args.time, '* Time to load registry cache =', 'load_registry_cache')
 
-    startTimer(args.time)
-    tree = etree.parse(args.registry)
-    endTimer(args.time, '* Time to make ElementTree =')
+    # Load & parse registry
+    if reg is None:
+        reg = Registry()
 
-    if args.debug:
-        pdb.run('reg.loadElementTree(tree)')
-    else:
         startTimer(args.time)
-        reg.loadElementTree(tree)
-        endTimer(args.time, '* Time to parse ElementTree =')
+        tree = etree.parse(args.registry)
+        endTimer(args.time, '* Time to make ElementTree =', 'parse_xml')
+
+        if args.debug:
+            pdb.run('reg.loadElementTree(tree)')
+        else:
+            startTimer(args.time)
+            reg.loadElementTree(tree)
+            endTimer(args.time, '* Time to parse ElementTree =', 'load_registry')
+
+        # Build the lookup tables shared by all generators before caching or
+        # forking, so every target reuses the same index
+        startTimer(args.time)
+        GetRegistryIndex(reg)
+        endTimer(args.time, '* Time to index registry =', 'index_registry')
+
+        if cacheFile is not None:
+            writeRegistryCache(cacheFile, registryCachePrefix(args), reg)
+
+    headerVersion = registryHeaderVersion(reg)
+    if timingRecords is not None:
+        for record in timingRecords:
+            record['header_version'] = headerVersion
 
     if (args.validate):
         reg.validateGroups()
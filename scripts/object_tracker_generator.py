@@ -25,6 +25,7 @@ import xml.etree.ElementTree as etree
 from generator import *
 from collections import namedtuple
 from common_codegen import *
+from valid_usage import LoadValidUsage
 
 # This is a workaround to use a Python 2.7 and 3.x compatible syntax.
 from io import open
@@ -128,6 +129,7 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
         OutputGenerator.__init__(self, errFile, warnFile, diagFile)
         self.INDENT_SPACES = 4
         self.intercepts = []
+        self.validated_object_types = set()                # Handle types validated by the command being wrapped
         self.instance_extensions = []
         self.device_extensions = []
         # Commands which are not autogenerated but still intercepted
@@ -255,7 +257,6 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
         self.StructMemberData = namedtuple('StructMemberData', ['name', 'members'])
         self.object_types = []         # List of all handle types
         self.valid_vuids = set()       # Set of all valid VUIDs
-        self.vuid_dict = dict()        # VUID dictionary (from JSON)
     #
     # Check if the parameter passed in is optional
     def paramIsOptional(self, param):
@@ -344,21 +345,6 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
         output_func += '}\n'
         return output_func
 
-    #
-    # Walk the JSON-derived dict and find all "vuid" key values
-    def ExtractVUIDs(self, d):
-        if hasattr(d, 'items'):
-            for k, v in d.items():
-                if k == "vuid":
-                    yield v
-                elif isinstance(v, dict):
-                    for s in self.ExtractVUIDs(v):
-                        yield s
-                elif isinstance (v, list):
-                    for l in v:
-                        for s in self.ExtractVUIDs(l):
-                            yield s
-
     #
     # Called at beginning of processing as file is opened
     def beginFile(self, genOpts):
@@ -366,17 +352,13 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
 
         self.valid_usage_path = genOpts.valid_usage_path
         vu_json_filename = os.path.join(self.valid_usage_path + os.sep, 'validusage.json')
-        if os.path.isfile(vu_json_filename):
-            json_file = open(vu_json_filename, 'r')
-            self.vuid_dict = json.load(json_file)
-            json_file.close()
-        if len(self.vuid_dict) == 0:
+        valid_usage = LoadValidUsage(vu_json_filename)
+        if valid_usage is None or len(valid_usage.vuids) == 0:
             print("Error: Could not find, or error loading %s/validusage.json\n", vu_json_filename)
             sys.exit(1)
 
-        # Build a set of all vuid text strings found in validusage.json
-        for json_vuid_string in self.ExtractVUIDs(self.vuid_dict):
-            self.valid_vuids.add(json_vuid_string)
+        # Set of all vuid text strings found in validusage.json
+        self.valid_vuids = valid_usage.vuids
 
         # File Comment
         file_comment = '// *** THIS FILE IS GENERATED - DO NOT EDIT ***\n'
@@ -417,7 +399,6 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
     #
     # Now that the data is all collected and complete, generate and output the object validation routines
     def endFile(self):
-        self.struct_member_dict = dict(self.structMembers)
         # Generate the list of APIs that might need to handle wrapped extension structs
         # self.GenerateCommandWrapExtensionList()
         self.WrapCommands()
@@ -444,10 +425,7 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
                 self.newline()
 
         # Record intercepted procedures
-        write('// Map of all APIs to be intercepted by this layer', file=self.outFile)
-        write('const std::unordered_map<std::string, void*> name_to_funcptr_map = {', file=self.outFile)
-        write('\n'.join(self.intercepts), file=self.outFile)
-        write('};\n', file=self.outFile)
+        write('\n'.join(FunctionPointerTableLines(self.intercepts)), file=self.outFile)
         self.newline()
         write('} // namespace object_tracker', file=self.outFile)
         # Finish processing in superclass
@@ -505,26 +483,15 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
     #
     # Get the category of a type
     def getTypeCategory(self, typename):
-        types = self.registry.tree.findall("types/type")
-        for elem in types:
-            if (elem.find("name") is not None and elem.find('name').text == typename) or elem.attrib.get('name') == typename:
-                return elem.attrib.get('category')
+        return GetRegistryIndex(self.registry).typeCategory(typename)
     #
     # Check if a parent object is dispatchable or not
     def isHandleTypeObject(self, handletype):
-        handle = self.registry.tree.find("types/type/[name='" + handletype + "'][@category='handle']")
-        if handle is not None:
-            return True
-        else:
-            return False
+        return GetRegistryIndex(self.registry).isHandle(handletype)
     #
     # Check if a parent object is dispatchable or not
     def isHandleTypeNonDispatchable(self, handletype):
-        handle = self.registry.tree.find("types/type/[name='" + handletype + "'][@category='handle']")
-        if handle is not None and handle.find('type').text == 'VK_DEFINE_NON_DISPATCHABLE_HANDLE':
-            return True
-        else:
-            return False
+        return GetRegistryIndex(self.registry).isNonDispatchableHandle(handletype)
     #
     # Retrieve the type and name for a parameter
     def getTypeNameTuple(self, param):
@@ -612,23 +579,18 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
                                                  isdestroy=False,
                                                  feature_protect=self.featureExtraProtect))
         self.structMembers.append(self.StructMemberData(name=typeName, members=membersInfo))
+        self.struct_member_dict[typeName] = membersInfo
     #
-    # Insert a lock_guard line
-    def lock_guard(self, indent):
-        return '%sstd::lock_guard<std::mutex> lock(global_lock);\n' % indent
+    # Insert a line locking the tracked objects of the given handle types
+    def lock_guard(self, indent, object_types):
+        if not object_types:
+            return ''
+        type_bits = ' | '.join('ObjectTypeBit(%s)' % self.GetVulkanObjType(type) for type in sorted(object_types))
+        return '%sObjectTypeLock lock(%s);\n' % (indent, type_bits)
     #
     # Determine if a struct has an object as a member or an embedded member
     def struct_contains_object(self, struct_item):
-        struct_member_dict = dict(self.structMembers)
-        struct_members = struct_member_dict[struct_item]
-
-        for member in struct_members:
-            if self.isHandleTypeObject(member.type):
-                return True
-            elif member.type in struct_member_dict:
-                if self.struct_contains_object(member.type) == True:
-                    return True
-        return False
+        return GetRegistryIndex(self.registry).structContainsHandle(struct_item)
     #
     # Return list of struct members which contain, or whose sub-structures contain an obj in a given list of parameters or members
     def getParmeterStructsWithObjects(self, item_list):
@@ -697,16 +659,11 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
             handle_name = params[-1].find('name')
             create_obj_code += '%sif (VK_SUCCESS == result) {\n' % (indent)
             indent = self.incIndent(indent)
-            create_obj_code += '%sstd::lock_guard<std::mutex> lock(global_lock);\n' % (indent)
-            object_dest = '*%s' % handle_name.text
+            create_obj_code += self.lock_guard(indent, [cmd_info[-1].type])
             if object_array == True:
-                create_obj_code += '%sfor (uint32_t index = 0; index < %s; index++) {\n' % (indent, cmd_info[-1].len)
-                indent = self.incIndent(indent)
-                object_dest = '%s[index]' % cmd_info[-1].name
-            create_obj_code += '%sCreateObject(%s, %s, %s, pAllocator);\n' % (indent, params[0].find('name').text, object_dest, self.GetVulkanObjType(cmd_info[-1].type))
-            if object_array == True:
-                indent = self.decIndent(indent)
-                create_obj_code += '%s}\n' % indent
+                create_obj_code += '%sCreateObjects(%s, %s, %s, %s, pAllocator);\n' % (indent, params[0].find('name').text, cmd_info[-1].len, cmd_info[-1].name, self.GetVulkanObjType(cmd_info[-1].type))
+            else:
+                create_obj_code += '%sCreateObject(%s, *%s, %s, pAllocator);\n' % (indent, params[0].find('name').text, handle_name.text, self.GetVulkanObjType(cmd_info[-1].type))
             indent = self.decIndent(indent)
             create_obj_code += '%s}\n' % (indent)
         return create_obj_code
@@ -728,13 +685,17 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
             nullalloc_vuid = self.manual_vuids.get(nullalloc_vuid_string, "kVUIDUndefined")
             if self.isHandleTypeObject(cmd_info[param].type) == True:
                 if object_array == True:
-                    # This API is freeing an array of handles -- add loop control
-                    destroy_obj_code += 'HEY, NEED TO DESTROY AN ARRAY\n'
+                    # This API is freeing an array of handles
+                    allocator = 'pAllocator' if 'pAllocator' in [item.name for item in cmd_info] else 'nullptr'
+                    destroy_obj_code += '%s{\n' % indent
+                    destroy_obj_code += self.lock_guard(indent + '    ', [cmd_info[param].type])
+                    destroy_obj_code += '%s    DestroyObjects(%s, %s, %s, %s, %s, %s, %s);\n' % (indent, cmd_info[0].name, cmd_info[param].len, cmd_info[param].name, self.GetVulkanObjType(cmd_info[param].type), allocator, compatalloc_vuid, nullalloc_vuid)
+                    destroy_obj_code += '%s}\n' % indent
                 else:
                     # Call Destroy a single time
                     destroy_obj_code += '%sif (skip) return;\n' % indent
                     destroy_obj_code += '%s{\n' % indent
-                    destroy_obj_code += '%s    std::lock_guard<std::mutex> lock(global_lock);\n' % indent
+                    destroy_obj_code += self.lock_guard(indent + '    ', [cmd_info[param].type])
                     destroy_obj_code += '%s    DestroyObject(%s, %s, %s, pAllocator, %s, %s);\n' % (indent, cmd_info[0].name, cmd_info[param].name, self.GetVulkanObjType(cmd_info[param].type), compatalloc_vuid, nullalloc_vuid)
                     destroy_obj_code += '%s}\n' % indent
         return object_array, destroy_obj_code
@@ -748,16 +709,13 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
         parent_suffix = '%s-parent' % (obj_name)
         param_vuid = self.GetVuid(parent_name, param_suffix)
         parent_vuid = self.GetVuid(parent_name, parent_suffix)
+        self.validated_object_types.add(obj_type)
 
         # If no parent VUID for this member, look for a commonparent VUID
         if parent_vuid == 'kVUIDUndefined':
             parent_vuid = self.GetVuid(parent_name, 'commonparent')
         if obj_count is not None:
-            pre_call_code += '%s    for (uint32_t %s = 0; %s < %s; ++%s) {\n' % (indent, index, index, obj_count, index)
-            indent = self.incIndent(indent)
-            pre_call_code += '%s    skip |= ValidateObject(%s, %s%s[%s], %s, %s, %s, %s);\n' % (indent, disp_name, prefix, obj_name, index, self.GetVulkanObjType(obj_type), null_allowed, param_vuid, parent_vuid)
-            indent = self.decIndent(indent)
-            pre_call_code += '%s    }\n' % indent
+            pre_call_code += '%s    skip |= ValidateObjects(%s, %s, %s%s, %s, %s, %s, %s);\n' % (indent, disp_name, obj_count, prefix, obj_name, self.GetVulkanObjType(obj_type), null_allowed, param_vuid, parent_vuid)
         else:
             pre_call_code += '%s    skip |= ValidateObject(%s, %s%s, %s, %s, %s, %s);\n' % (indent, disp_name, prefix, obj_name, self.GetVulkanObjType(obj_type), null_allowed, param_vuid, parent_vuid)
         return decl_code, pre_call_code, post_call_code
@@ -850,6 +808,7 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
             param_post_code = ''
             create_func = True if create_obj_code else False
             destroy_func = True if destroy_object_code else False
+            self.validated_object_types = set()
             (paramdecl, param_pre_code, param_post_code) = self.validate_objects(cmd_info, indent, '', 0, create_func, destroy_func, destroy_array, disp_name, proto.text, True)
             param_post_code += create_obj_code
             if destroy_object_code:
@@ -859,7 +818,7 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
                     param_pre_code += destroy_object_code
             if param_pre_code:
                 if (not destroy_func) or (destroy_array):
-                    param_pre_code = '%s{\n%s%s%s%s}\n' % ('    ', indent, self.lock_guard(indent), param_pre_code, indent)
+                    param_pre_code = '%s{\n%s%s%s%s}\n' % ('    ', indent, self.lock_guard(indent, self.validated_object_types), param_pre_code, indent)
         return paramdecl, param_pre_code, param_post_code
     #
     # Capture command parameter info needed to create, destroy, and validate objects
@@ -874,7 +833,7 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
             len = self.getLen(member)
             if len:
                 lens.add(len)
-        struct_member_dict = dict(self.structMembers)
+        struct_member_dict = self.struct_member_dict
         # Generate member info
         membersInfo = []
         constains_extension_structs = False
@@ -935,7 +894,7 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
                 self.appendSection('command', '')
                 self.appendSection('command', '// Declare only')
                 self.appendSection('command', decls[0])
-                self.intercepts += [ '    {"%s", (void *)%s},' % (cmdname,cmdname[2:]) ]
+                self.intercepts += [ (cmdname, cmdname[2:], None) ]
                 continue
             # Generate object handling code
             (api_decls, api_pre, api_post) = self.generate_wrapping_code(cmdinfo.elem)
@@ -946,9 +905,8 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
             if (feature_extra_protect != None):
                 self.appendSection('command', '')
                 self.appendSection('command', '#ifdef '+ feature_extra_protect)
-                self.intercepts += [ '#ifdef %s' % feature_extra_protect ]
             # Add intercept to procmap
-            self.intercepts += [ '    {"%s", (void*)%s},' % (cmdname,cmdname[2:]) ]
+            self.intercepts += [ (cmdname, cmdname[2:], feature_extra_protect) ]
             decls = self.makeCDecls(cmdinfo.elem)
             self.appendSection('command', '')
             self.appendSection('command', decls[0][:-1])
@@ -996,4 +954,3 @@ class ObjectTrackerOutputGenerator(OutputGenerator):
             self.appendSection('command', '}')
             if (feature_extra_protect != None):
                 self.appendSection('command', '#endif // '+ feature_extra_protect)
-                self.intercepts += [ '#endif' ]
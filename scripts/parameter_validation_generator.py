@@ -26,6 +26,7 @@ import xml.etree.ElementTree as etree
 from generator import *
 from collections import namedtuple
 from common_codegen import *
+from valid_usage import LoadValidUsage
 
 # This is a workaround to use a Python 2.7 and 3.x compatible syntax.
 from io import open
@@ -167,7 +168,8 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         self.validatedStructs = dict()                    # Map of structs type names to generated validation code for that struct type
         self.enumRanges = dict()                          # Map of enum name to BEGIN/END range values
         self.enumValueLists = ''                          # String containing enumerated type map definitions
-        self.func_pointers = ''                           # String containing function pointers for manual PV functions
+        self.func_pointers = ''                           # String containing name to ID map entries for manual PV functions
+        self.custom_function_ids = ''                     # String containing the IDs of the manual PV function pointers
         self.typedefs = ''                                # String containing function pointer typedefs
         self.flags = set()                                # Map of flags typenames
         self.flagBits = dict()                            # Map of flag bits typename to list of values
@@ -176,7 +178,6 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         self.extension_type = ''                          # Type of active feature (extension), device or instance
         self.extension_names = dict()                     # Dictionary of extension names to extension name defines
         self.valid_vuids = set()                          # Set of all valid VUIDs
-        self.vuid_dict = dict()                           # VUID dictionary (from JSON)
         self.alias_dict = dict()                          # Dict of cmd|struct aliases
         # Named tuples to store struct and command data
         self.StructType = namedtuple('StructType', ['name', 'value'])
@@ -227,39 +228,21 @@ class ParameterValidationOutputGenerator(OutputGenerator):
             return indent[:-self.INDENT_SPACES]
         return ''
     #
-    # Walk the JSON-derived dict and find all "vuid" key values
-    def ExtractVUIDs(self, d):
-        if hasattr(d, 'items'):
-            for k, v in d.items():
-                if k == "vuid":
-                    yield v
-                elif isinstance(v, dict):
-                    for s in self.ExtractVUIDs(v):
-                        yield s
-                elif isinstance (v, list):
-                    for l in v:
-                        for s in self.ExtractVUIDs(l):
-                            yield s
-    #
     # Called at file creation time
     def beginFile(self, genOpts):
         OutputGenerator.beginFile(self, genOpts)
 
         self.valid_usage_path = genOpts.valid_usage_path
         vu_json_filename = os.path.join(self.valid_usage_path + os.sep, 'validusage.json')
-        if os.path.isfile(vu_json_filename):
-            json_file = open(vu_json_filename, 'r')
-            self.vuid_dict = json.load(json_file)
-            json_file.close()
-        if len(self.vuid_dict) == 0:
+        valid_usage = LoadValidUsage(vu_json_filename)
+        if valid_usage is None or len(valid_usage.vuids) == 0:
             print("Error: Could not find, or error loading %s/validusage.json\n", vu_json_filename)
             sys.exit(1)
 
         # C-specific
         #
-        # Build a set of all vuid text strings found in validusage.json
-        for json_vuid_string in self.ExtractVUIDs(self.vuid_dict):
-            self.valid_vuids.add(json_vuid_string)
+        # Set of all vuid text strings found in validusage.json
+        self.valid_vuids = valid_usage.vuids
         #
         # User-supplied prefix text, if any (list of strings)
         s = self.GenerateCopyright()
@@ -289,7 +272,10 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         self.newline()
         #
         # FuncPtrMap
-        self.func_pointers += 'std::unordered_map<std::string, void *> custom_functions = {\n'
+        self.custom_function_ids += '// Manual validation functions are called through custom_functions, indexed by command ID. The name to ID map is\n'
+        self.custom_function_ids += '// only used to register them, once, from InitializeManualParameterValidationFunctionPointers().\n'
+        self.custom_function_ids += 'enum CustomFunctionId {\n'
+        self.func_pointers += 'const std::unordered_map<std::string, CustomFunctionId> custom_function_ids = {\n'
     #
     # Called at end-time for final content output
     def endFile(self):
@@ -299,7 +285,20 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         self.newline()
         write(self.typedefs, file=self.outFile)
         self.newline()
+        self.custom_function_ids += '    kCustomFunctionCount\n'
+        self.custom_function_ids += '};\n'
+        self.custom_function_ids += '\n'
+        self.custom_function_ids += 'void *custom_functions[kCustomFunctionCount] = {};\n'
+        write(self.custom_function_ids, file=self.outFile)
+        self.newline()
         self.func_pointers += '};\n'
+        self.func_pointers += '\n'
+        self.func_pointers += 'void SetCustomFunction(const std::string &name, void *function) {\n'
+        self.func_pointers += '    auto id = custom_function_ids.find(name);\n'
+        self.func_pointers += '    if (id != custom_function_ids.end()) {\n'
+        self.func_pointers += '        custom_functions[id->second] = function;\n'
+        self.func_pointers += '    }\n'
+        self.func_pointers += '}\n'
         write(self.func_pointers, file=self.outFile)
         self.newline()
         ext_template  = 'template <typename T>\n'
@@ -316,10 +315,7 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         # Output declarations and record intercepted procedures
         write('// Declarations', file=self.outFile)
         write('\n'.join(self.declarations), file=self.outFile)
-        write('// Map of all APIs to be intercepted by this layer', file=self.outFile)
-        write('const std::unordered_map<std::string, void*> name_to_funcptr_map = {', file=self.outFile)
-        write('\n'.join(self.intercepts), file=self.outFile)
-        write('};\n', file=self.outFile)
+        write('\n'.join(FunctionPointerTableLines(self.intercepts)), file=self.outFile)
         self.newline()
         # Namespace
         write('} // namespace parameter_validation', file = self.outFile)
@@ -526,14 +522,42 @@ class ParameterValidationOutputGenerator(OutputGenerator):
             isEnum = ('FLAG_BITS' not in expandPrefix)
             if isEnum:
                 self.enumRanges[groupName] = (expandPrefix + '_BEGIN_RANGE' + expandSuffix, expandPrefix + '_END_RANGE' + expandSuffix)
-                # Create definition for a list containing valid enum values for this enumerated type
-                enum_entry = 'const std::vector<%s> All%sEnums = {' % (groupName, groupName)
+                # Create the table of valid enum values for this enumerated type
+                values = dict()
                 for enum in groupElem:
                     name = enum.get('name')
                     if name is not None and enum.get('supported') != 'disabled':
-                        enum_entry += '%s, ' % name
-                enum_entry += '};\n'
-                self.enumValueLists += enum_entry
+                        (numVal, strVal) = self.enumToValue(enum, True)
+                        # Aliases have no value of their own
+                        if numVal is not None and numVal not in values:
+                            values[numVal] = name
+                self.enumValueLists += self.makeRangedEnumValues(groupName, values)
+    #
+    # Generate the RangedEnumValues table for an enumerated type from a dict of its values to their names. The longest
+    # run of consecutive values, normally the core values, is checked as a range; the remaining values, normally those
+    # added by extensions, go to a sorted array for a binary search.
+    def makeRangedEnumValues(self, groupName, values):
+        sorted_values = sorted(values)
+        (dense_begin, dense_end) = (0, 0)
+        run_begin = 0
+        for i in range(1, len(sorted_values) + 1):
+            if i == len(sorted_values) or sorted_values[i] != sorted_values[i - 1] + 1:
+                if i - run_begin > dense_end - dense_begin:
+                    (dense_begin, dense_end) = (run_begin, i)
+                run_begin = i
+        sparse_values = [values[value] for value in sorted_values[:dense_begin] + sorted_values[dense_end:]]
+        table = ''
+        if sparse_values:
+            table += 'static constexpr %s %sSparseValues[] = {%s};\n' % (groupName, groupName, ', '.join(sparse_values))
+            sparse = '%sSparseValues, %d' % (groupName, len(sparse_values))
+        else:
+            sparse = 'nullptr, 0'
+        if dense_end > dense_begin:
+            dense = '%s, %s + 1' % (values[sorted_values[dense_begin]], values[sorted_values[dense_end - 1]])
+        else:
+            dense = '0, 0'
+        table += 'const RangedEnumValues<%s> All%sEnums = {%s, %s};\n' % (groupName, groupName, dense, sparse)
+        return table
     #
     # Capture command parameter info to be used for param check code generation.
     def genCmd(self, cmdinfo, name, alias):
@@ -547,21 +571,22 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         if name not in self.blacklist:
             if (self.featureExtraProtect != None):
                 self.declarations += [ '#ifdef %s' % self.featureExtraProtect ]
-                self.intercepts += [ '#ifdef %s' % self.featureExtraProtect ]
                 if (name not in self.validate_only):
                     self.func_pointers += '#ifdef %s\n' % self.featureExtraProtect
+                    self.custom_function_ids += '#ifdef %s\n' % self.featureExtraProtect
                     self.typedefs += '#ifdef %s\n' % self.featureExtraProtect
             if (name not in self.validate_only):
                 self.typedefs += 'typedef bool (*PFN_manual_%s)%s\n' % (name, typedef)
-                self.func_pointers += '    {"%s", nullptr},\n' % name
-            self.intercepts += [ '    {"%s", (void*)%s},' % (name,name) ]
+                self.func_pointers += '    {"%s", kCustomFunction_%s},\n' % (name, name)
+                self.custom_function_ids += '    kCustomFunction_%s,\n' % name
+            self.intercepts += [ (name, name, self.featureExtraProtect) ]
             # Strip off 'vk' from API name
             self.declarations += [ '%s' % decls[0].replace("VKAPI_CALL vk", "VKAPI_CALL ") ]
             if (self.featureExtraProtect != None):
-                self.intercepts += [ '#endif' ]
                 self.declarations += [ '#endif' ]
                 if (name not in self.validate_only):
                     self.func_pointers += '#endif\n'
+                    self.custom_function_ids += '#endif\n'
                     self.typedefs += '#endif\n'
         if name not in self.blacklist:
             params = cmdinfo.elem.findall('param')
@@ -1170,12 +1195,11 @@ class ParameterValidationOutputGenerator(OutputGenerator):
                 for ext in self.required_extensions[command.name]:
                     ext_name_define = ''
                     ext_enable_name = ''
-                    for extension in self.registry.extensions:
-                        if extension.attrib['name'] == ext:
-                            ext_name_define = extension[0][1].get('name')
-                            ext_enable_name = ext_name_define.lower()
-                            ext_enable_name = re.sub('_extension_name', '', ext_enable_name)
-                            break
+                    extension = GetRegistryIndex(self.registry).extensions.get(ext)
+                    if extension is not None:
+                        ext_name_define = extension.nameDefine
+                        ext_enable_name = ext_name_define.lower()
+                        ext_enable_name = re.sub('_extension_name', '', ext_enable_name)
                     ext_test = 'if (!local_data->extensions.%s) skip |= OutputExtensionError(local_data, "%s", %s);\n' % (ext_enable_name, command.name, ext_name_define)
                     lines.insert(0, ext_test)
             if lines:
@@ -1228,7 +1252,7 @@ class ParameterValidationOutputGenerator(OutputGenerator):
                         params_text += '%s, ' % param.name
                     params_text = params_text[:-2]
                     # Generate call to manual function if its function pointer is non-null
-                    cmdDef += '%sPFN_manual_%s custom_func = (PFN_manual_%s)custom_functions["%s"];\n' % (indent, command.name, command.name, command.name)
+                    cmdDef += '%sPFN_manual_%s custom_func = (PFN_manual_%s)custom_functions[kCustomFunction_%s];\n' % (indent, command.name, command.name, command.name)
                     cmdDef += '%sif (custom_func != nullptr) {\n' % indent
                     cmdDef += '    %sskip |= custom_func(%s);\n' % (indent, params_text)
                     cmdDef += '%s}\n\n' % indent
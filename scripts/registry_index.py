@@ -0,0 +1,139 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2015-2018 The Khronos Group Inc.
+# Copyright (c) 2015-2018 Valve Corporation
+# Copyright (c) 2015-2018 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import namedtuple
+
+# Per-extension metadata: the <extension> element, its 'type' attribute (instance/device) and the name of its
+# VK_*_EXTENSION_NAME define
+ExtensionData = namedtuple('ExtensionData', ['elem', 'type', 'nameDefine'])
+
+#
+# Lookup tables over a loaded registry, replacing XPath queries and linear scans of registry.tree. The index is built
+# once per registry by GetRegistryIndex() and then shared by every generator run against that registry.
+class RegistryIndex:
+    def __init__(self, registry):
+        self.tree = registry.tree
+        self.handleTypes = {}          # Handle name -> VK_DEFINE_HANDLE or VK_DEFINE_NON_DISPATCHABLE_HANDLE
+        self.typeCategories = {}       # Type name -> 'category' attribute of its <type> element
+        self.structMembers = {}        # Struct or union name -> list of its <member> elements
+        self.structMemberTypes = {}    # Struct or union name -> list of the type names of its members
+        self.aliases = {}              # Aliased type or command name -> name of the type or command it aliases
+        self.extensions = {}           # Extension name -> ExtensionData
+
+        for elem in self.tree.findall('types/type'):
+            name_elem = elem.find('name')
+            name = name_elem.text if name_elem is not None else elem.get('name')
+            category = elem.get('category')
+            # Keep the first definition of each name, as a document-order search would find
+            if name not in self.typeCategories:
+                self.typeCategories[name] = category
+            alias = elem.get('alias')
+            if alias is not None:
+                self.aliases[elem.get('name')] = alias
+            elif category == 'handle' and name_elem is not None and name not in self.handleTypes:
+                # Aliased handles have no <name> child and so are not handles for the purposes of the generators
+                self.handleTypes[name] = elem.find('type').text
+            elif category in ('struct', 'union') and name not in self.structMembers:
+                self.structMembers[name] = elem.findall('.//member')
+                self.structMemberTypes[name] = [member.find('type').text for member in self.structMembers[name]]
+
+        for elem in self.tree.findall('commands/command'):
+            alias = elem.get('alias')
+            if alias is not None:
+                self.aliases[elem.get('name')] = alias
+
+        for elem in registry.extensions:
+            name_define = None
+            if len(elem) > 0 and len(elem[0]) > 1:
+                name_define = elem[0][1].get('name')
+            self.extensions[elem.get('name')] = ExtensionData(elem, elem.get('type'), name_define)
+
+        # Memoized results of structContains(), one dict per set of handle kinds
+        self.structContainsResults = {}
+    #
+    # Return True if typename is a dispatchable or non-dispatchable handle
+    def isHandle(self, typename):
+        return typename in self.handleTypes
+    #
+    # Return True if typename is a dispatchable handle
+    def isDispatchableHandle(self, typename):
+        return self.handleTypes.get(typename) == 'VK_DEFINE_HANDLE'
+    #
+    # Return True if typename is a non-dispatchable handle
+    def isNonDispatchableHandle(self, typename):
+        return self.handleTypes.get(typename) == 'VK_DEFINE_NON_DISPATCHABLE_HANDLE'
+    #
+    # Return the category of a type, or None if it has none
+    def typeCategory(self, typename):
+        return self.typeCategories.get(typename)
+    #
+    # Return True if a struct or union has a handle member, either directly or in an embedded struct at any depth
+    def structContainsHandle(self, typename):
+        return self.structContains(typename, ('VK_DEFINE_HANDLE', 'VK_DEFINE_NON_DISPATCHABLE_HANDLE'))
+    #
+    # Return True if a struct or union has a dispatchable handle member, either directly or in an embedded struct
+    def structContainsDispatchableHandle(self, typename):
+        return self.structContains(typename, ('VK_DEFINE_HANDLE',))
+    #
+    # Return True if a struct or union has a non-dispatchable handle member, either directly or in an embedded struct
+    def structContainsNonDispatchableHandle(self, typename):
+        return self.structContains(typename, ('VK_DEFINE_NON_DISPATCHABLE_HANDLE',))
+    #
+    # Return True if a struct or union transitively contains a handle of one of the given kinds. Each struct is only
+    # ever searched once per set of kinds; later queries, from this or any other generator, are dictionary lookups.
+    def structContains(self, typename, handle_kinds):
+        results = self.structContainsResults.setdefault(handle_kinds, {})
+        if typename not in results:
+            self.searchStruct(typename, handle_kinds, results, set())
+        return results[typename]
+    #
+    # Depth-first search behind structContains(). A struct that refers back to one still being searched (e.g. through
+    # a pNext pointer) cannot add anything to that search, so the reference is skipped. A negative result that relied
+    # on skipping a struct other than typename itself is provisional and is not memoized. Returns whether a handle was
+    # found, and the structs still being searched that a negative result depends on.
+    def searchStruct(self, typename, handle_kinds, results, searching):
+        searching.add(typename)
+        found = False
+        pending = set()
+        for member_type in self.structMemberTypes.get(typename, []):
+            if self.handleTypes.get(member_type) in handle_kinds:
+                found = True
+            elif member_type in results:
+                found = results[member_type]
+            elif member_type in searching:
+                pending.add(member_type)
+            elif member_type in self.structMemberTypes:
+                (found, member_pending) = self.searchStruct(member_type, handle_kinds, results, searching)
+                pending |= member_pending
+            if found:
+                break
+        searching.remove(typename)
+        pending.discard(typename)
+        if found or not pending:
+            results[typename] = found
+            pending = set()
+        return (found, pending)
+
+#
+# Return the index for a registry, building it on first use
+def GetRegistryIndex(registry):
+    index = getattr(registry, 'registryIndex', None)
+    if index is None or index.tree is not registry.tree:
+        index = RegistryIndex(registry)
+        registry.registryIndex = index
+    return index
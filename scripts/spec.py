@@ -8,6 +8,7 @@ except ImportError:
 from bs4 import BeautifulSoup
 import json
 import vuid_mapping
+import valid_usage
 import re
 
 #############################
@@ -106,47 +107,43 @@ class Specification:
     def readJSON(self):
         """Read in JSON file"""
         if json_filename is not None:
-            with open(json_filename) as jsf:
-                self.json_data = json.load(jsf, encoding='utf-8')
+            self.valid_usage = valid_usage.LoadValidUsage(json_filename)
+            if self.valid_usage is None:
+                print ("ERROR: Could not find json file %s" % (json_filename))
+                sys.exit(1)
         else:
             response = urllib2.urlopen(json_url).read().decode('utf-8')
-            self.json_data = json.loads(response)
+            self.valid_usage = valid_usage.ParseValidUsage(response)
 
     def parseJSON(self):
         """Parse JSON VUIDs into data struct"""
         # Format of JSON file is:
         # "API": { "core|EXT": [ {"vuid": "<id>", "text": "<VU txt>"}]},
         # "VK_KHX_external_memory" & "VK_KHX_device_group" - extension case (vs. "core")
-        for top_level in sorted(self.json_data):
-            if "validation" == top_level:
-                for api in sorted(self.json_data[top_level]):
-                    for ext in sorted(self.json_data[top_level][api]):
-                        for vu_txt_dict in self.json_data[top_level][api][ext]:
-                            print ("Looking at dict for api:ext entry %s:%s" % (api, ext))
-                            vuid = vu_txt_dict['vuid']
-                            vutxt = vu_txt_dict['text']
-                            # strip asciidoc xref from vu text
-                            vutxt = re.sub('&amp;amp;lt;&amp;amp;lt;([^&]*,\\s*|)(.*?)&amp;amp;gt;&amp;amp;gt;', '\\2', vutxt)
-                            #print ("%s:%s:%s:%s" % (api, ext, vuid, vutxt))
-                            #print ("VUTXT orig:%s" % (vutxt))
-                            just_txt = BeautifulSoup(vutxt, 'html.parser')
-                            #print ("VUTXT only:%s" % (just_txt.get_text()))
-                            num_vuid = vuid_mapping.convertVUID(vuid)
-                            self.json_db[vuid] = {}
-                            self.json_db[vuid]['ext'] = ext
-                            self.json_db[vuid]['number_vuid'] = num_vuid
-                            self.json_db[vuid]['struct_func'] = api
-                            just_txt = just_txt.get_text().strip()
-                            unicode_map = {
-                            u"\u2019" : "'",
-                            u"\u201c" : "\"",
-                            u"\u201d" : "\"",
-                            u"\u2192" : "->",
-                            }
-                            for um in unicode_map:
-                                just_txt = just_txt.replace(um, unicode_map[um])
-                            self.json_db[vuid]['vu_txt'] = just_txt.replace("\\", "")
-                            print ("Spec vu txt:%s" % (self.json_db[vuid]['vu_txt']))
+        for (api, ext, vuid, vutxt) in sorted(self.valid_usage.statements(), key=lambda statement: statement[0:2]):
+            print ("Looking at dict for api:ext entry %s:%s" % (api, ext))
+            # strip asciidoc xref from vu text
+            vutxt = re.sub('&amp;amp;lt;&amp;amp;lt;([^&]*,\\s*|)(.*?)&amp;amp;gt;&amp;amp;gt;', '\\2', vutxt)
+            #print ("%s:%s:%s:%s" % (api, ext, vuid, vutxt))
+            #print ("VUTXT orig:%s" % (vutxt))
+            just_txt = BeautifulSoup(vutxt, 'html.parser')
+            #print ("VUTXT only:%s" % (just_txt.get_text()))
+            num_vuid = vuid_mapping.convertVUID(vuid)
+            self.json_db[vuid] = {}
+            self.json_db[vuid]['ext'] = ext
+            self.json_db[vuid]['number_vuid'] = num_vuid
+            self.json_db[vuid]['struct_func'] = api
+            just_txt = just_txt.get_text().strip()
+            unicode_map = {
+            u"\u2019" : "'",
+            u"\u201c" : "\"",
+            u"\u201d" : "\"",
+            u"\u2192" : "->",
+            }
+            for um in unicode_map:
+                just_txt = just_txt.replace(um, unicode_map[um])
+            self.json_db[vuid]['vu_txt'] = just_txt.replace("\\", "")
+            print ("Spec vu txt:%s" % (self.json_db[vuid]['vu_txt']))
         #sys.exit()
 
     def compareJSON(self):
@@ -187,6 +184,14 @@ class Specification:
                 print ("WARN: Couldn't find vuid_string in json db:%s" % (vuid))
                 del self.error_db_dict[enum]
 
+    def splitErrorMsg(self, error_msg, vuid, spec_urls):
+        """Split an error message into its valid usage text and the index of its spec URL in spec_urls, or return the
+           whole message and -1 if it is not of the form generated by parseJSON"""
+        for index, url in enumerate(spec_urls):
+            suffix = "' (%s#%s)" % (url, vuid)
+            if error_msg.startswith(error_msg_prefix + "'") and error_msg.endswith(suffix):
+                return (error_msg[len(error_msg_prefix) + 1:-len(suffix)], index)
+        return (error_msg, -1)
     def genHeader(self, header_file):
         """Generate a header file based on the contents of a parsed spec"""
         print ("Generating header %s..." % (header_file))
@@ -195,42 +200,103 @@ class Specification:
         file_contents.append('\n#pragma once')
         file_contents.append('\n// Disable auto-formatting for generated file')
         file_contents.append('// clang-format off')
-        file_contents.append('\n#include <string>')
-        file_contents.append('#include <unordered_map>')
+        file_contents.append('\n#include <algorithm>')
+        file_contents.append('#include <cstring>')
+        file_contents.append('#include <cstdint>')
+        file_contents.append('#include <iterator>')
+        file_contents.append('#include <string>')
         file_contents.append('\n// enum values for unique validation error codes')
         file_contents.append('//  Corresponding validation error message for each enum is given in the mapping table below')
         file_contents.append('//  When a given error occurs, these enum values should be passed to the as the messageCode')
         file_contents.append('//  parameter to the PFN_vkDebugReportCallbackEXT function')
         enum_decl = ['enum UNIQUE_VALIDATION_ERROR_CODE {\n    VALIDATION_ERROR_UNDEFINED = -1,']
-        vuid_int_to_error_map_decl = 'std::unordered_map<int, char const *const> validation_error_map'
-        vuid_int_to_error_map = [ '#ifdef VALIDATION_ERROR_MAP_IMPL', vuid_int_to_error_map_decl + ' {']
-        vuid_string_to_error_map_decl = 'std::unordered_map<std::string, int> validation_error_text_map'
-        vuid_string_to_error_map = [ '#ifdef VALIDATION_ERROR_MAP_IMPL', vuid_string_to_error_map_decl + ' {']
-        enum_value = 0
+        # The tables are constant-initialized so that loading a layer does not build them on the heap. Messages are
+        # stored in pieces, with the prefix and spec URLs shared by every message stored only once, and are only
+        # assembled when an error is reported.
+        spec_urls = [core_url, ext_url]
+        error_codes = sorted(self.error_db_dict, key=lambda enum: int(enum[-8:], 16))
+        vuid_int_to_error_map = ['constexpr ValidationErrorMessage validation_error_map[] = {']
         max_enum_val = 0
-        for enum in sorted(self.error_db_dict):
+        vuid_indices = {}
+        for index, enum in enumerate(error_codes):
             enum_decl.append('    %s = 0x%s,' % (enum, enum[-8:]))
-            vuid_int_to_error_map.append('    {%s, "%s"},' % (enum, self.error_db_dict[enum]['error_msg'].replace('"', '\\"')))
             vuid_str = self.error_db_dict[enum]['vuid_string']
-            vuid_string_to_error_map.append('    {"%s", %s},' % (vuid_str, enum))
-            max_enum_val = max(max_enum_val, enum_value)
+            (text, spec_url) = self.splitErrorMsg(self.error_db_dict[enum]['error_msg'], vuid_str, spec_urls)
+            vuid_int_to_error_map.append('    {%s, "%s", "%s", %d},' % (enum, vuid_str, text.replace('"', '\\"'), spec_url))
+            vuid_indices.setdefault(vuid_str, index)
+        vuid_int_to_error_map.append('};')
         enum_decl.append('    %sMAX_ENUM = %d,' % (validation_error_enum_name, max_enum_val + 1))
         enum_decl.append('};')
-        vuid_int_to_error_map.extend([
-            '};',
-            '#else',
-            'extern ' + vuid_int_to_error_map_decl + ';',
-            '#endif\n'])
-        vuid_string_to_error_map.extend([
+        # Indices into validation_error_map sorted bytewise by VUID string, as strcmp() compares, so that the VUID
+        # strings are not stored a second time
+        index_type = 'uint16_t' if len(error_codes) <= 0xffff else 'uint32_t'
+        vuid_string_to_error_map = ['constexpr %s validation_error_vuid_order[] = {' % index_type]
+        for vuid_str in sorted(vuid_indices, key=lambda vuid_str: vuid_str.encode('utf-8')):
+            vuid_string_to_error_map.append('    %d,  // %s' % (vuid_indices[vuid_str], vuid_str))
+        vuid_string_to_error_map.append('};')
+        lookup_decl = [
+            'struct ValidationErrorMessage {',
+            '    int error_code;',
+            '    char const *vuid;',
+            '    char const *text;  // Valid usage text, or the complete message if spec_url is -1',
+            '    int spec_url;      // Index into validation_error_spec_urls',
             '};',
-            '#else',
-            'extern ' + vuid_string_to_error_map_decl + ';',
-            '#endif\n'])
+            '',
+            '// Return the spec text for a validation error enum, or an empty string if there is none',
+            'std::string GetValidationErrorMessage(int error_code);',
+            '// Return the validation error enum for a spec VUID string, or VALIDATION_ERROR_UNDEFINED if there is none',
+            'int GetValidationErrorCode(char const *vuid);']
+        shared_pieces = [
+            '// Text shared by the spec text of every validation error',
+            'constexpr char const validation_error_msg_prefix[] = "%s";' % error_msg_prefix,
+            'constexpr char const *validation_error_spec_urls[] = {']
+        shared_pieces.extend('    "%s",' % url for url in spec_urls)
+        shared_pieces.append('};')
+        lookup_impl = [
+            'std::string GetValidationErrorMessage(int error_code) {',
+            '    auto begin = std::begin(validation_error_map);',
+            '    auto end = std::end(validation_error_map);',
+            '    auto it = std::lower_bound(begin, end, error_code,',
+            '                               [](const ValidationErrorMessage &entry, int key) { return entry.error_code < key; });',
+            '    if (it == end || it->error_code != error_code) {',
+            '        return std::string();',
+            '    }',
+            '    if (it->spec_url < 0) {',
+            '        return it->text;',
+            '    }',
+            '    std::string message(validation_error_msg_prefix);',
+            '    message += "\'";',
+            '    message += it->text;',
+            '    message += "\' (";',
+            '    message += validation_error_spec_urls[it->spec_url];',
+            '    message += "#";',
+            '    message += it->vuid;',
+            '    message += ")";',
+            '    return message;',
+            '}',
+            '',
+            'int GetValidationErrorCode(char const *vuid) {',
+            '    auto begin = std::begin(validation_error_vuid_order);',
+            '    auto end = std::end(validation_error_vuid_order);',
+            '    auto it = std::lower_bound(begin, end, vuid,',
+            '                               [](uint32_t index, char const *key) { return strcmp(validation_error_map[index].vuid, key) < 0; });',
+            '    if (it == end || strcmp(validation_error_map[*it].vuid, vuid) != 0) {',
+            '        return VALIDATION_ERROR_UNDEFINED;',
+            '    }',
+            '    return validation_error_map[*it].error_code;',
+            '}',
+            '#endif\n']
         file_contents.extend(enum_decl)
-        file_contents.append('\n// Mapping from unique validation error enum to the corresponding spec text')
+        file_contents.append('\n// Lookups into the tables below')
+        file_contents.extend(lookup_decl)
+        file_contents.append('\n#ifdef VALIDATION_ERROR_MAP_IMPL')
+        file_contents.extend(shared_pieces)
+        file_contents.append('\n// Mapping from unique validation error enum to the corresponding VUID string and spec text')
         file_contents.extend(vuid_int_to_error_map)
         file_contents.append('\n// Mapping from spec validation error text string to unique validation error enum')
         file_contents.extend(vuid_string_to_error_map)
+        file_contents.append('')
+        file_contents.extend(lookup_impl)
         #print ("File contents: %s" % (file_contents))
         with open(header_file, "w") as outfile:
             outfile.write("\n".join(file_contents))
@@ -335,6 +401,9 @@ if __name__ == "__main__":
     spec = Specification()
     spec.readJSON()
     spec.parseJSON()
+    # Distinct VUIDs sharing a numerical value would share a database entry and error enum
+    for problem in vuid_mapping.checkVUIDs(sorted(spec.json_db)):
+        print ("WARN: %s" % (vuid_mapping.describeVUIDProblem(problem)))
     if (json_compare):
         # Read in current spec info from db file
         (orig_err_msg_dict) = spec.readDB(db_filename)
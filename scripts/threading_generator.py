@@ -142,19 +142,11 @@ class ThreadOutputGenerator(OutputGenerator):
 
     # Check if an object is a non-dispatchable handle
     def isHandleTypeNonDispatchable(self, handletype):
-        handle = self.registry.tree.find("types/type/[name='" + handletype + "'][@category='handle']")
-        if handle is not None and handle.find('type').text == 'VK_DEFINE_NON_DISPATCHABLE_HANDLE':
-            return True
-        else:
-            return False
+        return GetRegistryIndex(self.registry).isNonDispatchableHandle(handletype)
 
     # Check if an object is a dispatchable handle
     def isHandleTypeDispatchable(self, handletype):
-        handle = self.registry.tree.find("types/type/[name='" + handletype + "'][@category='handle']")
-        if handle is not None and handle.find('type').text == 'VK_DEFINE_HANDLE':
-            return True
-        else:
-            return False
+        return GetRegistryIndex(self.registry).isDispatchableHandle(handletype)
 
     def makeThreadUseBlock(self, cmd, functionprefix):
         """Generate C function pointer typedef for <command> Element"""
@@ -169,9 +161,8 @@ class ThreadOutputGenerator(OutputGenerator):
                 externsync = param.attrib.get('externsync')
                 if externsync == 'true':
                     if self.paramIsArray(param):
-                        paramdecl += '    for (uint32_t index=0;index<' + param.attrib.get('len') + ';index++) {\n'
-                        paramdecl += '        ' + functionprefix + 'WriteObject(my_data, ' + paramname.text + '[index]);\n'
-                        paramdecl += '    }\n'
+                        param_len = str(param.attrib.get('len')).replace("::", "->")
+                        paramdecl += '    ' + functionprefix + 'WriteObjects(my_data, ' + param_len + ', ' + paramname.text + ');\n'
                     else:
                         paramdecl += '    ' + functionprefix + 'WriteObject(my_data, ' + paramname.text + ');\n'
                 elif (param.attrib.get('externsync')):
@@ -215,9 +206,7 @@ class ThreadOutputGenerator(OutputGenerator):
                                     if self.paramIsPointer(candidate):
                                         dereference = '*'
                             param_len = str(param.attrib.get('len')).replace("::", "->")
-                            paramdecl += '    for (uint32_t index = 0; index < ' + dereference + param_len + '; index++) {\n'
-                            paramdecl += '        ' + functionprefix + 'ReadObject(my_data, ' + paramname.text + '[index]);\n'
-                            paramdecl += '    }\n'
+                            paramdecl += '    ' + functionprefix + 'ReadObjects(my_data, ' + dereference + param_len + ', ' + paramname.text + ');\n'
                         elif not self.paramIsPointer(param):
                             # Pointer params are often being created.
                             # They are not being read from.
@@ -273,10 +262,7 @@ class ThreadOutputGenerator(OutputGenerator):
         # Finish C++ namespace and multiple inclusion protection
         self.newline()
         # record intercepted procedures
-        write('// Map of all APIs to be intercepted by this layer', file=self.outFile)
-        write('static const std::unordered_map<std::string, void*> name_to_funcptr_map = {', file=self.outFile)
-        write('\n'.join(self.intercepts), file=self.outFile)
-        write('};\n', file=self.outFile)
+        write('\n'.join(FunctionPointerTableLines(self.intercepts, 'static ')), file=self.outFile)
         self.newline()
         write('} // namespace threading', file=self.outFile)
         if (self.genOpts.protectFile and self.genOpts.filename):
@@ -392,7 +378,7 @@ class ThreadOutputGenerator(OutputGenerator):
             self.appendSection('command', '')
             self.appendSection('command', '// declare only')
             self.appendSection('command', decls[0])
-            self.intercepts += [ '    {"%s", (void*)%s},' % (name,name[2:]) ]
+            self.intercepts += [ (name, name[2:], None) ]
             return
         if "QueuePresentKHR" in name or (("DebugMarker" in name or "DebugUtilsObject" in name) and "EXT" in name):
             self.appendSection('command', '// TODO - not wrapping EXT function ' + name)
@@ -403,11 +389,7 @@ class ThreadOutputGenerator(OutputGenerator):
             return
         finishthreadsafety = self.makeThreadUseBlock(cmdinfo.elem, 'finish')
         # record that the function will be intercepted
-        if (self.featureExtraProtect != None):
-            self.intercepts += [ '#ifdef %s' % self.featureExtraProtect ]
-        self.intercepts += [ '    {"%s", (void*)%s},' % (name,name[2:]) ]
-        if (self.featureExtraProtect != None):
-            self.intercepts += [ '#endif' ]
+        self.intercepts += [ (name, name[2:], self.featureExtraProtect) ]
 
         OutputGenerator.genCmd(self, cmdinfo, name, alias)
         #
@@ -227,8 +227,6 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
     # Now that the data is all collected and complete, generate and output the wrapping/unwrapping routines
     def endFile(self):
 
-        self.struct_member_dict = dict(self.structMembers)
-
         # Generate the list of APIs that might need to handle wrapped extension structs
         self.GenerateCommandWrapExtensionList()
         # Write out wrapping/unwrapping functions
@@ -253,10 +251,7 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                 self.newline()
 
         # Record intercepted procedures
-        write('// Map of all APIs to be intercepted by this layer', file=self.outFile)
-        write('static const std::unordered_map<std::string, void*> name_to_funcptr_map = {', file=self.outFile)
-        write('\n'.join(self.intercepts), file=self.outFile)
-        write('};\n', file=self.outFile)
+        write('\n'.join(FunctionPointerTableLines(self.intercepts, 'static ')), file=self.outFile)
         self.newline()
         write('} // namespace unique_objects', file=self.outFile)
         # Finish processing in superclass
@@ -308,18 +303,11 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
     #
     # Get the category of a type
     def getTypeCategory(self, typename):
-        types = self.registry.tree.findall("types/type")
-        for elem in types:
-            if (elem.find("name") is not None and elem.find('name').text == typename) or elem.attrib.get('name') == typename:
-                return elem.attrib.get('category')
+        return GetRegistryIndex(self.registry).typeCategory(typename)
     #
     # Check if a parent object is dispatchable or not
     def isHandleTypeNonDispatchable(self, handletype):
-        handle = self.registry.tree.find("types/type/[name='" + handletype + "'][@category='handle']")
-        if handle is not None and handle.find('type').text == 'VK_DEFINE_NON_DISPATCHABLE_HANDLE':
-            return True
-        else:
-            return False
+        return GetRegistryIndex(self.registry).isNonDispatchableHandle(handletype)
     #
     # Retrieve the type and name for a parameter
     def getTypeNameTuple(self, param):
@@ -406,24 +394,12 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                                                  isdestroy=False,
                                                  feature_protect=self.featureExtraProtect))
         self.structMembers.append(self.StructMemberData(name=typeName, members=membersInfo))
+        self.struct_member_dict[typeName] = membersInfo
 
     #
-    # Insert a lock_guard line
-    def lock_guard(self, indent):
-        return '%sstd::lock_guard<std::mutex> lock(global_lock);\n' % indent
-    #
     # Determine if a struct has an NDO as a member or an embedded member
     def struct_contains_ndo(self, struct_item):
-        struct_member_dict = dict(self.structMembers)
-        struct_members = struct_member_dict[struct_item]
-
-        for member in struct_members:
-            if self.isHandleTypeNonDispatchable(member.type):
-                return True
-            elif member.type in struct_member_dict:
-                if self.struct_contains_ndo(member.type) == True:
-                    return True
-        return False
+        return GetRegistryIndex(self.registry).structContainsNonDispatchableHandle(struct_item)
     #
     # Return list of struct members which contain, or which sub-structures contain
     # an NDO in a given list of parameters or members
@@ -476,22 +452,23 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
     #
     # Generate pNext handling function
     def build_extension_processing_func(self):
-        # Construct helper functions to build and free pNext extension chains
+        # Construct helper function to build unwrapped pNext extension chains. The chain is allocated from the calling
+        # wrapper's arena and freed along with it.
         pnext_proc = ''
-        pnext_proc += 'void *CreateUnwrappedExtensionStructs(const void *pNext) {\n'
+        pnext_proc += 'void *CreateUnwrappedExtensionStructs(SafeStructArena &arena, const void *pNext) {\n'
         pnext_proc += '    void *cur_pnext = const_cast<void *>(pNext);\n'
         pnext_proc += '    void *head_pnext = NULL;\n'
-        pnext_proc += '    void *prev_ext_struct = NULL;\n'
-        pnext_proc += '    void *cur_ext_struct = NULL;\n\n'
+        pnext_proc += '    void *prev_ext_struct = NULL;\n\n'
         pnext_proc += '    while (cur_pnext != NULL) {\n'
-        pnext_proc += '        GenericHeader *header = reinterpret_cast<GenericHeader *>(cur_pnext);\n\n'
+        pnext_proc += '        GenericHeader *header = reinterpret_cast<GenericHeader *>(cur_pnext);\n'
+        pnext_proc += '        void *cur_ext_struct = NULL;\n\n'
         pnext_proc += '        switch (header->sType) {\n'
         for item in self.extension_structs:
             struct_info = self.struct_member_dict[item]
             if struct_info[0].feature_protect is not None:
                 pnext_proc += '#ifdef %s \n' % struct_info[0].feature_protect
             pnext_proc += '            case %s: {\n' % self.structTypes[item].value
-            pnext_proc += '                    safe_%s *safe_struct = new safe_%s;\n' % (item, item)
+            pnext_proc += '                    safe_%s *safe_struct = arena.New<safe_%s>();\n' % (item, item)
             pnext_proc += '                    safe_struct->initialize(reinterpret_cast<const %s *>(cur_pnext));\n' % item
             # Generate code to unwrap the handles
             indent = '                '
@@ -505,39 +482,19 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
         pnext_proc += '            default:\n'
         pnext_proc += '                break;\n'
         pnext_proc += '        }\n\n'
-        pnext_proc += '        // Save pointer to the first structure in the pNext chain\n'
-        pnext_proc += '        head_pnext = (head_pnext ? head_pnext : cur_ext_struct);\n\n'
-        pnext_proc += '        // For any extension structure but the first, link the last struct\'s pNext to the current ext struct\n'
-        pnext_proc += '        if (prev_ext_struct) {\n'
-        pnext_proc += '            (reinterpret_cast<GenericHeader *>(prev_ext_struct))->pNext = cur_ext_struct;\n'
-        pnext_proc += '        }\n'
-        pnext_proc += '        prev_ext_struct = cur_ext_struct;\n\n'
+        pnext_proc += '        // Link the copy to the end of the unwrapped chain, skipping structures not known to need unwrapping\n'
+        pnext_proc += '        if (cur_ext_struct) {\n'
+        pnext_proc += '            if (prev_ext_struct) {\n'
+        pnext_proc += '                (reinterpret_cast<GenericHeader *>(prev_ext_struct))->pNext = cur_ext_struct;\n'
+        pnext_proc += '            } else {\n'
+        pnext_proc += '                head_pnext = cur_ext_struct;\n'
+        pnext_proc += '            }\n'
+        pnext_proc += '            prev_ext_struct = cur_ext_struct;\n'
+        pnext_proc += '        }\n\n'
         pnext_proc += '        // Process the next structure in the chain\n'
         pnext_proc += '        cur_pnext = const_cast<void *>(header->pNext);\n'
         pnext_proc += '    }\n'
         pnext_proc += '    return head_pnext;\n'
-        pnext_proc += '}\n\n'
-        pnext_proc += '// Free a pNext extension chain\n'
-        pnext_proc += 'void FreeUnwrappedExtensionStructs(void *head) {\n'
-        pnext_proc += '    GenericHeader *curr_ptr = reinterpret_cast<GenericHeader *>(head);\n'
-        pnext_proc += '    while (curr_ptr) {\n'
-        pnext_proc += '        GenericHeader *header = curr_ptr;\n'
-        pnext_proc += '        curr_ptr = reinterpret_cast<GenericHeader *>(header->pNext);\n\n'
-        pnext_proc += '        switch (header->sType) {\n';
-        for item in self.extension_structs:
-            struct_info = self.struct_member_dict[item]
-            if struct_info[0].feature_protect is not None:
-                pnext_proc += '#ifdef %s \n' % struct_info[0].feature_protect
-            pnext_proc += '            case %s:\n' % self.structTypes[item].value
-            pnext_proc += '                delete reinterpret_cast<safe_%s *>(header);\n' % item
-            pnext_proc += '                break;\n'
-            if struct_info[0].feature_protect is not None:
-                pnext_proc += '#endif // %s \n' % struct_info[0].feature_protect
-            pnext_proc += '\n'
-        pnext_proc += '            default:\n'
-        pnext_proc += '                assert(0);\n'
-        pnext_proc += '        }\n'
-        pnext_proc += '    }\n'
         pnext_proc += '}\n'
         return pnext_proc
 
@@ -554,7 +511,6 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
             handle_name = params[-1].find('name')
             create_ndo_code += '%sif (VK_SUCCESS == result) {\n' % (indent)
             indent = self.incIndent(indent)
-            create_ndo_code += '%sstd::lock_guard<std::mutex> lock(global_lock);\n' % (indent)
             ndo_dest = '*%s' % handle_name.text
             if ndo_array == True:
                 create_ndo_code += '%sfor (uint32_t index0 = 0; index0 < %s; index0++) {\n' % (indent, cmd_info[-1].len)
@@ -584,7 +540,6 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                     # This API is freeing an array of handles.  Remove them from the unique_id map.
                     destroy_ndo_code += '%sif ((VK_SUCCESS == result) && (%s)) {\n' % (indent, cmd_info[param].name)
                     indent = self.incIndent(indent)
-                    destroy_ndo_code += '%sstd::unique_lock<std::mutex> lock(global_lock);\n' % (indent)
                     destroy_ndo_code += '%sfor (uint32_t index0 = 0; index0 < %s; index0++) {\n' % (indent, cmd_info[param].len)
                     indent = self.incIndent(indent)
                     destroy_ndo_code += '%s%s handle = %s[index0];\n' % (indent, cmd_info[param].type, cmd_info[param].name)
@@ -596,30 +551,11 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                     destroy_ndo_code += '%s}\n' % indent
                 else:
                     # Remove a single handle from the map
-                    destroy_ndo_code += '%sstd::unique_lock<std::mutex> lock(global_lock);\n' % (indent)
                     destroy_ndo_code += '%suint64_t %s_id = reinterpret_cast<uint64_t &>(%s);\n' % (indent, cmd_info[param].name, cmd_info[param].name)
-                    destroy_ndo_code += '%s%s = (%s)unique_id_mapping[%s_id];\n' % (indent, cmd_info[param].name, cmd_info[param].type, cmd_info[param].name)
-                    destroy_ndo_code += '%sunique_id_mapping.erase(%s_id);\n' % (indent, cmd_info[param].name)
-                    destroy_ndo_code += '%slock.unlock();\n' % (indent)
+                    destroy_ndo_code += '%s%s = (%s)unique_id_mapping.pop(%s_id);\n' % (indent, cmd_info[param].name, cmd_info[param].type, cmd_info[param].name)
         return ndo_array, destroy_ndo_code
 
     #
-    # Clean up local declarations
-    def cleanUpLocalDeclarations(self, indent, prefix, name, len, index, process_pnext):
-        cleanup = '%sif (local_%s%s) {\n' % (indent, prefix, name)
-        if len is not None:
-            if process_pnext:
-                cleanup += '%s    for (uint32_t %s = 0; %s < %s%s; ++%s) {\n' % (indent, index, index, prefix, len, index)
-                cleanup += '%s        FreeUnwrappedExtensionStructs(const_cast<void *>(local_%s%s[%s].pNext));\n' % (indent, prefix, name, index)
-                cleanup += '%s    }\n' % indent
-            cleanup += '%s    delete[] local_%s%s;\n' % (indent, prefix, name)
-        else:
-            if process_pnext:
-                cleanup += '%s    FreeUnwrappedExtensionStructs(const_cast<void *>(local_%s%s->pNext));\n' % (indent, prefix, name)
-            cleanup += '%s    delete local_%s%s;\n' % (indent, prefix, name)
-        cleanup += "%s}\n" % (indent)
-        return cleanup
-    #
     # Output UO code for a single NDO (ndo_count is NULL) or a counted list of NDOs
     def outputNDOs(self, ndo_type, ndo_name, ndo_count, prefix, index, indent, destroy_func, destroy_array, top_level):
         decl_code = ''
@@ -627,11 +563,12 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
         post_call_code = ''
         if ndo_count is not None:
             if top_level == True:
+                decl_code += '%sLocalArray<%s> var_local_%s%s;\n' % (indent, ndo_type, prefix, ndo_name)
                 decl_code += '%s%s *local_%s%s = NULL;\n' % (indent, ndo_type, prefix, ndo_name)
             pre_call_code += '%s    if (%s%s) {\n' % (indent, prefix, ndo_name)
             indent = self.incIndent(indent)
             if top_level == True:
-                pre_call_code += '%s    local_%s%s = new %s[%s];\n' % (indent, prefix, ndo_name, ndo_type, ndo_count)
+                pre_call_code += '%s    local_%s%s = var_local_%s%s.allocate(%s);\n' % (indent, prefix, ndo_name, prefix, ndo_name, ndo_count)
                 pre_call_code += '%s    for (uint32_t %s = 0; %s < %s; ++%s) {\n' % (indent, index, index, ndo_count, index)
                 indent = self.incIndent(indent)
                 pre_call_code += '%s    local_%s%s[%s] = Unwrap(%s[%s]);\n' % (indent, prefix, ndo_name, index, ndo_name, index)
@@ -643,10 +580,6 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
             pre_call_code += '%s    }\n' % indent
             indent = self.decIndent(indent)
             pre_call_code += '%s    }\n' % indent
-            if top_level == True:
-                post_call_code += '%sif (local_%s%s)\n' % (indent, prefix, ndo_name)
-                indent = self.incIndent(indent)
-                post_call_code += '%sdelete[] local_%s;\n' % (indent, ndo_name)
         else:
             if top_level == True:
                 if (destroy_func == False) or (destroy_array == True):
@@ -698,19 +631,21 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                         if first_level_param == True:
                             new_prefix = 'local_%s' % member.name
                             # Declare safe_VarType for struct
+                            decls += '%sLocalArray<safe_%s> var_%s;\n' % (indent, member.type, new_prefix)
                             decls += '%ssafe_%s *%s = NULL;\n' % (indent, member.type, new_prefix)
                         else:
                             new_prefix = '%s%s' % (prefix, member.name)
                         pre_code += '%s    if (%s%s) {\n' % (indent, prefix, member.name)
                         indent = self.incIndent(indent)
                         if first_level_param == True:
-                            pre_code += '%s    %s = new safe_%s[%s];\n' % (indent, new_prefix, member.type, member.len)
+                            pre_code += '%s    %s = var_%s.allocate(%s);\n' % (indent, new_prefix, new_prefix, member.len)
                         pre_code += '%s    for (uint32_t %s = 0; %s < %s%s; ++%s) {\n' % (indent, index, index, prefix, member.len, index)
                         indent = self.incIndent(indent)
                         if first_level_param == True:
                             pre_code += '%s    %s[%s].initialize(&%s[%s]);\n' % (indent, new_prefix, index, member.name, index)
                             if process_pnext:
-                                pre_code += '%s    %s[%s].pNext = CreateUnwrappedExtensionStructs(%s[%s].pNext);\n' % (indent, new_prefix, index, new_prefix, index)
+                                pre_code += '%s    %s[%s].pNext = CreateUnwrappedExtensionStructs(arena, %s[%s].pNext);\n' % (indent, new_prefix, index, new_prefix, index)
+                                self.uses_safe_struct_arena = True
                         local_prefix = '%s[%s].' % (new_prefix, index)
                         # Process sub-structs in this struct
                         (tmp_decl, tmp_pre, tmp_post) = self.uniquify_members(struct_info, indent, local_prefix, array_index, create_func, destroy_func, destroy_array, False)
@@ -721,8 +656,6 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                         pre_code += '%s    }\n' % indent
                         indent = self.decIndent(indent)
                         pre_code += '%s    }\n' % indent
-                        if first_level_param == True:
-                            post_code += self.cleanUpLocalDeclarations(indent, prefix, member.name, member.len, index, process_pnext)
                     # Single Struct
                     else:
                         # Update struct prefix
@@ -735,18 +668,17 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                         pre_code += '%s    if (%s%s) {\n' % (indent, prefix, member.name)
                         indent = self.incIndent(indent)
                         if first_level_param == True:
-                            pre_code += '%s    local_%s%s = new safe_%s(%s);\n' % (indent, prefix, member.name, member.type, member.name)
+                            pre_code += '%s    local_%s%s = arena.New<safe_%s>(%s);\n' % (indent, prefix, member.name, member.type, member.name)
+                            self.uses_safe_struct_arena = True
                         # Process sub-structs in this struct
                         (tmp_decl, tmp_pre, tmp_post) = self.uniquify_members(struct_info, indent, new_prefix, array_index, create_func, destroy_func, destroy_array, False)
                         decls += tmp_decl
                         pre_code += tmp_pre
                         post_code += tmp_post
                         if process_pnext:
-                            pre_code += '%s    local_%s%s->pNext = CreateUnwrappedExtensionStructs(local_%s%s->pNext);\n' % (indent, prefix, member.name, prefix, member.name)
+                            pre_code += '%s    local_%s%s->pNext = CreateUnwrappedExtensionStructs(arena, local_%s%s->pNext);\n' % (indent, prefix, member.name, prefix, member.name)
                         indent = self.decIndent(indent)
                         pre_code += '%s    }\n' % indent
-                        if first_level_param == True:
-                            post_code += self.cleanUpLocalDeclarations(indent, prefix, member.name, member.len, index, process_pnext)
         return decls, pre_code, post_code
     #
     # For a particular API, generate the non-dispatchable-object wrapping/unwrapping code
@@ -774,16 +706,17 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
             param_post_code = ''
             create_func = True if create_ndo_code else False
             destroy_func = True if destroy_ndo_code else False
+            self.uses_safe_struct_arena = False
             (paramdecl, param_pre_code, param_post_code) = self.uniquify_members(cmd_info, indent, '', 0, create_func, destroy_func, destroy_array, True)
+            if self.uses_safe_struct_arena:
+                # Declared ahead of the locals pointing into it, so that it outlives them
+                paramdecl = '%sSafeStructArena arena;\n%s' % (indent, paramdecl)
             param_post_code += create_ndo_code
             if destroy_ndo_code:
                 if destroy_array == True:
                     param_post_code += destroy_ndo_code
                 else:
                     param_pre_code += destroy_ndo_code
-            if param_pre_code:
-                if (not destroy_func) or (destroy_array):
-                    param_pre_code = '%s{\n%s%s%s%s}\n' % ('    ', indent, self.lock_guard(indent), param_pre_code, indent)
         return paramdecl, param_pre_code, param_post_code
     #
     # Capture command parameter info needed to wrap NDOs as well as handling some boilerplate code
@@ -798,7 +731,7 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
             len = self.getLen(member)
             if len:
                 lens.add(len)
-        struct_member_dict = dict(self.structMembers)
+        struct_member_dict = self.struct_member_dict
         # Generate member info
         membersInfo = []
         constains_extension_structs = False
@@ -857,7 +790,7 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
                 self.appendSection('command', '')
                 self.appendSection('command', '// Declare only')
                 self.appendSection('command', decls[0])
-                self.intercepts += [ '    {"%s", (void *)%s},' % (cmdname,cmdname[2:]) ]
+                self.intercepts += [ (cmdname, cmdname[2:], None) ]
                 continue
             # Generate NDO wrapping/unwrapping code for all parameters
             (api_decls, api_pre, api_post) = self.generate_wrapping_code(cmdinfo.elem)
@@ -868,9 +801,8 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
             if (feature_extra_protect != None):
                 self.appendSection('command', '')
                 self.appendSection('command', '#ifdef '+ feature_extra_protect)
-                self.intercepts += [ '#ifdef %s' % feature_extra_protect ]
             # Add intercept to procmap
-            self.intercepts += [ '    {"%s", (void*)%s},' % (cmdname,cmdname[2:]) ]
+            self.intercepts += [ (cmdname, cmdname[2:], feature_extra_protect) ]
             decls = self.makeCDecls(cmdinfo.elem)
             self.appendSection('command', '')
             self.appendSection('command', decls[0][:-1])
@@ -921,4 +853,3 @@ class UniqueObjectsOutputGenerator(OutputGenerator):
             self.appendSection('command', '}')
             if (feature_extra_protect != None):
                 self.appendSection('command', '#endif // '+ feature_extra_protect)
-                self.intercepts += [ '#endif' ]
@@ -0,0 +1,184 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2015-2018 The Khronos Group Inc.
+# Copyright (c) 2015-2018 Valve Corporation
+# Copyright (c) 2015-2018 LunarG, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib, json, os, pickle, re, sys, tempfile
+
+# Directory to keep index files in, e.g. the registry cache directory of lvl_genvk.py. If None, validusage.json is
+# always scanned and no index files are read or written.
+indexDirectory = None
+
+whitespace = re.compile(r'[ \t\n\r]*')
+decoder = json.JSONDecoder()
+
+#
+# Scanner for the text of validusage.json, whose valid usage statements are held in
+#   "validation": { <api>: { <core|extension>: [ { "vuid": <vuid>, "text": <text> }, ... ] } }
+# Objects and arrays are walked member by member, decoding only the strings found in them and so never building the
+# document in memory. Each scan function returns the position just past the value it scanned.
+def skipWhitespace(text, pos):
+    return whitespace.match(text, pos).end()
+
+def expect(text, pos, char):
+    if not text.startswith(char, pos):
+        raise ValueError("Expecting '%s' at offset %d of validusage.json" % (char, pos))
+    return skipWhitespace(text, pos + 1)
+
+# Scan the object at pos, calling scanMember(key, pos) for the value of each member
+def scanObject(text, pos, scanMember):
+    pos = expect(text, pos, '{')
+    if text.startswith('}', pos):
+        return pos + 1
+    while True:
+        (key, pos) = decoder.raw_decode(text, pos)
+        pos = expect(text, skipWhitespace(text, pos), ':')
+        pos = skipWhitespace(text, scanMember(key, pos))
+        if text.startswith('}', pos):
+            return pos + 1
+        pos = expect(text, pos, ',')
+
+# Scan the array at pos, calling scanElement(pos) for each element
+def scanArray(text, pos, scanElement):
+    pos = expect(text, pos, '[')
+    if text.startswith(']', pos):
+        return pos + 1
+    while True:
+        pos = skipWhitespace(text, scanElement(pos))
+        if text.startswith(']', pos):
+            return pos + 1
+        pos = expect(text, pos, ',')
+
+#
+# Return a list of (api, ext, vuid, start, end) tuples, one for each valid usage statement in text in document order,
+# where text[start:end] is the JSON string holding the statement's text
+def indexValidUsage(text):
+    entries = []
+    def scanStatement(api, ext, pos):
+        fields = {}
+        def scanField(key, pos):
+            (value, end) = decoder.raw_decode(text, pos)
+            fields[key] = (value, pos, end)
+            return end
+        end = scanObject(text, pos, scanField)
+        if 'vuid' in fields:
+            (start, stop) = fields['text'][1:] if 'text' in fields else (pos, pos)
+            entries.append((api, ext, fields['vuid'][0], start, stop))
+        return end
+    def scanMember(key, pos):
+        if key != 'validation':
+            return decoder.raw_decode(text, pos)[1]
+        return scanObject(text, pos, lambda api, pos:
+                          scanObject(text, pos, lambda ext, pos:
+                                     scanArray(text, pos, lambda pos: scanStatement(api, ext, pos))))
+    scanObject(text, skipWhitespace(text, 0), scanMember)
+    return entries
+
+#
+# The valid usage statements of a validusage.json file. vuids is the set of every VUID string; statements() yields
+# (api, ext, vuid, text) for each statement, decoding the text only when asked for.
+class ValidUsage:
+    def __init__(self, entries, content):
+        self.entries = entries
+        self.content = content         # Text of the file, as bytes until statements() first needs it decoded
+        self.vuids = set(entry[2] for entry in entries)
+    #
+    # Yield (api, ext, vuid, text) for each valid usage statement, in document order
+    def statements(self):
+        if isinstance(self.content, bytes):
+            self.content = self.content.decode('utf-8')
+        for (api, ext, vuid, start, end) in self.entries:
+            yield (api, ext, vuid, json.loads(self.content[start:end]) if end > start else '')
+
+#
+# Return the index file for a validusage.json file with the given content. It is kept in indexDirectory and named after
+# the location of the file, which indexPrefix() returns, and after the content of both the file and this script, so an
+# index is never reused once either of them changes.
+def indexFile(filename, content):
+    digest = hashlib.sha256(content)
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest.update(f.read())
+    return os.path.join(indexDirectory, indexPrefix(filename) + digest.hexdigest()[:16] + '.index')
+
+# Return the prefix shared by the names of all index files of a validusage.json file
+def indexPrefix(filename):
+    return 'validusage.' + hashlib.sha256(os.path.abspath(filename).encode('utf-8')).hexdigest()[:16] + '.'
+
+# Load the index stored by writeIndex(), or return None if there is no usable index file
+def readIndex(index_file):
+    if not os.path.isfile(index_file):
+        return None
+    try:
+        with open(index_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        print('* Ignoring unreadable valid usage index %s (%s)' % (index_file, e), file=sys.stderr)
+        return None
+
+# Store an index for later invocations. The file is written under a temporary name and then renamed, so concurrent
+# builds never see a partially written file. Failing to write the index is not fatal. Once the new index is in place,
+# the outdated ones starting with prefix are removed.
+def writeIndex(index_file, prefix, entries):
+    index_directory = os.path.dirname(index_file)
+    try:
+        if not os.path.isdir(index_directory):
+            os.makedirs(index_directory)
+        (fd, temp_file) = tempfile.mkstemp(dir=index_directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entries, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, index_file)
+        except:
+            os.remove(temp_file)
+            raise
+    except Exception as e:
+        print('* Unable to write valid usage index %s (%s)' % (index_file, e), file=sys.stderr)
+        return
+    for name in os.listdir(index_directory):
+        if name.startswith(prefix) and name.endswith('.index') and name != os.path.basename(index_file):
+            try:
+                os.remove(os.path.join(index_directory, name))
+            except OSError:
+                pass
+
+# Loaded files, shared by every generator run in this process
+loaded = {}
+
+#
+# Return the ValidUsage of a validusage.json file, or None if it does not exist. The file is only scanned if no index
+# of its current content has been stored in indexDirectory yet.
+def LoadValidUsage(filename):
+    filename = os.path.abspath(filename)
+    if filename in loaded:
+        return loaded[filename]
+    if not os.path.isfile(filename):
+        return None
+    with open(filename, 'rb') as f:
+        content = f.read()
+    index_file = indexFile(filename, content) if indexDirectory else None
+    entries = readIndex(index_file) if index_file else None
+    if entries is None:
+        content = content.decode('utf-8')
+        entries = indexValidUsage(content)
+        if index_file:
+            writeIndex(index_file, indexPrefix(filename), entries)
+    loaded[filename] = ValidUsage(entries, content)
+    return loaded[filename]
+
+#
+# Return the ValidUsage of validusage.json content that is not in a file, e.g. downloaded from the registry
+def ParseValidUsage(text):
+    return ValidUsage(indexValidUsage(text), text)
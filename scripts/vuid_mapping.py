@@ -6,7 +6,8 @@ try:
     import urllib.request as urllib2
 except ImportError:
     import urllib2
-import json
+from valid_usage import LoadValidUsage
+from collections import namedtuple
 
 #############################
 # vuid_mapping.py script
@@ -1171,71 +1172,187 @@ implicit_param_map = {
 
 uniqueid_set = set() # store uniqueid to make sure we don't have duplicates
 
-# Convert a string VUID into numerical value
-#  See "VUID Mapping Details" comment above for more info
-def convertVUID(vuid_string):
-    """Convert a string-based VUID into a numerical value"""
-    #func_struct_update = False
-    #imp_param_update = False
-    if vuid_string in ['', None]:
-        return -1
-    vuid_parts = vuid_string.split('-')
+# A VUID string or numerical VUID that cannot be mapped. value is the VUID string or number, kind is what has no mapping
+# ('func_struct', 'implicit_type', 'implicit_param', or 'format' for a value that is not a VUID at all) and name is the
+# unmapped name or number
+VUIDError = namedtuple('VUIDError', ['value', 'kind', 'name'])
+# The fields encoded in a numerical VUID. func_struct has any KHR/KHX suffix removed. param is None for explicit VUs and
+# for implicit VUs without a parameter (an implicit VU on parameter 'a' decodes the same way), implicit_type is None for
+# explicit VUs and explicit_id is None for implicit VUs.
+VUIDFields = namedtuple('VUIDFields', ['func_struct', 'param', 'implicit_type', 'explicit_id'])
+
+# The mapped ids of the fields of a string VUID. implicit_param and implicit_type are None for explicit VUs and
+# explicit_id is None for implicit VUs.
+VUIDIds = namedtuple('VUIDIds', ['func_struct', 'implicit_param', 'implicit_type', 'explicit_id'])
+# Width in bits of each field of a numerical VUID, see "VUID Mapping Details" comment above
+vuid_field_bits = {
+'func_struct'    : 32 - FUNC_STRUCT_SHIFT,
+'implicit_param' : FUNC_STRUCT_SHIFT - IMPLICIT_PARAM_SHIFT,
+'implicit_type'  : IMPLICIT_PARAM_SHIFT - IMPLICIT_TYPE_SHIFT,
+'explicit_id'    : FUNC_STRUCT_SHIFT - EXPLICIT_ID_SHIFT,
+}
+
+# Split a string VUID into its VUIDIds, returning a VUIDError if it cannot be mapped
+def splitVUID(vuid_string):
+    vuid_parts = vuid_string.split('-') if vuid_string else []
+    if len(vuid_parts) < 3:
+        return VUIDError(vuid_string, 'format', vuid_string)
     # Alias core/KHR/KHX ids because not all VUIDs in the spec get updated at the same time
     if vuid_parts[1].endswith('KHR') or vuid_parts[1].endswith('KHX'):
         vuid_parts[1] = vuid_parts[1][:-3]
     if vuid_parts[1] not in func_struct_id_map:
-        print ("ERROR: Missing func/struct map value for '%s'!" % (vuid_parts[1]))
-        print (" TODO: Need to add mapping for this to end of func_struct_id_map")
-        print ("   replace '### ADD New func/struct mappings above this line' line with \"'%s' : %d,\"" % (vuid_parts[1], len(func_struct_id_map)))
-        func_struct_id_map[vuid_parts[1]] = len(func_struct_id_map)
-        #func_struct_update = True
-        sys.exit(1)
-    uniqueid = func_struct_id_map[vuid_parts[1]] << FUNC_STRUCT_SHIFT
+        return VUIDError(vuid_string, 'func_struct', vuid_parts[1])
+    func_struct_id = func_struct_id_map[vuid_parts[1]]
     if vuid_parts[-1].isdigit(): # explit VUID has int on the end
-        explicit_id = int(vuid_parts[-1])
+        return VUIDIds(func_struct_id, None, None, int(vuid_parts[-1]))
+    # Implicit case
+    if vuid_parts[-1] not in implicit_type_map:
+        return VUIDError(vuid_string, 'implicit_type', vuid_parts[-1])
+    param_id = 0 # Default when no param is available
+    if vuid_parts[-2] != vuid_parts[1]: # we have a parameter
+        if vuid_parts[-2] not in implicit_param_map:
+            return VUIDError(vuid_string, 'implicit_param', vuid_parts[-2])
+        param_id = implicit_param_map[vuid_parts[-2]]
+    return VUIDIds(func_struct_id, param_id, implicit_type_map[vuid_parts[-1]], None)
+
+# Combine VUIDIds into a numerical VUID
+def packVUID(ids):
+    uniqueid = ids.func_struct << FUNC_STRUCT_SHIFT
+    if ids.explicit_id is not None:
         # For explicit case, id is explicit_base + func/struct mapping + unique id
-        uniqueid = uniqueid + (explicit_id << EXPLICIT_ID_SHIFT) + explicit_bit0
-    else: # implicit case
-        if vuid_parts[-1] not in implicit_type_map:
-            print("ERROR: Missing mapping for implicit type '%s'!\nTODO: Please add new mapping." % (vuid_parts[-1]))
-            sys.exit(1)
-        else:
-            param_id = 0 # Default when no param is available
-            if vuid_parts[-2] != vuid_parts[1]: # we have a parameter
-                if vuid_parts[-2] in implicit_param_map:
-                    param_id = implicit_param_map[vuid_parts[-2]]
-                else:
-                    print ("ERROR: Missing param '%s' from implicit_param_map\n TODO: Please add new mapping." % (vuid_parts[-2]))
-                    print ("   replace '### ADD New implicit param mappings above this line' line with \"'%s' : %d,\"" % (vuid_parts[-2], len(implicit_param_map)))
-                    implicit_param_map[vuid_parts[-2]] = len(implicit_param_map)
-                    #imp_param_update = True
-                    sys.exit(1)
-                uniqueid = uniqueid + (param_id << IMPLICIT_PARAM_SHIFT) + (implicit_type_map[vuid_parts[-1]] << IMPLICIT_TYPE_SHIFT) + implicit_bit0
-            else: # No parameter so that field is 0
-                uniqueid = uniqueid + (implicit_type_map[vuid_parts[-1]] << IMPLICIT_TYPE_SHIFT) + implicit_bit0
-#    if uniqueid in uniqueid_set:
-#        print ("ERROR: Uniqueid %d for string id %s is a duplicate!" % (uniqueid, vuid_string))
-#        print (" TODO: Figure out what caused the dupe and fix it")
-        #sys.exit()
-    # print ("Storing uniqueid %d for unique string %s" % (uniqueid, vuid_string))
-    uniqueid_set.add(uniqueid)
-#    if func_struct_update:
-#        print ("func_struct_id_map updated, here's new structure")
-#        print ("func_struct_id_map = {")
-#        fs_id = 0
-#        for fs in sorted(func_struct_id_map):
-#            print ("'%s' : %d," % (fs, fs_id))
-#            fs_id = fs_id + 1
-#        print ("### ADD New func/struct mappings above this line")
-#        print ("}")
-#    if imp_param_update:
-#        print ("implicit_param_map updated, here's new structure")
-#        print ("implicit_param_map = {")
-#        ip_id = 0
-#        for ip in sorted(implicit_param_map):
-#            print ("'%s' : %d," % (ip, ip_id))
-#            ip_id = ip_id + 1
-#        print ("### ADD New implicit param mappings above this line")
-#        print ("}")
+        return uniqueid + (ids.explicit_id << EXPLICIT_ID_SHIFT) + explicit_bit0
+    return uniqueid + (ids.implicit_param << IMPLICIT_PARAM_SHIFT) + (ids.implicit_type << IMPLICIT_TYPE_SHIFT) + implicit_bit0
+
+# Map a string VUID into its numerical value, returning a VUIDError if it cannot be mapped
+#  See "VUID Mapping Details" comment above for more info
+def mapVUID(vuid_string):
+    if vuid_string in ['', None]:
+        return -1
+    ids = splitVUID(vuid_string)
+    if isinstance(ids, VUIDError):
+        return ids
+    return packVUID(ids)
 
+# Convert a string VUID into numerical value, exiting with instructions for updating the mappings if it cannot be mapped
+#  See "VUID Mapping Details" comment above for more info
+def convertVUID(vuid_string):
+    """Convert a string-based VUID into a numerical value"""
+    uniqueid = mapVUID(vuid_string)
+    if isinstance(uniqueid, VUIDError):
+        if uniqueid.kind == 'func_struct':
+            print ("ERROR: Missing func/struct map value for '%s'!" % (uniqueid.name))
+            print (" TODO: Need to add mapping for this to end of func_struct_id_map")
+            print ("   replace '### ADD New func/struct mappings above this line' line with \"'%s' : %d,\"" % (uniqueid.name, len(func_struct_id_map)))
+        elif uniqueid.kind == 'implicit_type':
+            print("ERROR: Missing mapping for implicit type '%s'!\nTODO: Please add new mapping." % (uniqueid.name))
+        elif uniqueid.kind == 'implicit_param':
+            print ("ERROR: Missing param '%s' from implicit_param_map\n TODO: Please add new mapping." % (uniqueid.name))
+            print ("   replace '### ADD New implicit param mappings above this line' line with \"'%s' : %d,\"" % (uniqueid.name, len(implicit_param_map)))
+        else:
+            print ("ERROR: '%s' is not a VUID string!" % (uniqueid.name))
+        sys.exit(1)
+    if uniqueid != -1:
+        uniqueid_set.add(uniqueid)
     return uniqueid
+
+# Map many string VUIDs at once, returning a list of numerical values or VUIDErrors in the same order
+def convertVUIDs(vuid_strings):
+    results = {}
+    for vuid_string in vuid_strings:
+        if vuid_string not in results:
+            results[vuid_string] = mapVUID(vuid_string)
+    return [results[vuid_string] for vuid_string in vuid_strings]
+
+# Inverses of func_struct_id_map, implicit_type_map and implicit_param_map, built on first use
+inverse_maps = None
+
+def getInverseMaps():
+    global inverse_maps
+    if inverse_maps is None:
+        inverse_maps = tuple(dict((value, name) for (name, value) in id_map.items())
+                             for id_map in [func_struct_id_map, implicit_type_map, implicit_param_map])
+    return inverse_maps
+
+# Decode a numerical VUID into its VUIDFields, returning a VUIDError if it does not decode
+def decodeVUID(uniqueid):
+    if not isinstance(uniqueid, int) or uniqueid < 0 or uniqueid >= (1 << 32):
+        return VUIDError(uniqueid, 'format', uniqueid)
+    (func_struct_names, implicit_type_names, implicit_param_names) = getInverseMaps()
+    func_struct_id = uniqueid >> FUNC_STRUCT_SHIFT
+    if func_struct_id not in func_struct_names:
+        return VUIDError(uniqueid, 'func_struct', func_struct_id)
+    func_struct = func_struct_names[func_struct_id]
+    fields = uniqueid & ((1 << FUNC_STRUCT_SHIFT) - 1)
+    if (uniqueid & 0x1) == explicit_bit0:
+        return VUIDFields(func_struct, None, None, fields >> EXPLICIT_ID_SHIFT)
+    implicit_type_id = (fields >> IMPLICIT_TYPE_SHIFT) & ((1 << (IMPLICIT_PARAM_SHIFT - IMPLICIT_TYPE_SHIFT)) - 1)
+    if implicit_type_id not in implicit_type_names:
+        return VUIDError(uniqueid, 'implicit_type', implicit_type_id)
+    param_id = fields >> IMPLICIT_PARAM_SHIFT
+    param = None
+    if param_id != 0:
+        if param_id not in implicit_param_names:
+            return VUIDError(uniqueid, 'implicit_param', param_id)
+        param = implicit_param_names[param_id]
+    return VUIDFields(func_struct, param, implicit_type_names[implicit_type_id], None)
+
+# Decode many numerical VUIDs at once, returning a list of VUIDFields or VUIDErrors in the same order
+def decodeVUIDs(uniqueids):
+    results = {}
+    for uniqueid in uniqueids:
+        if uniqueid not in results:
+            results[uniqueid] = decodeVUID(uniqueid)
+    return [results[uniqueid] for uniqueid in uniqueids]
+
+# Problems found by checkVUIDs(). uniqueid is the 32-bit numerical VUID that vuid maps to. A VUIDCollision names
+# another string VUID mapping to the same number, a VUIDOverflow the field whose id does not fit in its bits.
+VUIDCollision = namedtuple('VUIDCollision', ['uniqueid', 'vuid', 'other_vuid'])
+VUIDOverflow = namedtuple('VUIDOverflow', ['uniqueid', 'vuid', 'field', 'value'])
+
+# Check a set of string VUIDs in a single pass, returning every VUIDError, VUIDOverflow and VUIDCollision found, in
+# input order. Repeats of the same string are not collisions; distinct strings made equal by KHR/KHX aliasing are.
+def checkVUIDs(vuid_strings):
+    problems = []
+    vuids_by_id = {}
+    for vuid_string in vuid_strings:
+        ids = splitVUID(vuid_string)
+        if isinstance(ids, VUIDError):
+            problems.append(ids)
+            continue
+        # Overflowing fields carry into the fields above them, and past bit 31 out of the number altogether
+        uniqueid = packVUID(ids) & 0xffffffff
+        for field in VUIDIds._fields:
+            value = getattr(ids, field)
+            if value is not None and value >= (1 << vuid_field_bits[field]):
+                problems.append(VUIDOverflow(uniqueid, vuid_string, field, value))
+        other_vuid = vuids_by_id.setdefault(uniqueid, vuid_string)
+        if other_vuid != vuid_string:
+            problems.append(VUIDCollision(uniqueid, vuid_string, other_vuid))
+    return problems
+
+# Return a one-line description of a problem returned by checkVUIDs()
+def describeVUIDProblem(problem):
+    if isinstance(problem, VUIDCollision):
+        return "VUIDs '%s' and '%s' both map to 0x%08x" % (problem.vuid, problem.other_vuid, problem.uniqueid)
+    if isinstance(problem, VUIDOverflow):
+        return "VUID '%s' has a %s field of %d, which does not fit in %d bits (maps to 0x%08x)" % (
+            problem.vuid, problem.field, problem.value, vuid_field_bits[problem.field], problem.uniqueid)
+    if problem.kind == 'format':
+        return "'%s' is not a VUID string" % (problem.value)
+    return "VUID '%s' has no mapping for %s '%s'" % (problem.value, problem.kind, problem.name)
+
+# Check every VUID in a validusage.json file, printing each problem found
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print ("Usage: python vuid_mapping.py <validusage.json>")
+        sys.exit(1)
+    valid_usage = LoadValidUsage(sys.argv[1])
+    if valid_usage is None:
+        print ("Error: Could not find %s" % (sys.argv[1]))
+        sys.exit(1)
+    vuid_strings = [entry[2] for entry in sorted(valid_usage.entries, key=lambda entry: entry[0:2])]
+    problems = checkVUIDs(vuid_strings)
+    for problem in problems:
+        print ("ERROR: %s" % (describeVUIDProblem(problem)))
+    print ("Checked %d VUIDs, found %d problems" % (len(vuid_strings), len(problems)))
+    sys.exit(1 if problems else 0)
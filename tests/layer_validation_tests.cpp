@@ -16715,6 +16715,66 @@ TEST_F(VkLayerTest, ThreadCommandBufferCollision) {
 
     vkDestroyEvent(device(), event, NULL);
 }
+
+extern "C" void *CreateAndDestroyEvents(void *arg) {
+    struct thread_data_struct *data = (struct thread_data_struct *)arg;
+    VkEventCreateInfo event_info = {};
+    event_info.sType = VK_STRUCTURE_TYPE_EVENT_CREATE_INFO;
+
+    for (int i = 0; i < 20000; i++) {
+        VkEvent event;
+        if (vkCreateEvent(data->device, &event_info, NULL, &event) == VK_SUCCESS) {
+            vkDestroyEvent(data->device, event, NULL);
+        }
+        if (data->bailout) {
+            break;
+        }
+    }
+    return NULL;
+}
+
+TEST_F(VkPositiveLayerTest, ThreadCreateDestroyDifferentObjectTypes) {
+    TEST_DESCRIPTION("Create and destroy objects of different types from two threads at the same time.");
+    test_platform_thread thread;
+
+    ASSERT_NO_FATAL_FAILURE(Init());
+    m_errorMonitor->ExpectSuccess();
+
+    struct thread_data_struct data;
+    data.device = m_device->device();
+    data.bailout = false;
+    m_errorMonitor->SetBailout(&data.bailout);
+
+    VkSemaphoreCreateInfo semaphore_info = {};
+    semaphore_info.sType = VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO;
+    VkCommandBufferAllocateInfo command_buffer_info = {};
+    command_buffer_info.sType = VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO;
+    command_buffer_info.commandPool = m_commandPool->handle();
+    command_buffer_info.level = VK_COMMAND_BUFFER_LEVEL_PRIMARY;
+    command_buffer_info.commandBufferCount = 1;
+
+    // Create and destroy events from another thread while this thread creates and destroys semaphores and command
+    // buffers, so that the tracked objects of several types are added and removed concurrently.
+    test_platform_thread_create(&thread, CreateAndDestroyEvents, (void *)&data);
+    for (int i = 0; i < 20000; i++) {
+        VkSemaphore semaphore;
+        if (vkCreateSemaphore(m_device->device(), &semaphore_info, NULL, &semaphore) == VK_SUCCESS) {
+            vkDestroySemaphore(m_device->device(), semaphore, NULL);
+        }
+        VkCommandBuffer command_buffer;
+        if (vkAllocateCommandBuffers(m_device->device(), &command_buffer_info, &command_buffer) == VK_SUCCESS) {
+            vkFreeCommandBuffers(m_device->device(), m_commandPool->handle(), 1, &command_buffer);
+        }
+        if (data.bailout) {
+            break;
+        }
+    }
+    test_platform_thread_join(thread, NULL);
+
+    m_errorMonitor->SetBailout(NULL);
+
+    m_errorMonitor->VerifyNotFound();
+}
 #endif  // GTEST_IS_THREADSAFE
 
 TEST_F(VkLayerTest, InvalidSPIRVCodeSize) {